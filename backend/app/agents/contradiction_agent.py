@@ -3,9 +3,11 @@ Agent for detecting contradictions and overlaps between text passages.
 """
 from typing import List, Dict, Any
 from itertools import combinations
+import asyncio
 
 from app.agents.base_agent import BaseAgent, AgentResult
 from app.services.openai_service import OpenAIService
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +25,7 @@ class ContradictionAgent(BaseAgent):
         self,
         openai_service: OpenAIService,
         confidence_threshold: float = 0.6,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize contradiction detection agent.
@@ -30,9 +33,12 @@ class ContradictionAgent(BaseAgent):
         Args:
             openai_service: OpenAI service instance
             confidence_threshold: Minimum confidence to report a contradiction
+            max_concurrency: Maximum pair comparisons in flight at once
+                (defaults to settings.openai_concurrency)
         """
         super().__init__(openai_service)
         self.confidence_threshold = confidence_threshold
+        self.max_concurrency = max_concurrency or settings.openai_concurrency
 
     async def execute(
         self,
@@ -58,22 +64,36 @@ class ContradictionAgent(BaseAgent):
                     "total_comparisons": 0,
                 })
 
-            conflicts = []
-            total_comparisons = 0
+            # Compare all pairs of candidates concurrently
+            pairs = list(combinations(enumerate(candidates), 2))
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def compare(candidate_a, candidate_b, idx_a, idx_b):
+                async with semaphore:
+                    return await self.openai_service.detect_contradictions(
+                        text_a=candidate_a["content"],
+                        text_b=candidate_b["content"],
+                        source_a=candidate_a.get("source", f"Candidate {idx_a}"),
+                        source_b=candidate_b.get("source", f"Candidate {idx_b}"),
+                    )
+
+            results = await asyncio.gather(
+                *(
+                    compare(candidate_a, candidate_b, idx_a, idx_b)
+                    for (idx_a, candidate_a), (idx_b, candidate_b) in pairs
+                ),
+                return_exceptions=True,
+            )
 
-            # Compare all pairs of candidates
-            for (idx_a, candidate_a), (idx_b, candidate_b) in combinations(
-                enumerate(candidates), 2
-            ):
-                total_comparisons += 1
-
-                # Perform contradiction detection
-                result = await self.openai_service.detect_contradictions(
-                    text_a=candidate_a["content"],
-                    text_b=candidate_b["content"],
-                    source_a=candidate_a.get("source", f"Candidate {idx_a}"),
-                    source_b=candidate_b.get("source", f"Candidate {idx_b}"),
-                )
+            conflicts = []
+            total_comparisons = len(pairs)
+
+            for ((idx_a, candidate_a), (idx_b, candidate_b)), result in zip(pairs, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(
+                        f"Comparison of candidates {idx_a} and {idx_b} failed: {result}"
+                    )
+                    continue
 
                 # Check if contradiction meets threshold
                 if (
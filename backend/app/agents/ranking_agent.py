@@ -2,14 +2,94 @@
 Agent for ranking and prioritizing candidate passages.
 """
 from typing import List, Dict, Any
-import json
+from string import Template
 
 from app.agents.base_agent import BaseAgent, AgentResult
 from app.services.openai_service import OpenAIService
+from app.core.json import dumps as json_dumps, loads as json_loads
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Prompt scaffolding is built once at import time; requests only substitute
+# the variable parts.
+DEFAULT_RANKING_CRITERIA = (
+    "Relevance to section topic",
+    "Completeness of information",
+    "Clarity and readability",
+    "Technical accuracy",
+    "Safety information coverage",
+    "Recency of information",
+)
+
+RANKING_SYSTEM_MESSAGE = """You are an expert at evaluating technical documentation for
+lifting and rigging operations. Rank passages based on their relevance, quality,
+and suitability for inclusion in a consolidated procedure."""
+
+RANKING_PROMPT_TEMPLATE = Template("""Rank these candidate passages for the section: "$section_title"$requirements
+
+Ranking Criteria:
+$criteria
+
+Candidates:
+$candidates
+
+Return a JSON object with:
+{
+  "rankings": [
+    {
+      "index": 0,
+      "rank": 1,
+      "score": 0.0-1.0,
+      "relevance_score": 0.0-1.0,
+      "quality_score": 0.0-1.0,
+      "reasoning": "Brief explanation of ranking",
+      "strengths": ["strength 1", "strength 2"],
+      "weaknesses": ["weakness 1", "weakness 2"],
+      "recommendation": "include" | "consider" | "exclude"
+    }
+  ],
+  "overall_assessment": "Brief assessment of available candidates"
+}
+
+JSON response:""")
+
+COVERAGE_SYSTEM_MESSAGE = """You are an expert at analyzing technical documentation
+for completeness and coverage."""
+
+COVERAGE_PROMPT_TEMPLATE = Template("""Assess how well these candidates cover the required topics.
+
+Required Topics:
+$topics
+
+Candidate Passages:
+$passages
+
+Return a JSON object with:
+{
+  "coverage": [
+    {
+      "topic": "topic name",
+      "is_covered": true/false,
+      "coverage_quality": "excellent" | "good" | "partial" | "missing",
+      "covered_by_candidates": [0, 1, 2],
+      "gaps": "Description of any gaps"
+    }
+  ],
+  "overall_coverage_score": 0.0-1.0,
+  "recommendations": ["recommendation 1", "recommendation 2"]
+}
+
+JSON response:""")
+
+
+def _bullet_list(items) -> str:
+    """Format items as a markdown bullet list."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+DEFAULT_CRITERIA_BLOCK = _bullet_list(DEFAULT_RANKING_CRITERIA)
+
 
 class RankingAgent(BaseAgent):
     """
@@ -57,14 +137,9 @@ class RankingAgent(BaseAgent):
 
             # Default ranking criteria
             if criteria is None:
-                criteria = [
-                    "Relevance to section topic",
-                    "Completeness of information",
-                    "Clarity and readability",
-                    "Technical accuracy",
-                    "Safety information coverage",
-                    "Recency of information",
-                ]
+                criteria_block = DEFAULT_CRITERIA_BLOCK
+            else:
+                criteria_block = _bullet_list(criteria)
 
             # Prepare candidate summaries for ranking
             candidate_summaries = []
@@ -79,53 +154,28 @@ class RankingAgent(BaseAgent):
                 candidate_summaries.append(summary)
 
             # Build ranking prompt
-            system_message = """You are an expert at evaluating technical documentation for
-lifting and rigging operations. Rank passages based on their relevance, quality,
-and suitability for inclusion in a consolidated procedure."""
-
             requirements_str = (
                 f"\n\nSection Requirements:\n{section_requirements}"
                 if section_requirements
                 else ""
             )
 
-            prompt = f"""Rank these candidate passages for the section: "{section_title}"{requirements_str}
-
-Ranking Criteria:
-{chr(10).join(f"- {c}" for c in criteria)}
-
-Candidates:
-{json.dumps(candidate_summaries, indent=2)}
-
-Return a JSON object with:
-{{
-  "rankings": [
-    {{
-      "index": 0,
-      "rank": 1,
-      "score": 0.0-1.0,
-      "relevance_score": 0.0-1.0,
-      "quality_score": 0.0-1.0,
-      "reasoning": "Brief explanation of ranking",
-      "strengths": ["strength 1", "strength 2"],
-      "weaknesses": ["weakness 1", "weakness 2"],
-      "recommendation": "include" | "consider" | "exclude"
-    }}
-  ],
-  "overall_assessment": "Brief assessment of available candidates"
-}}
-
-JSON response:"""
+            prompt = RANKING_PROMPT_TEMPLATE.substitute(
+                section_title=section_title,
+                requirements=requirements_str,
+                criteria=criteria_block,
+                candidates=json_dumps(candidate_summaries, indent=True),
+            )
 
             response = await self.openai_service.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
+                system_message=RANKING_SYSTEM_MESSAGE,
                 temperature=0.2,
                 max_tokens=2000,
                 response_format={"type": "json_object"},
             )
 
-            result = json.loads(response)
+            result = json_loads(response)
             rankings = result.get("rankings", [])
 
             # Sort by rank
@@ -189,42 +239,19 @@ JSON response:"""
                 for i, c in enumerate(candidates)
             )
 
-            system_message = """You are an expert at analyzing technical documentation
-for completeness and coverage."""
-
-            prompt = f"""Assess how well these candidates cover the required topics.
-
-Required Topics:
-{chr(10).join(f"- {t}" for t in required_topics)}
-
-Candidate Passages:
-{combined_text[:4000]}
-
-Return a JSON object with:
-{{
-  "coverage": [
-    {{
-      "topic": "topic name",
-      "is_covered": true/false,
-      "coverage_quality": "excellent" | "good" | "partial" | "missing",
-      "covered_by_candidates": [0, 1, 2],
-      "gaps": "Description of any gaps"
-    }}
-  ],
-  "overall_coverage_score": 0.0-1.0,
-  "recommendations": ["recommendation 1", "recommendation 2"]
-}}
-
-JSON response:"""
+            prompt = COVERAGE_PROMPT_TEMPLATE.substitute(
+                topics=_bullet_list(required_topics),
+                passages=combined_text[:4000],
+            )
 
             response = await self.openai_service.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
+                system_message=COVERAGE_SYSTEM_MESSAGE,
                 temperature=0.2,
                 response_format={"type": "json_object"},
             )
 
-            result = json.loads(response)
+            result = json_loads(response)
 
             coverage = result.get("coverage", [])
             covered_count = sum(1 for c in coverage if c.get("is_covered", False))
@@ -2,10 +2,10 @@
 Agent for generating summaries and consolidated content from multiple sources.
 """
 from typing import List, Dict, Any, Optional
-import json
 
 from app.agents.base_agent import BaseAgent, AgentResult
 from app.services.openai_service import OpenAIService
+from app.core.json import loads as json_loads
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -119,7 +119,7 @@ JSON response:"""
             )
 
             # Parse response
-            result = json.loads(response)
+            result = json_loads(response)
 
             # Map citations to candidate IDs
             citations_map = {}
@@ -252,7 +252,7 @@ JSON response:"""
                 response_format={"type": "json_object"},
             )
 
-            result = json.loads(response)
+            result = json_loads(response)
             suggestions = result.get("suggestions", [])
 
             # Map back to figure IDs
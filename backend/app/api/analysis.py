@@ -1,13 +1,15 @@
 """
 API endpoints for AI analysis operations.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from pydantic import BaseModel
+from sqlalchemy import select, func, insert
+from pydantic import BaseModel, ConfigDict
 
+from app.api.etag import make_etag, is_not_modified, not_modified_response
 from app.core.database import get_db
 from app.models import SessionSection, ContentConflict
+from app.models.loaders import load_section_candidates
 from app.services import OpenAIService
 from app.services.vector_store import VectorStore
 from app.agents import ContradictionAgent, SummarizationAgent, RankingAgent
@@ -26,6 +28,8 @@ class AnalyzeRequest(BaseModel):
 
 class ConflictResponse(BaseModel):
     """Response model for detected conflicts."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     conflict_type: str
     description: str
@@ -33,9 +37,6 @@ class ConflictResponse(BaseModel):
     severity: str
     is_resolved: bool
 
-    class Config:
-        from_attributes = True
-
 
 @router.post("/section/{section_id}/detect-contradictions")
 async def detect_contradictions(
@@ -62,7 +63,7 @@ async def detect_contradictions(
 
         # Get candidates with content
         candidates = []
-        for candidate in section.candidates:
+        for candidate in await load_section_candidates(db, section_id):
             if candidate.chunk:
                 candidates.append({
                     "chunk_id": candidate.chunk_id,
@@ -93,22 +94,22 @@ async def detect_contradictions(
 
         # Store conflicts in database
         conflicts_data = result.data.get("conflicts", [])
-        stored_conflicts = []
-
-        for conflict in conflicts_data:
-            # Create conflict record
-            db_conflict = ContentConflict(
-                section_id=section_id,
-                candidate_a_id=conflict.get("candidate_a_id"),
-                candidate_b_id=conflict.get("candidate_b_id"),
-                conflict_type=conflict.get("conflict_type"),
-                conflict_description=conflict.get("description"),
-                confidence=conflict.get("confidence"),
-                is_resolved=False,
-            )
+        stored_conflicts = [
+            {
+                "section_id": section_id,
+                "candidate_a_id": conflict.get("candidate_a_id"),
+                "candidate_b_id": conflict.get("candidate_b_id"),
+                "conflict_type": conflict.get("conflict_type"),
+                "conflict_description": conflict.get("description"),
+                "confidence": conflict.get("confidence"),
+                "is_resolved": False,
+            }
+            for conflict in conflicts_data
+        ]
 
-            db.add(db_conflict)
-            stored_conflicts.append(db_conflict)
+        # Insert all conflict records in batched round-trips
+        if stored_conflicts:
+            await db.execute(insert(ContentConflict), stored_conflicts)
 
         await db.commit()
 
@@ -159,7 +160,7 @@ async def generate_summary(
 
         # Get candidates with content
         candidates = []
-        for candidate in section.candidates:
+        for candidate in await load_section_candidates(db, section_id):
             if candidate.chunk and candidate.chunk.source_document:
                 candidates.append({
                     "chunk_id": candidate.chunk_id,
@@ -224,18 +225,40 @@ async def generate_summary(
 @router.get("/section/{section_id}/conflicts", response_model=list[ConflictResponse])
 async def get_section_conflicts(
     section_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get all conflicts for a section.
+
+    Supports conditional requests: the ETag is derived from the latest
+    updated_at and the number of conflicts, checked with a cheap aggregate
+    before the full listing query runs.
     """
     try:
+        version = await db.execute(
+            select(func.max(ContentConflict.updated_at), func.count())
+            .where(ContentConflict.section_id == section_id)
+        )
+        last_updated, conflict_count = version.one()
+        etag = make_etag(last_updated or 0, conflict_count)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        response.headers["ETag"] = etag
+
         result = await db.execute(
-            select(ContentConflict)
+            select(
+                ContentConflict.id,
+                ContentConflict.conflict_type,
+                ContentConflict.conflict_description,
+                ContentConflict.confidence,
+                ContentConflict.is_resolved,
+            )
             .where(ContentConflict.section_id == section_id)
             .order_by(ContentConflict.confidence.desc())
         )
-        conflicts = result.scalars().all()
+        conflicts = result.all()
 
         return [
             ConflictResponse(
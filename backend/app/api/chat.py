@@ -1,7 +1,8 @@
 """
 Chat API endpoint for chatbot functionality.
 """
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Literal, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
@@ -16,9 +17,10 @@ router = APIRouter()
 openai_service = OpenAIService()
 
 
-class ChatMessage(BaseModel):
-    """Chat message model."""
-    role: str  # "user" or "assistant"
+@dataclass(slots=True)
+class ChatMessage:
+    """Chat message model (validated by pydantic as part of ChatRequest)."""
+    role: Literal["user", "assistant", "system"]
     content: str
 
 
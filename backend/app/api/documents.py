@@ -1,18 +1,21 @@
 """
 API endpoints for document management.
 """
+import asyncio
+import os
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from pydantic import BaseModel
+from sqlalchemy import select, insert
+from pydantic import BaseModel, ConfigDict
 
 from app.core.database import get_db
 from app.models import SourceDocument, CleanupSession
 from app.parsers import ParserFactory
 from app.services import StorageService, OpenAIService
-from app.services.indexing_service import IndexingService
+from app.services.indexing_service import IndexingService, INDEXED_EXTENSIONS
 from app.core.config import settings
+from app.core.hashing import content_digest
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -22,6 +25,8 @@ router = APIRouter()
 
 class DocumentResponse(BaseModel):
     """Response model for a document."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     filename: str
     file_type: str
@@ -30,9 +35,6 @@ class DocumentResponse(BaseModel):
     is_processed: bool
     created_at: str
 
-    class Config:
-        from_attributes = True
-
 
 @router.post("/upload/{session_id}", status_code=status.HTTP_201_CREATED)
 async def upload_document(
@@ -101,6 +103,7 @@ async def upload_document(
             blob_path=file_path,  # Keep field name for compatibility
             file_type=file.filename.split('.')[-1].lower(),
             file_size_bytes=file_size,
+            document_hash=content_digest(file_content),
             is_processed=False,
         )
 
@@ -244,14 +247,16 @@ async def scan_data_folder(
         all_files = []
         
         if data_dir.exists():
-            for file_path in data_dir.iterdir():
-                if file_path.is_file():
-                    ext = file_path.suffix.lower()
-                    if ext in [".pdf", ".docx", ".doc"]:
-                        stat = file_path.stat()
+            # scandir reports the entry type without a stat call per file;
+            # only matching documents are stat'ed for their size and times
+            with os.scandir(data_dir) as entries:
+                for entry in entries:
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in INDEXED_EXTENSIONS and entry.is_file():
+                        stat = entry.stat()
                         all_files.append({
-                            "name": file_path.name,
-                            "path": file_path.name,  # Just filename for root level
+                            "name": entry.name,
+                            "path": entry.name,  # Just filename for root level
                             "size": stat.st_size,
                             "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
                             "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
@@ -260,9 +265,9 @@ async def scan_data_folder(
 
         imported_documents = []
         skipped_documents = []
+        document_rows = []
 
         for file_info in all_files:
-            file_path = file_info["path"]
             filename = file_info["name"]
             
             # Check if file is already in database for this session
@@ -284,7 +289,7 @@ async def scan_data_folder(
             
             # Read file
             try:
-                file_content = full_path.read_bytes()
+                file_content = await asyncio.to_thread(full_path.read_bytes)
                 file_size = file_info["size"]
             except Exception as e:
                 logger.error(f"Error reading file {full_path}: {e}")
@@ -294,23 +299,26 @@ async def scan_data_folder(
                 })
                 continue
 
-            # Create document record
-            document = SourceDocument(
-                session_id=session_id,
-                filename=filename,
-                blob_path=str(full_path),  # Store full path
-                file_type=file_info["extension"].lstrip("."),
-                file_size_bytes=file_size,
-                is_processed=False,
-            )
-
-            db.add(document)
+            # Collect document record, inserted in bulk below
+            file_type = file_info["extension"].lstrip(".")
+            document_rows.append({
+                "session_id": session_id,
+                "filename": filename,
+                "blob_path": str(full_path),  # Store full path
+                "file_type": file_type,
+                "file_size_bytes": file_size,
+                "document_hash": content_digest(file_content),
+                "is_processed": False,
+            })
             imported_documents.append({
                 "filename": filename,
-                "file_type": document.file_type,
+                "file_type": file_type,
                 "size": file_size,
             })
 
+        if document_rows:
+            await db.execute(insert(SourceDocument), document_rows)
+
         await db.commit()
 
         logger.info(
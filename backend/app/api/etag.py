@@ -0,0 +1,41 @@
+"""
+Helpers for conditional GET (ETag / If-None-Match) on polled endpoints.
+"""
+from datetime import datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a weak ETag from version markers such as timestamps and counts.
+
+    Args:
+        *parts: Values that change whenever the resource changes
+
+    Returns:
+        Weak ETag header value
+    """
+    tokens = []
+    for part in parts:
+        if isinstance(part, datetime):
+            part = int(part.timestamp() * 1_000_000)
+        tokens.append(str(part))
+    return f'W/"{"-".join(tokens)}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header matches the ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip() for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    """Create an empty 304 response carrying the ETag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag},
+    )
@@ -6,7 +6,7 @@ from pydantic import BaseModel
 from typing import List, Optional
 
 from app.services.openai_service import OpenAIService
-from app.services.vector_store import VectorStore
+from app.services.vector_store import get_vector_store
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -55,7 +55,7 @@ async def vector_search(request: SearchRequest):
     try:
         # Initialize services
         openai_service = OpenAIService()
-        vector_store = VectorStore(dimension=1536)
+        vector_store = get_vector_store()
 
         # Generate query embedding
         query_embedding = await openai_service.generate_embedding(request.query)
@@ -102,7 +102,7 @@ async def get_vector_store_stats():
     Get statistics about the vector store.
     """
     try:
-        vector_store = VectorStore(dimension=1536)
+        vector_store = get_vector_store()
         stats = await vector_store.get_stats()
         return stats
 
@@ -122,7 +122,7 @@ async def clear_vector_index():
     WARNING: This will delete all indexed documents!
     """
     try:
-        vector_store = VectorStore(dimension=1536)
+        vector_store = get_vector_store()
         await vector_store.clear()
         return {"message": "Vector index cleared successfully"}
 
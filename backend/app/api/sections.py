@@ -4,10 +4,12 @@ API endpoints for section management and review.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from pydantic import BaseModel
+from sqlalchemy.orm import lazyload
+from pydantic import BaseModel, ConfigDict
 
 from app.core.database import get_db
 from app.models import SessionSection, SectionStatus, SectionCandidate, ReviewDecision
+from app.models.loaders import load_section_candidates, load_section_tree
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +19,8 @@ router = APIRouter()
 
 class SectionResponse(BaseModel):
     """Response model for a section."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     section_number: str
     section_title: str
@@ -27,8 +31,10 @@ class SectionResponse(BaseModel):
     final_content: str | None
     created_at: str
 
-    class Config:
-        from_attributes = True
+
+class SectionTreeResponse(SectionResponse):
+    """Response model for a section with its subsections."""
+    children: list["SectionTreeResponse"] = []
 
 
 class UpdateSectionRequest(BaseModel):
@@ -40,6 +46,8 @@ class UpdateSectionRequest(BaseModel):
 
 class CandidateResponse(BaseModel):
     """Response model for a section candidate."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     chunk_id: int
     relevance_score: float
@@ -48,9 +56,6 @@ class CandidateResponse(BaseModel):
     reviewer_decision: str
     content: str | None = None
 
-    class Config:
-        from_attributes = True
-
 
 class ReviewCandidateRequest(BaseModel):
     """Request model for reviewing a candidate."""
@@ -97,6 +102,42 @@ async def list_session_sections(
         )
 
 
+def _section_tree_response(section: SessionSection) -> SectionTreeResponse:
+    """Convert a loaded section and its child_sections to a response tree."""
+    return SectionTreeResponse(
+        id=section.id,
+        section_number=section.section_number,
+        section_title=section.section_title,
+        status=section.status.value,
+        ai_draft=section.ai_draft,
+        ai_summary=section.ai_summary,
+        ai_confidence=section.ai_confidence,
+        final_content=section.final_content,
+        created_at=section.created_at.isoformat(),
+        children=[_section_tree_response(child) for child in section.child_sections],
+    )
+
+
+@router.get("/session/{session_id}/tree", response_model=list[SectionTreeResponse])
+async def get_session_section_tree(
+    session_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get a session's sections as a tree, in natural section-number order.
+    """
+    try:
+        roots = await load_section_tree(db, session_id)
+        return [_section_tree_response(section) for section in roots]
+
+    except Exception as e:
+        logger.error(f"Error loading section tree for session {session_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to load section tree",
+        )
+
+
 @router.get("/{section_id}", response_model=SectionResponse)
 async def get_section(
     section_id: int,
@@ -206,12 +247,17 @@ async def get_section_candidates(
     Get all candidate passages for a section.
     """
     try:
-        result = await db.execute(
-            select(SectionCandidate)
-            .where(SectionCandidate.section_id == section_id)
-            .order_by(SectionCandidate.rank)
-        )
-        candidates = result.scalars().all()
+        if include_content:
+            candidates = await load_section_candidates(db, section_id)
+        else:
+            # Chunk content is not returned, so skip loading the chunks
+            result = await db.execute(
+                select(SectionCandidate)
+                .where(SectionCandidate.section_id == section_id)
+                .order_by(SectionCandidate.rank)
+                .options(lazyload(SectionCandidate.chunk))
+            )
+            candidates = result.scalars().all()
 
         response = []
         for c in candidates:
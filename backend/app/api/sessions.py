@@ -1,12 +1,15 @@
 """
 API endpoints for cleanup sessions.
 """
+from datetime import datetime
+from enum import Enum
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from pydantic import BaseModel, Field
+from sqlalchemy import select, insert, update
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
+from app.api.etag import make_etag, is_not_modified, not_modified_response
 from app.core.database import get_db
 from app.models import CleanupSession, SessionStatus
 from app.core.logging import get_logger
@@ -28,6 +31,8 @@ class CreateSessionRequest(BaseModel):
 
 class SessionResponse(BaseModel):
     """Response model for a session."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     description: str | None
@@ -38,8 +43,41 @@ class SessionResponse(BaseModel):
     created_at: str
     updated_at: str
 
-    class Config:
-        from_attributes = True
+    @field_validator("status", mode="before")
+    @classmethod
+    def _status_value(cls, v):
+        """Accept SessionStatus members straight from ORM rows."""
+        return v.value if isinstance(v, Enum) else v
+
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def _isoformat(cls, v):
+        """Render datetimes from ORM rows as ISO 8601 strings."""
+        return v.isoformat() if isinstance(v, datetime) else v
+
+
+# Validates whole result lists in pydantic-core rather than per row in Python
+SESSION_LIST_ADAPTER = TypeAdapter(List[SessionResponse])
+
+
+# Columns needed to build a SessionResponse. Selecting only these keeps the
+# large JSON configuration columns off the wire.
+SESSION_RESPONSE_COLUMNS = (
+    CleanupSession.id,
+    CleanupSession.name,
+    CleanupSession.description,
+    CleanupSession.status,
+    CleanupSession.total_documents,
+    CleanupSession.processed_documents,
+    CleanupSession.total_sections,
+    CleanupSession.created_at,
+    CleanupSession.updated_at,
+)
+
+
+def _to_session_response(row) -> SessionResponse:
+    """Build a SessionResponse from a projected session row."""
+    return SessionResponse.model_validate(row)
 
 
 class UpdateSessionRequest(BaseModel):
@@ -64,33 +102,25 @@ async def create_session(
     logger.info(f"Creating new session: {request.name}")
 
     try:
-        # Create new session
-        session = CleanupSession(
-            name=request.name,
-            description=request.description,
-            status=SessionStatus.CREATED,
-            table_of_contents=request.table_of_contents,
-            personas=request.personas,
-            scope_criteria=request.scope_criteria,
+        # Create new session, returning only the response columns
+        result = await db.execute(
+            insert(CleanupSession)
+            .values(
+                name=request.name,
+                description=request.description,
+                status=SessionStatus.CREATED,
+                table_of_contents=request.table_of_contents,
+                personas=request.personas,
+                scope_criteria=request.scope_criteria,
+            )
+            .returning(*SESSION_RESPONSE_COLUMNS)
         )
-
-        db.add(session)
+        row = result.one()
         await db.commit()
-        await db.refresh(session)
-
-        logger.info(f"Created session {session.id}")
-
-        return SessionResponse(
-            id=session.id,
-            name=session.name,
-            description=session.description,
-            status=session.status.value,
-            total_documents=session.total_documents,
-            processed_documents=session.processed_documents,
-            total_sections=session.total_sections,
-            created_at=session.created_at.isoformat(),
-            updated_at=session.updated_at.isoformat(),
-        )
+
+        logger.info(f"Created session {row.id}")
+
+        return _to_session_response(row)
 
     except Exception as e:
         logger.error(f"Error creating session: {e}")
@@ -112,27 +142,14 @@ async def list_sessions(
     """
     try:
         result = await db.execute(
-            select(CleanupSession)
+            select(*SESSION_RESPONSE_COLUMNS)
             .order_by(CleanupSession.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        sessions = result.scalars().all()
-
-        return [
-            SessionResponse(
-                id=s.id,
-                name=s.name,
-                description=s.description,
-                status=s.status.value,
-                total_documents=s.total_documents,
-                processed_documents=s.processed_documents,
-                total_sections=s.total_sections,
-                created_at=s.created_at.isoformat(),
-                updated_at=s.updated_at.isoformat(),
-            )
-            for s in sessions
-        ]
+        rows = result.all()
+
+        return SESSION_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
     except Exception as e:
         logger.error(f"Error listing sessions: {e}")
@@ -145,34 +162,34 @@ async def list_sessions(
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get a specific session by ID.
+
+    Supports conditional requests: the response carries an ETag derived from
+    updated_at, and a matching If-None-Match returns 304 without a body.
     """
     try:
         result = await db.execute(
-            select(CleanupSession).where(CleanupSession.id == session_id)
+            select(*SESSION_RESPONSE_COLUMNS).where(CleanupSession.id == session_id)
         )
-        session = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not session:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Session {session_id} not found",
             )
 
-        return SessionResponse(
-            id=session.id,
-            name=session.name,
-            description=session.description,
-            status=session.status.value,
-            total_documents=session.total_documents,
-            processed_documents=session.processed_documents,
-            total_sections=session.total_sections,
-            created_at=session.created_at.isoformat(),
-            updated_at=session.updated_at.isoformat(),
-        )
+        etag = make_etag(row.updated_at)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        response.headers["ETag"] = etag
+
+        return _to_session_response(row)
 
     except HTTPException:
         raise
@@ -194,45 +211,44 @@ async def update_session(
     Update a session.
     """
     try:
-        result = await db.execute(
-            select(CleanupSession).where(CleanupSession.id == session_id)
-        )
-        session = result.scalar_one_or_none()
-
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Session {session_id} not found",
-            )
-
-        # Update fields
+        # Collect changed fields
+        values = {}
         if request.name is not None:
-            session.name = request.name
+            values["name"] = request.name
         if request.description is not None:
-            session.description = request.description
+            values["description"] = request.description
         if request.status is not None:
-            session.status = request.status
+            values["status"] = request.status
         if request.table_of_contents is not None:
-            session.table_of_contents = request.table_of_contents
+            values["table_of_contents"] = request.table_of_contents
         if request.personas is not None:
-            session.personas = request.personas
+            values["personas"] = request.personas
+
+        if values:
+            result = await db.execute(
+                update(CleanupSession)
+                .where(CleanupSession.id == session_id)
+                .values(**values)
+                .returning(*SESSION_RESPONSE_COLUMNS)
+            )
+        else:
+            result = await db.execute(
+                select(*SESSION_RESPONSE_COLUMNS)
+                .where(CleanupSession.id == session_id)
+            )
+        row = result.one_or_none()
+
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session {session_id} not found",
+            )
 
         await db.commit()
-        await db.refresh(session)
 
         logger.info(f"Updated session {session_id}")
 
-        return SessionResponse(
-            id=session.id,
-            name=session.name,
-            description=session.description,
-            status=session.status.value,
-            total_documents=session.total_documents,
-            processed_documents=session.processed_documents,
-            total_sections=session.total_sections,
-            created_at=session.created_at.isoformat(),
-            updated_at=session.updated_at.isoformat(),
-        )
+        return _to_session_response(row)
 
     except HTTPException:
         raise
@@ -4,7 +4,7 @@ API endpoints for document synthesis.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
 
 from app.core.database import get_db
@@ -26,6 +26,8 @@ class CreateSynthesisSessionRequest(BaseModel):
 
 class SynthesisSessionResponse(BaseModel):
     """Response model for synthesis session."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     description: Optional[str]
@@ -34,9 +36,6 @@ class SynthesisSessionResponse(BaseModel):
     inventory_table: Optional[List[Dict]] = None
     created_at: str
 
-    class Config:
-        from_attributes = True
-
 
 class AnalyzeStructuresRequest(BaseModel):
     """Request to analyze document structures."""
@@ -54,6 +53,12 @@ class GetParagraphsRequest(BaseModel):
     top_k: int = 10
 
 
+class GetParagraphsBatchRequest(BaseModel):
+    """Request model for getting paragraphs for several sections."""
+    sections: List[str]
+    top_k: int = 10
+
+
 class SelectParagraphsRequest(BaseModel):
     """Request to select paragraphs for sections."""
     selected_paragraphs: Dict[str, List[str]]  # section_title -> [paragraph_ids]
@@ -201,6 +206,16 @@ async def update_inventory_table(
     }
 
 
+def _used_paragraph_ids(session: SynthesisSession) -> set:
+    """Collect the paragraph IDs already selected in any section of a session."""
+    used_paragraph_ids = set()
+    if session.selected_paragraphs:
+        for section_paras in session.selected_paragraphs.values():
+            if isinstance(section_paras, list):
+                used_paragraph_ids.update(section_paras)
+    return used_paragraph_ids
+
+
 @router.post("/sessions/{session_id}/paragraphs")
 async def get_paragraphs_for_section(
     session_id: int,
@@ -222,20 +237,12 @@ async def get_paragraphs_for_section(
         )
 
     try:
-        # Get already used paragraph IDs to avoid duplicates
-        used_paragraph_ids = set()
-        if session.selected_paragraphs:
-            # Collect all used paragraph IDs from all sections
-            for section_paras in session.selected_paragraphs.values():
-                if isinstance(section_paras, list):
-                    used_paragraph_ids.update(section_paras)
-        
         synthesis_service = SynthesisService()
         paragraphs = await synthesis_service.find_paragraphs_for_section(
             section_title=request.section_title,
             filenames=session.source_filenames,
             top_k=request.top_k,
-            used_paragraph_ids=used_paragraph_ids
+            used_paragraph_ids=_used_paragraph_ids(session)
         )
 
         return {
@@ -253,6 +260,54 @@ async def get_paragraphs_for_section(
         )
 
 
+@router.post("/sessions/{session_id}/paragraphs:batch")
+async def get_paragraphs_for_sections(
+    session_id: int,
+    request: GetParagraphsBatchRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get relevant paragraphs for several sections in one request.
+
+    The section titles are embedded together and their LLM validations are
+    batched, which is much cheaper than one /paragraphs call per section.
+    """
+    logger.info(f"Getting paragraphs for {len(request.sections)} sections")
+
+    result = await db.execute(
+        select(SynthesisSession).where(SynthesisSession.id == session_id)
+    )
+    session = result.scalar_one_or_none()
+
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Synthesis session {session_id} not found"
+        )
+
+    try:
+        synthesis_service = SynthesisService()
+        results = await synthesis_service.find_paragraphs_for_sections(
+            section_titles=request.sections,
+            filenames=session.source_filenames,
+            top_k=request.top_k,
+            used_paragraph_ids=_used_paragraph_ids(session)
+        )
+
+        return {
+            "success": True,
+            "results": results,
+            "count": sum(len(paragraphs) for paragraphs in results.values())
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting paragraphs: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get paragraphs: {str(e)}"
+        )
+
+
 @router.post("/sessions/{session_id}/select-paragraphs")
 async def select_paragraphs(
     session_id: int,
@@ -287,9 +342,17 @@ async def select_paragraphs(
 @router.post("/sessions/{session_id}/generate-document")
 async def generate_synthesis_document(
     session_id: int,
+    include_document: bool = True,
     db: AsyncSession = Depends(get_db),
 ):
-    """Generate the final synthesis document."""
+    """
+    Generate the final synthesis document.
+
+    Args:
+        session_id: Synthesis session ID
+        include_document: Include the DOCX base64-encoded in the response;
+            clients that download it from /sessions/{id}/document pass False
+    """
     logger.info(f"Generating synthesis document for session {session_id}")
 
     result = await db.execute(
@@ -345,14 +408,16 @@ async def generate_synthesis_document(
         session.status = "completed"
         await db.commit()
 
-        return {
+        response = {
             "success": True,
             "message": "Synthesis document generated",
-            "document_base64": document_base64,
             "document_path": str(doc_path),
             "filename": doc_filename,
             "session_id": session_id
         }
+        if include_document:
+            response["document_base64"] = document_base64
+        return response
 
     except Exception as e:
         logger.error(f"Error generating document: {e}")
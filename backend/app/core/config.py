@@ -30,6 +30,12 @@ class Settings(BaseSettings):
     api_prefix: str = Field(default="/api/v1")
     cors_origins: List[str] = Field(default=["http://localhost:3000"])
 
+    # Database connection pool (ignored in development, which uses NullPool)
+    database_pool_size: int = Field(default=20, description="Connections kept open in the pool")
+    database_max_overflow: int = Field(default=40, description="Extra connections allowed above the pool size")
+    database_pool_timeout: int = Field(default=30, description="Seconds to wait for a free connection")
+    database_pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is replaced")
+
     # Gemini/Vertex AI Configuration (via Proxy)
     endpoint: str = Field(default="", description="API endpoint URL")
     api_key: str = Field(default="", description="API key for authentication")
@@ -39,6 +45,22 @@ class Settings(BaseSettings):
     # AI Configuration
     temperature: float = Field(default=0.7)
     max_tokens: int = Field(default=2000)
+    openai_concurrency: int = Field(default=8, description="Maximum concurrent LLM requests per operation")
+    completion_timeout: float = Field(default=300.0, description="Seconds before a single completion request times out")
+    completion_max_retries: int = Field(default=3, description="Retries for completion requests that fail transiently")
+
+    # Document parsing
+    index_concurrency: int = Field(default=8, description="Documents parsed concurrently during indexing and structure analysis")
+    synthesis_structure_cache_enabled: bool = Field(default=True, description="Reuse extracted document structures for unchanged files")
+    parser_workers: Optional[int] = Field(default=None, description="Processes used for CPU-bound parsing (defaults to CPU count)")
+    chunk_cache_dir: Optional[str] = Field(default=None, description="Directory for cached document chunks (defaults to .chunk_cache in the data directory)")
+    chunk_cache_max_entries: int = Field(default=1000, description="Maximum number of cached chunked documents")
+
+    # Vector index
+    hnsw_m: int = Field(default=32, description="HNSW links per node for newly created indexes")
+    hnsw_ef_construction: int = Field(default=200, description="HNSW candidate list size while building")
+    hnsw_ef_search: int = Field(default=64, description="HNSW candidate list size while searching")
+    hnsw_num_threads: Optional[int] = Field(default=None, description="Threads used for HNSW inserts (defaults to CPU count)")
 
     @field_validator("cors_origins", mode="before")
     @classmethod
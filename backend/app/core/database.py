@@ -7,18 +7,35 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
 )
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
 
+# Pool sizing only applies to the default queue pool; development uses
+# NullPool, which opens a fresh connection per checkout
+if settings.is_development:
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
-    poolclass=NullPool if settings.is_development else None,
     pool_pre_ping=True,
+    # Rows per statement when executemany inserts are batched into one
+    # multi-row INSERT
+    insertmanyvalues_page_size=1000,
+    **pool_options,
 )
 
 # Create async session factory
@@ -56,8 +73,84 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_db() -> None:
     """Initialize database tables."""
+    # Imported here because the models import Base from this module
+    from app.models.cleanup_session import install_session_counter_triggers
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await _convert_document_hash_column(conn)
+        await _convert_timestamp_columns(conn)
+        await conn.run_sync(install_session_counter_triggers)
+
+
+async def _convert_document_hash_column(conn: AsyncConnection) -> None:
+    """
+    Convert source_documents.document_hash from VARCHAR(64) to bytea.
+
+    create_all does not alter existing tables, so databases created before
+    the column became a raw BLAKE2b digest are converted here. The old hex
+    values were never populated and would not match the new digests, so
+    they are cleared. Does nothing once the column is bytea.
+
+    Args:
+        conn: Connection inside the initialization transaction
+    """
+    if conn.dialect.name != "postgresql":
+        return
+
+    result = await conn.execute(text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_schema = current_schema() "
+        "AND table_name = 'source_documents' AND column_name = 'document_hash'"
+    ))
+    if result.scalar() == "character varying":
+        await conn.execute(text(
+            "ALTER TABLE source_documents "
+            "ALTER COLUMN document_hash TYPE bytea USING NULL"
+        ))
+
+
+async def _convert_timestamp_columns(conn: AsyncConnection) -> None:
+    """
+    Convert created_at/updated_at columns to timestamptz with a now() default.
+
+    Tables created before the timestamps moved to the database still have
+    naive timestamp columns without a default. Their values were written with
+    datetime.utcnow, so they are read as UTC. Does nothing once converted.
+
+    Args:
+        conn: Connection inside the initialization transaction
+    """
+    if conn.dialect.name != "postgresql":
+        return
+
+    result = await conn.execute(
+        text(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "AND column_name IN ('created_at', 'updated_at') "
+            "AND data_type = 'timestamp without time zone' "
+            "AND table_name = ANY(:tables)"
+        ),
+        {"tables": list(Base.metadata.tables)},
+    )
+    columns_by_table: dict[str, list[str]] = {}
+    for table_name, column_name in result:
+        columns_by_table.setdefault(table_name, []).append(column_name)
+
+    quote = conn.dialect.identifier_preparer.quote
+    for table_name, column_names in columns_by_table.items():
+        alterations = []
+        for name in column_names:
+            column = quote(name)
+            alterations.append(
+                f"ALTER COLUMN {column} TYPE timestamptz "
+                f"USING {column} AT TIME ZONE 'UTC'"
+            )
+            alterations.append(f"ALTER COLUMN {column} SET DEFAULT now()")
+        await conn.execute(text(
+            f"ALTER TABLE {quote(table_name)} " + ", ".join(alterations)
+        ))
 
 
 async def close_db() -> None:
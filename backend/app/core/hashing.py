@@ -0,0 +1,20 @@
+"""
+Content hashing shared by document ingestion and parsing.
+"""
+import hashlib
+
+# Raw digest width in bytes, matching the LargeBinary hash columns
+DIGEST_SIZE = 16
+
+
+def content_digest(data: bytes) -> bytes:
+    """
+    Compute the fixed-width BLAKE2b digest used to identify content.
+
+    Args:
+        data: Raw content bytes
+
+    Returns:
+        DIGEST_SIZE-byte digest
+    """
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
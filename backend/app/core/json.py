@@ -0,0 +1,35 @@
+"""
+Fast JSON encoding and decoding backed by orjson.
+"""
+from typing import Any
+
+import orjson
+
+
+def _default(obj: Any) -> str:
+    """Fallback serializer for types orjson does not handle natively."""
+    return str(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON string (non-ASCII characters are kept as-is)
+    """
+    # numpy scalars and arrays are serialized natively rather than via str(),
+    # and non-string dict keys are stringified like the stdlib encoder does
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON string or bytes."""
+    return orjson.loads(data)
@@ -1,6 +1,8 @@
 """
 Main FastAPI application for Chatbot.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -8,10 +10,20 @@ from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
 from app.api import chat
+from app.parsers.process_pool import shutdown_parser_pool
+from app.services.openai_service import close_http_client
 
 logger = get_logger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared resources on shutdown."""
+    yield
+    await close_http_client()
+    shutdown_parser_pool()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Chatbot API",
@@ -19,6 +31,7 @@ app = FastAPI(
     description="Simple chatbot with OpenAI services",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -1,20 +1,33 @@
 """
 Base model mixins and utilities.
 """
-from datetime import datetime
+from operator import attrgetter
 from typing import Any
 from sqlalchemy import Column, DateTime, Integer, String
 from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.sql import func
 
 
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamps."""
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Timestamps are generated by the database; eager_defaults fetches them
+    # back via RETURNING so they are available without a lazy refresh.
+    # default renders now() into the INSERT itself, so tables created before
+    # the server default existed still get a value.
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        nullable=False,
+    )
     updated_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -37,11 +50,34 @@ class UserTrackingMixin:
         return Column(String(255), nullable=True)
 
 
+# Column names and a matching attrgetter per model class, built on first use
+_column_cache: dict[type, tuple[tuple[str, ...], attrgetter]] = {}
+
+
+def _get_column_accessor(cls: type) -> tuple[tuple[str, ...], attrgetter]:
+    """Return cached (column names, attrgetter) for a model class."""
+    cached = _column_cache.get(cls)
+    if cached is None:
+        names = tuple(c.name for c in cls.__table__.columns)
+        cached = (names, attrgetter(*names))
+        _column_cache[cls] = cached
+    return cached
+
+
 def model_to_dict(obj: Any, exclude: list[str] | None = None) -> dict[str, Any]:
     """Convert SQLAlchemy model to dictionary."""
-    exclude = exclude or []
+    names, getter = _get_column_accessor(type(obj))
+    values = getter(obj)
+    if len(names) == 1:
+        # attrgetter with a single name returns the bare value
+        values = (values,)
+
+    if not exclude:
+        return dict(zip(names, values))
+
+    excluded = set(exclude)
     return {
-        c.name: getattr(obj, c.name)
-        for c in obj.__table__.columns
-        if c.name not in exclude
+        name: value
+        for name, value in zip(names, values)
+        if name not in excluded
     }
@@ -4,17 +4,24 @@ Database models for cleanup sessions.
 from enum import Enum as PyEnum
 from sqlalchemy import (
     Column,
+    DateTime,
     Integer,
     String,
     Text,
     Enum,
-    JSON,
     ForeignKey,
     Boolean,
+    Index,
+    LargeBinary,
+    DDL,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.engine import Connection
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
+from app.core.hashing import DIGEST_SIZE
 from app.models.base import TimestampMixin, IDMixin, UserTrackingMixin
 
 
@@ -42,16 +49,21 @@ class CleanupSession(Base, IDMixin, TimestampMixin, UserTrackingMixin):
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(
-        Enum(SessionStatus),
+        Enum(
+            SessionStatus,
+            name="sessionstatus",
+            native_enum=True,
+            create_constraint=False,
+        ),
         default=SessionStatus.CREATED,
         nullable=False,
         index=True,
     )
 
     # Configuration
-    table_of_contents = Column(JSON, nullable=True)  # ToC structure as JSON
-    personas = Column(JSON, nullable=True)  # List of target personas
-    scope_criteria = Column(JSON, nullable=True)  # Document selection criteria
+    table_of_contents = Column(JSONB, nullable=True)  # ToC structure as JSON
+    personas = Column(JSONB, nullable=True)  # List of target personas
+    scope_criteria = Column(JSONB, nullable=True)  # Document selection criteria
 
     # Processing metadata
     total_documents = Column(Integer, default=0)
@@ -80,6 +92,11 @@ class CleanupSession(Base, IDMixin, TimestampMixin, UserTrackingMixin):
         cascade="all, delete-orphan",
     )
 
+    # Serves containment lookups such as "sessions targeting persona X"
+    __table_args__ = (
+        Index("ix_sessions_personas_gin", personas, postgresql_using="gin"),
+    )
+
     def __repr__(self) -> str:
         return f"<CleanupSession(id={self.id}, name='{self.name}', status='{self.status}')>"
 
@@ -92,20 +109,33 @@ class SourceDocument(Base, IDMixin, TimestampMixin):
     __tablename__ = "source_documents"
 
     # Session relationship
-    session_id = Column(Integer, ForeignKey("cleanup_sessions.id"), nullable=False)
+    session_id = Column(
+        Integer,
+        ForeignKey("cleanup_sessions.id"),
+        nullable=False,
+        index=True,
+    )
     session = relationship("CleanupSession", back_populates="source_documents")
 
     # Document identification
     filename = Column(String(512), nullable=False)
     original_path = Column(String(1024), nullable=True)  # SharePoint path
     blob_path = Column(String(1024), nullable=True)  # Azure Blob path
-    document_hash = Column(String(64), nullable=True, index=True)  # SHA-256 hash
+    document_hash = Column(
+        LargeBinary(DIGEST_SIZE),
+        nullable=True,
+        index=True,
+    )  # BLAKE2b digest of the file content
 
     # Metadata
     file_type = Column(String(50), nullable=False)  # pdf, docx, etc.
     file_size_bytes = Column(Integer, nullable=True)
     page_count = Column(Integer, nullable=True)
-    document_date = Column(String(50), nullable=True)  # Date from document metadata
+    document_date = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True,
+    )  # Date from document metadata
     document_version = Column(String(50), nullable=True)
     document_owner = Column(String(255), nullable=True)
 
@@ -113,9 +143,10 @@ class SourceDocument(Base, IDMixin, TimestampMixin):
     is_processed = Column(Boolean, default=False)
     processing_error = Column(Text, nullable=True)
 
-    # Extracted content
-    extracted_text = Column(Text, nullable=True)  # Full text if needed
-    metadata_json = Column(JSON, nullable=True)  # Additional metadata
+    # Extracted content, deferred so listings do not fetch it; load it with
+    # undefer() when needed
+    extracted_text = deferred(Column(Text, nullable=True))  # Full text if needed
+    metadata_json = deferred(Column(JSONB, nullable=True))  # Additional metadata
 
     # Relationships
     chunks = relationship(
@@ -155,13 +186,24 @@ class DocumentChunk(Base, IDMixin, TimestampMixin):
     section_title = Column(String(512), nullable=True)
 
     # Vector search
-    vector_id = Column(String(255), nullable=True, index=True)  # ID in vector store
+    vector_id = Column(String(64), nullable=True)  # ID in vector store
     embedding_model = Column(String(100), nullable=True)
 
     # Chunk metadata
     token_count = Column(Integer, nullable=True)
     char_count = Column(Integer, nullable=False)
 
+    # Serves per-document chunk listings in document order, and resolves
+    # vector store hits to chunk positions from the index alone
+    __table_args__ = (
+        Index("ix_chunks_doc_idx", source_document_id, chunk_index),
+        Index(
+            "ix_chunks_vector_covering",
+            vector_id,
+            postgresql_include=["source_document_id", "chunk_index", "page_number"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<DocumentChunk(id={self.id}, doc={self.source_document_id}, idx={self.chunk_index})>"
 
@@ -193,7 +235,177 @@ class DocumentFigure(Base, IDMixin, TimestampMixin):
     # Metadata
     width = Column(Integer, nullable=True)
     height = Column(Integer, nullable=True)
-    ocr_text = Column(Text, nullable=True)  # Text from OCR if applied
+    ocr_text = deferred(Column(Text, nullable=True))  # Text from OCR if applied
+
+    # Serves per-document figure listings in document order
+    __table_args__ = (
+        Index("ix_figures_doc_idx", source_document_id, figure_index),
+    )
 
     def __repr__(self) -> str:
         return f"<DocumentFigure(id={self.id}, doc={self.source_document_id}, idx={self.figure_index})>"
+
+
+# Session counters are maintained by PostgreSQL statement-level triggers, so
+# bulk inserts and status updates adjust them once per statement instead of
+# the application issuing a counting query per document. They are installed
+# by install_session_counter_triggers at startup.
+_SESSION_DOCUMENT_COUNTERS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION session_document_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE cleanup_sessions s
+        SET total_documents = s.total_documents + d.added,
+            processed_documents = s.processed_documents + d.processed,
+            updated_at = now()
+        FROM (
+            SELECT session_id,
+                   count(*) AS added,
+                   count(*) FILTER (WHERE is_processed) AS processed
+            FROM new_rows
+            GROUP BY session_id
+        ) d
+        WHERE s.id = d.session_id;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE cleanup_sessions s
+        SET processed_documents = s.processed_documents + d.processed,
+            updated_at = now()
+        FROM (
+            SELECT n.session_id,
+                   count(*) FILTER (WHERE n.is_processed)
+                       - count(*) FILTER (WHERE o.is_processed) AS processed
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE n.is_processed IS DISTINCT FROM o.is_processed
+            GROUP BY n.session_id
+        ) d
+        WHERE s.id = d.session_id AND d.processed <> 0;
+    ELSE
+        UPDATE cleanup_sessions s
+        SET total_documents = s.total_documents - d.removed,
+            processed_documents = s.processed_documents - d.processed,
+            updated_at = now()
+        FROM (
+            SELECT session_id,
+                   count(*) AS removed,
+                   count(*) FILTER (WHERE is_processed) AS processed
+            FROM old_rows
+            GROUP BY session_id
+        ) d
+        WHERE s.id = d.session_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+_SOURCE_DOCUMENT_TRIGGERS = {
+    "source_documents_counters_insert": DDL("""
+CREATE TRIGGER source_documents_counters_insert
+AFTER INSERT ON source_documents
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION session_document_counters()
+"""),
+    "source_documents_counters_update": DDL("""
+CREATE TRIGGER source_documents_counters_update
+AFTER UPDATE ON source_documents
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION session_document_counters()
+"""),
+    "source_documents_counters_delete": DDL("""
+CREATE TRIGGER source_documents_counters_delete
+AFTER DELETE ON source_documents
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION session_document_counters()
+"""),
+}
+
+_SESSION_CHUNK_COUNTERS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION session_chunk_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE cleanup_sessions s
+        SET total_chunks = s.total_chunks + d.added, updated_at = now()
+        FROM (
+            SELECT sd.session_id, count(*) AS added
+            FROM new_rows c JOIN source_documents sd ON sd.id = c.source_document_id
+            GROUP BY sd.session_id
+        ) d
+        WHERE s.id = d.session_id;
+    ELSE
+        UPDATE cleanup_sessions s
+        SET total_chunks = s.total_chunks - d.removed, updated_at = now()
+        FROM (
+            SELECT sd.session_id, count(*) AS removed
+            FROM old_rows c JOIN source_documents sd ON sd.id = c.source_document_id
+            GROUP BY sd.session_id
+        ) d
+        WHERE s.id = d.session_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+_DOCUMENT_CHUNK_TRIGGERS = {
+    "document_chunks_counters_insert": DDL("""
+CREATE TRIGGER document_chunks_counters_insert
+AFTER INSERT ON document_chunks
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION session_chunk_counters()
+"""),
+    "document_chunks_counters_delete": DDL("""
+CREATE TRIGGER document_chunks_counters_delete
+AFTER DELETE ON document_chunks
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION session_chunk_counters()
+"""),
+}
+
+# Brings the counters in line with the rows already present, for databases
+# that had documents before the triggers were installed
+_RECOUNT_SESSION_COUNTERS = text("""
+UPDATE cleanup_sessions s
+SET total_documents = (
+        SELECT count(*) FROM source_documents d WHERE d.session_id = s.id
+    ),
+    processed_documents = (
+        SELECT count(*) FROM source_documents d
+        WHERE d.session_id = s.id AND d.is_processed
+    ),
+    total_chunks = (
+        SELECT count(*) FROM document_chunks c
+        JOIN source_documents d ON d.id = c.source_document_id
+        WHERE d.session_id = s.id
+    )
+""")
+
+
+def install_session_counter_triggers(connection: Connection) -> None:
+    """
+    Create or update the session counter functions and triggers.
+
+    Safe to run on every startup: the functions are replaced, and only
+    missing triggers are created, so databases created before the triggers
+    existed get them too. When any trigger had to be created, the counters
+    are recounted once from the existing rows.
+
+    Args:
+        connection: Connection inside the initialization transaction
+    """
+    if connection.dialect.name != "postgresql":
+        return
+
+    connection.execute(_SESSION_DOCUMENT_COUNTERS_FUNCTION)
+    connection.execute(_SESSION_CHUNK_COUNTERS_FUNCTION)
+
+    triggers = {**_SOURCE_DOCUMENT_TRIGGERS, **_DOCUMENT_CHUNK_TRIGGERS}
+    existing = set(connection.execute(
+        text(
+            "SELECT tgname FROM pg_trigger "
+            "WHERE NOT tgisinternal "
+            "AND tgrelid IN ('source_documents'::regclass, 'document_chunks'::regclass)"
+        )
+    ).scalars())
+    missing = [name for name in triggers if name not in existing]
+    for name in missing:
+        connection.execute(triggers[name])
+    if missing:
+        connection.execute(_RECOUNT_SESSION_COUNTERS)
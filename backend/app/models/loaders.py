@@ -0,0 +1,149 @@
+"""
+Query helpers that load related model graphs in a fixed number of queries.
+"""
+import re
+from typing import List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.cleanup_session import DocumentChunk, SourceDocument
+from app.models.review import SectionCandidate, SessionSection
+
+
+async def load_section_candidates(
+    db: AsyncSession,
+    section_id: int,
+) -> List[SectionCandidate]:
+    """
+    Load a section's candidates with their chunks and source documents.
+
+    Runs one query per table and knits the results together with
+    set_committed_value, so wide sections avoid both per-row lazy loads and
+    the row multiplication of a joined eager load.
+
+    Args:
+        db: Database session
+        section_id: Section to load candidates for
+
+    Returns:
+        Candidates in rank order, with chunk and chunk.source_document set
+    """
+    result = await db.execute(
+        select(SectionCandidate)
+        .where(SectionCandidate.section_id == section_id)
+        .order_by(SectionCandidate.rank)
+        .options(lazyload(SectionCandidate.chunk))
+    )
+    candidates = result.scalars().all()
+
+    if not candidates:
+        return []
+
+    chunk_ids = (
+        select(SectionCandidate.chunk_id)
+        .where(SectionCandidate.section_id == section_id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(DocumentChunk).where(DocumentChunk.id.in_(chunk_ids))
+    )
+    chunks_by_id = {chunk.id: chunk for chunk in result.scalars()}
+
+    document_ids = {chunk.source_document_id for chunk in chunks_by_id.values()}
+    result = await db.execute(
+        select(SourceDocument).where(SourceDocument.id.in_(document_ids))
+    )
+    documents_by_id = {doc.id: doc for doc in result.scalars()}
+
+    for chunk in chunks_by_id.values():
+        set_committed_value(
+            chunk,
+            "source_document",
+            documents_by_id.get(chunk.source_document_id),
+        )
+    for candidate in candidates:
+        set_committed_value(
+            candidate,
+            "chunk",
+            chunks_by_id.get(candidate.chunk_id),
+        )
+
+    return list(candidates)
+
+
+def section_number_key(section_number: str) -> Tuple[Tuple[int, int, str], ...]:
+    """
+    Sort key that orders section numbers naturally ("2" < "10", "3.2" < "3.10").
+
+    Args:
+        section_number: Dotted section number, e.g. "3.2.1"
+
+    Returns:
+        Tuple comparing numeric parts as integers and other parts as text
+    """
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in re.split(r"[.\s]+", section_number.strip())
+        if part
+    )
+
+
+async def load_section_tree(
+    db: AsyncSession,
+    session_id: int,
+) -> List[SessionSection]:
+    """
+    Load a session's section hierarchy in a single query.
+
+    A recursive CTE walks from the root sections down through
+    parent_section_id; parent and child links are then attached with
+    set_committed_value so traversing the tree issues no further queries.
+
+    Args:
+        db: Database session
+        session_id: Session to load sections for
+
+    Returns:
+        Root sections in natural section-number order, with child_sections
+        set recursively in the same order
+    """
+    tree = (
+        select(SessionSection.id)
+        .where(
+            SessionSection.session_id == session_id,
+            SessionSection.parent_section_id.is_(None),
+        )
+        .cte("section_tree", recursive=True)
+    )
+    tree = tree.union_all(
+        select(SessionSection.id)
+        .where(SessionSection.parent_section_id == tree.c.id)
+    )
+
+    result = await db.execute(
+        select(SessionSection).join(tree, SessionSection.id == tree.c.id)
+    )
+    # Section numbers sort as text in SQL ("10" before "2"), so order here
+    sections = sorted(
+        result.scalars().all(),
+        key=lambda section: section_number_key(section.section_number),
+    )
+
+    by_id = {section.id: section for section in sections}
+    children_by_parent = {section.id: [] for section in sections}
+    roots = []
+    for section in sections:
+        parent = by_id.get(section.parent_section_id)
+        set_committed_value(section, "parent_section", parent)
+        if parent is None:
+            roots.append(section)
+        else:
+            children_by_parent[parent.id].append(section)
+
+    for section in sections:
+        set_committed_value(section, "child_sections", children_by_parent[section.id])
+
+    return roots
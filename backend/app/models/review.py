@@ -4,16 +4,18 @@ Database models for the review process.
 from enum import Enum as PyEnum
 from sqlalchemy import (
     Column,
+    DateTime,
     Integer,
     String,
     Text,
     Enum,
-    JSON,
     ForeignKey,
     Boolean,
     Float,
+    Index,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 from app.models.base import TimestampMixin, IDMixin, UserTrackingMixin
@@ -53,11 +55,21 @@ class SessionSection(Base, IDMixin, TimestampMixin, UserTrackingMixin):
     section_number = Column(String(50), nullable=False)  # e.g., "3.2.1"
     section_title = Column(String(512), nullable=False)
     section_level = Column(Integer, nullable=False)  # Depth in ToC
-    parent_section_id = Column(Integer, ForeignKey("session_sections.id"), nullable=True)
+    parent_section_id = Column(
+        Integer,
+        ForeignKey("session_sections.id"),
+        nullable=True,
+        index=True,
+    )
 
     # Status
     status = Column(
-        Enum(SectionStatus),
+        Enum(
+            SectionStatus,
+            name="sectionstatus",
+            native_enum=True,
+            create_constraint=False,
+        ),
         default=SectionStatus.PENDING,
         nullable=False,
         index=True,
@@ -94,6 +106,11 @@ class SessionSection(Base, IDMixin, TimestampMixin, UserTrackingMixin):
         cascade="all, delete-orphan",
     )
 
+    # Serves the per-session section board, optionally filtered by status
+    __table_args__ = (
+        Index("ix_sections_session_status", session_id, status),
+    )
+
     def __repr__(self) -> str:
         return f"<SessionSection(id={self.id}, number='{self.section_number}', title='{self.section_title}')>"
 
@@ -109,8 +126,13 @@ class SectionCandidate(Base, IDMixin, TimestampMixin):
     section = relationship("SessionSection", back_populates="candidates")
 
     # Source chunk
-    chunk_id = Column(Integer, ForeignKey("document_chunks.id"), nullable=False)
-    chunk = relationship("DocumentChunk")
+    chunk_id = Column(
+        Integer,
+        ForeignKey("document_chunks.id"),
+        nullable=False,
+        index=True,
+    )
+    chunk = relationship("DocumentChunk", lazy="joined")
 
     # Relevance scoring
     relevance_score = Column(Float, nullable=False)  # From vector search
@@ -119,12 +141,23 @@ class SectionCandidate(Base, IDMixin, TimestampMixin):
     # Review
     is_selected = Column(Boolean, default=False)  # Selected by reviewer
     reviewer_decision = Column(
-        Enum(ReviewDecision),
+        Enum(
+            ReviewDecision,
+            name="reviewdecision",
+            native_enum=True,
+            create_constraint=False,
+        ),
         default=ReviewDecision.PENDING,
         nullable=False,
+        index=True,
     )
     reviewer_notes = Column(Text, nullable=True)
 
+    # Serves the per-section candidate listing in rank order
+    __table_args__ = (
+        Index("ix_candidates_section_rank", section_id, rank),
+    )
+
     def __repr__(self) -> str:
         return f"<SectionCandidate(id={self.id}, section={self.section_id}, rank={self.rank})>"
 
@@ -144,11 +177,13 @@ class ContentConflict(Base, IDMixin, TimestampMixin):
         Integer,
         ForeignKey("section_candidates.id"),
         nullable=False,
+        index=True,
     )
     candidate_b_id = Column(
         Integer,
         ForeignKey("section_candidates.id"),
         nullable=False,
+        index=True,
     )
     candidate_a = relationship(
         "SectionCandidate",
@@ -169,6 +204,17 @@ class ContentConflict(Base, IDMixin, TimestampMixin):
     resolution_notes = Column(Text, nullable=True)
     resolved_by = Column(String(255), nullable=True)
 
+    # Serves the per-section conflict listing ordered by confidence without a
+    # sort step; the included columns cover the common projections.
+    __table_args__ = (
+        Index(
+            "ix_conflict_section_conf",
+            section_id,
+            confidence.desc(),
+            postgresql_include=["conflict_type", "is_resolved"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<ContentConflict(id={self.id}, type='{self.conflict_type}', resolved={self.is_resolved})>"
 
@@ -180,12 +226,22 @@ class FigureSuggestion(Base, IDMixin, TimestampMixin):
     __tablename__ = "figure_suggestions"
 
     # Section relationship
-    section_id = Column(Integer, ForeignKey("session_sections.id"), nullable=False)
+    section_id = Column(
+        Integer,
+        ForeignKey("session_sections.id"),
+        nullable=False,
+        index=True,
+    )
     section = relationship("SessionSection", back_populates="figure_suggestions")
 
     # Figure reference
-    figure_id = Column(Integer, ForeignKey("document_figures.id"), nullable=False)
-    figure = relationship("DocumentFigure")
+    figure_id = Column(
+        Integer,
+        ForeignKey("document_figures.id"),
+        nullable=False,
+        index=True,
+    )
+    figure = relationship("DocumentFigure", lazy="joined")
 
     # Suggestion details
     relevance_score = Column(Float, nullable=False)
@@ -196,9 +252,15 @@ class FigureSuggestion(Base, IDMixin, TimestampMixin):
     is_approved = Column(Boolean, default=False)
     is_mandatory = Column(Boolean, default=False)  # Marked as required by reviewer
     reviewer_decision = Column(
-        Enum(ReviewDecision),
+        Enum(
+            ReviewDecision,
+            name="reviewdecision",
+            native_enum=True,
+            create_constraint=False,
+        ),
         default=ReviewDecision.PENDING,
         nullable=False,
+        index=True,
     )
     final_caption = Column(Text, nullable=True)
 
@@ -222,8 +284,8 @@ class OutputDocument(Base, IDMixin, TimestampMixin, UserTrackingMixin):
     target_persona = Column(String(100), nullable=True)  # crane operator, etc.
     version = Column(String(50), default="1.0")
 
-    # Content
-    content_json = Column(JSON, nullable=True)  # Structured content
+    # Content (deferred; load with undefer() when needed)
+    content_json = deferred(Column(JSONB, nullable=True))  # Structured content
     is_finalized = Column(Boolean, default=False)
 
     # Output files
@@ -231,14 +293,25 @@ class OutputDocument(Base, IDMixin, TimestampMixin, UserTrackingMixin):
     pdf_path = Column(String(1024), nullable=True)
 
     # Metadata
-    changelog = Column(JSON, nullable=True)  # Version history
+    changelog = deferred(Column(JSONB, nullable=True))  # Version history
     approval_status = Column(String(50), default="draft")
     approved_by = Column(String(255), nullable=True)
-    approved_at = Column(String(50), nullable=True)
+    approved_at = Column(DateTime(timezone=True), nullable=True)
 
     # Traceability
-    source_document_ids = Column(JSON, nullable=True)  # List of source doc IDs used
-    section_ids = Column(JSON, nullable=True)  # List of session section IDs
+    source_document_ids = Column(JSONB, nullable=True)  # List of source doc IDs used
+    section_ids = Column(JSONB, nullable=True)  # List of session section IDs
+
+    # Serve per-session dashboards ordered by approval time, and "outputs
+    # built from source document X" containment lookups
+    __table_args__ = (
+        Index("ix_output_docs_session_approved", session_id, approved_at),
+        Index(
+            "ix_outputs_source_docs_gin",
+            source_document_ids,
+            postgresql_using="gin",
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<OutputDocument(id={self.id}, title='{self.title}', version='{self.version}')>"
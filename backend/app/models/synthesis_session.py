@@ -6,10 +6,10 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
-    JSON,
     ForeignKey,
     Boolean,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -28,14 +28,14 @@ class SynthesisSession(Base, IDMixin, TimestampMixin, UserTrackingMixin):
     status = Column(String(50), default="created", nullable=False, index=True)  # created, analyzing, inventory_ready, reviewing, completed
 
     # Source documents
-    source_filenames = Column(JSON, nullable=False)  # List of filenames to synthesize
+    source_filenames = Column(JSONB, nullable=False)  # List of filenames to synthesize
 
     # Structure analysis
-    document_structures = Column(JSON, nullable=True)  # Analysis results
-    inventory_table = Column(JSON, nullable=True)  # Final table of contents
+    document_structures = Column(JSONB, nullable=True)  # Analysis results
+    inventory_table = Column(JSONB, nullable=True)  # Final table of contents
 
     # User selections
-    selected_paragraphs = Column(JSON, nullable=True)  # {section_title: [paragraph_ids]}
+    selected_paragraphs = Column(JSONB, nullable=True)  # {section_title: [paragraph_ids]}
 
     # Generated document
     synthesis_document = Column(Text, nullable=True)  # Final markdown document
@@ -59,7 +59,12 @@ class SynthesisParagraph(Base, IDMixin, TimestampMixin):
     __tablename__ = "synthesis_paragraphs"
 
     # Session relationship
-    session_id = Column(Integer, ForeignKey("synthesis_sessions.id"), nullable=False)
+    session_id = Column(
+        Integer,
+        ForeignKey("synthesis_sessions.id"),
+        nullable=False,
+        index=True,
+    )
     session = relationship("SynthesisSession", back_populates="paragraphs")
 
     # Section information
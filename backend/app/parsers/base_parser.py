@@ -5,7 +5,37 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional
 from io import BytesIO
-import json
+
+
+# Strict JSON schema for LLM chunking responses, so the model cannot return
+# free-form or malformed output that would need repair
+CHUNKS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "chunks",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "chunks": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "content": {"type": "string"},
+                            "start_index": {"type": "integer"},
+                            "end_index": {"type": "integer"},
+                        },
+                        "required": ["content", "start_index", "end_index"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["chunks"],
+            "additionalProperties": False,
+        },
+    },
+}
 
 
 @dataclass
@@ -295,18 +325,13 @@ Example format:
                 system_message = """You are an expert at analyzing document structure and identifying logical text boundaries.
 Your task is to split text into meaningful, complete chunks at the paragraph level."""
 
-                response = await openai_service.generate_completion(
+                llm_chunks = await self._request_llm_chunks(
+                    openai_service,
                     prompt=prompt,
                     system_message=system_message,
-                    temperature=0.2,  # Low temperature for consistent chunking
                     max_tokens=4000,
-                    response_format={"type": "json_object"}
                 )
                 
-                # Parse LLM response
-                result = json.loads(response)
-                llm_chunks = result.get('chunks', [])
-                
                 if not isinstance(llm_chunks, list):
                     logger.warning("LLM did not return chunks array, using fallback")
                     llm_chunks = []
@@ -415,6 +440,49 @@ Your task is to split text into meaningful, complete chunks at the paragraph lev
         
         return unique_chunks
     
+    async def _request_llm_chunks(
+        self,
+        openai_service,
+        prompt: str,
+        system_message: str,
+        max_tokens: int,
+    ) -> list:
+        """
+        Ask the LLM for chunks constrained to CHUNKS_RESPONSE_FORMAT.
+
+        The response is parsed directly; if it is still not valid JSON the
+        request is retried once before giving up.
+
+        Args:
+            openai_service: OpenAIService instance for LLM calls
+            prompt: Chunking prompt
+            system_message: System message for the request
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            The "chunks" value from the response
+        """
+        from app.core.json import loads as json_loads
+        from app.core.logging import get_logger
+        logger = get_logger(__name__)
+
+        for attempt in range(2):
+            response = await openai_service.generate_completion(
+                prompt=prompt,
+                system_message=system_message,
+                temperature=0.2,  # Low temperature for consistent chunking
+                max_tokens=max_tokens,
+                response_format=CHUNKS_RESPONSE_FORMAT,
+            )
+            try:
+                return json_loads(response).get('chunks', [])
+            except ValueError:
+                logger.warning(
+                    f"Invalid JSON from LLM chunking (attempt {attempt + 1}): {response[:500]!r}"
+                )
+                if attempt:
+                    raise
+
     async def _chunk_remaining_text(
         self,
         text: str,
@@ -439,17 +507,13 @@ Only include complete, logical chunks. You may ignore incomplete text at the end
 
 Return ONLY valid JSON."""
 
-            response = await openai_service.generate_completion(
+            llm_chunks = await self._request_llm_chunks(
+                openai_service,
                 prompt=prompt,
                 system_message="Split text into logical paragraph chunks.",
-                temperature=0.2,
                 max_tokens=2000,
-                response_format={"type": "json_object"}
             )
             
-            result = json.loads(response)
-            llm_chunks = result.get('chunks', [])
-            
             for llm_chunk in llm_chunks:
                 if isinstance(llm_chunk, dict):
                     content = llm_chunk.get('content', '').strip()
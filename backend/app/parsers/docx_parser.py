@@ -1,13 +1,16 @@
 """
 DOCX document parser using python-docx.
 """
+import asyncio
 import io
-from typing import Optional
+import struct
+from typing import Iterator, Optional
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
+from lxml import etree
 
 from app.parsers.base_parser import (
     BaseParser,
@@ -15,10 +18,83 @@ from app.parsers.base_parser import (
     ParsedChunk,
     ParsedFigure,
 )
+from app.parsers.process_pool import get_parser_pool
+from app.core.hashing import content_digest
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+W_NAMESPACE = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+W_BR = f'{{{W_NAMESPACE}}}br'
+W_CR = f'{{{W_NAMESPACE}}}cr'
+W_HYPERLINK = f'{{{W_NAMESPACE}}}hyperlink'
+W_NO_BREAK_HYPHEN = f'{{{W_NAMESPACE}}}noBreakHyphen'
+W_P = f'{{{W_NAMESPACE}}}p'
+W_R = f'{{{W_NAMESPACE}}}r'
+W_PTAB = f'{{{W_NAMESPACE}}}ptab'
+W_T = f'{{{W_NAMESPACE}}}t'
+W_TAB = f'{{{W_NAMESPACE}}}tab'
+W_TC = f'{{{W_NAMESPACE}}}tc'
+W_TR = f'{{{W_NAMESPACE}}}tr'
+W_TYPE = f'{{{W_NAMESPACE}}}type'
+
+# Style ID of a paragraph, read straight from its XML
+_PSTYLE_XPATH = etree.XPath(
+    './w:pPr/w:pStyle/@w:val',
+    namespaces={'w': W_NAMESPACE},
+)
+
+
+def _peek_image_size(blob: bytes) -> Optional[tuple[int, int]]:
+    """
+    Read image dimensions from the header bytes without decoding the image.
+
+    Args:
+        blob: Raw image bytes
+
+    Returns:
+        (width, height) tuple, or None if the format is not recognised
+    """
+    if blob[:8] == b'\x89PNG\r\n\x1a\n' and len(blob) >= 24:
+        return struct.unpack('>II', blob[16:24])
+
+    if blob[:6] in (b'GIF87a', b'GIF89a') and len(blob) >= 10:
+        return struct.unpack('<HH', blob[6:10])
+
+    if blob[:2] == b'\xff\xd8':
+        # Walk JPEG segments up to the first start-of-frame marker
+        pos = 2
+        while pos + 9 < len(blob):
+            if blob[pos] != 0xFF:
+                return None
+            marker = blob[pos + 1]
+            if marker == 0xFF:
+                pos += 1
+                continue
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>HH', blob[pos + 5:pos + 9])
+                return width, height
+            (segment_length,) = struct.unpack('>H', blob[pos + 2:pos + 4])
+            pos += 2 + segment_length
+        return None
+
+    if blob[:4] == b'RIFF' and blob[8:12] == b'WEBP' and len(blob) >= 30:
+        chunk = blob[12:16]
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', blob[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L':
+            bits = int.from_bytes(blob[21:25], 'little')
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b'VP8X':
+            return (
+                int.from_bytes(blob[24:27], 'little') + 1,
+                int.from_bytes(blob[27:30], 'little') + 1,
+            )
+
+    return None
+
 
 class DOCXParser(BaseParser):
     """Parser for DOCX documents."""
@@ -52,6 +128,9 @@ class DOCXParser(BaseParser):
         """
         Parse a DOCX document.
 
+        The XML walk and image extraction are CPU-bound, so they run in the
+        shared parser process pool; LLM chunking stays on the event loop.
+
         Args:
             file_content: Raw DOCX bytes
             filename: Original filename
@@ -61,6 +140,59 @@ class DOCXParser(BaseParser):
         """
         logger.info(f"Parsing DOCX document: {filename}")
 
+        use_llm_chunking = bool(getattr(self, 'openai_service', None))
+
+        loop = asyncio.get_running_loop()
+        metadata, full_text, chunks, figures, current_section = (
+            await loop.run_in_executor(
+                get_parser_pool(),
+                _parse_docx_sync,
+                file_content,
+                self.max_chunk_size,
+                self.chunk_overlap,
+                self.extract_images,
+                not use_llm_chunking,
+            )
+        )
+
+        # Use LLM chunking if available, otherwise keep the chunks built above
+        if use_llm_chunking:
+            # Use LLM-based chunking for better paragraph boundaries
+            chunks = await self.chunk_text_with_llm(
+                full_text,
+                self.openai_service,
+                section_title=current_section,
+            )
+
+        logger.info(
+            f"Parsed DOCX: {len(chunks)} chunks, {len(figures)} figures"
+        )
+
+        return ParsedDocument(
+            filename=filename,
+            file_type='docx',
+            chunks=chunks,
+            figures=figures,
+            metadata=metadata,
+            full_text=full_text,
+            page_count=None,  # DOCX doesn't have explicit page count
+        )
+
+    def _parse_sync(
+        self,
+        file_content: bytes,
+        build_chunks: bool,
+    ) -> tuple[dict, str, list[ParsedChunk], list[ParsedFigure], Optional[str]]:
+        """
+        Do the CPU-bound part of parsing a DOCX document.
+
+        Args:
+            file_content: Raw DOCX bytes
+            build_chunks: Whether to build size-based chunks during the walk
+
+        Returns:
+            Tuple of (metadata, full text, chunks, figures, last section title)
+        """
         # Open document from bytes
         doc = Document(io.BytesIO(file_content))
 
@@ -77,125 +209,156 @@ class DOCXParser(BaseParser):
                 'version': cp.revision or '',
             }
 
-        # Extract text with structure
+        # Single pass over the body: collect full text and, when requested,
+        # build the chunks at the same time
         full_text_parts = []
+        chunks = []
+        chunk_index = 0
+        current_section = None
+
+        for text, current_section, is_heading in self._iter_blocks(doc):
+            if is_heading:
+                full_text_parts.append(f"\n## {text}\n")
+                continue
+
+            full_text_parts.append(text)
+
+            if build_chunks:
+                for chunk in self.chunk_text(text, section_title=current_section):
+                    chunk.chunk_index = chunk_index
+                    chunk_index += 1
+                    chunks.append(chunk)
+
+        full_text = '\n'.join(full_text_parts)
+
+        # Extract images
+        figures = []
+        if self.extract_images:
+            figures = self._extract_images(doc)
+
+        return metadata, full_text, chunks, figures, current_section
+
+    def _iter_blocks(self, doc: Document) -> Iterator[tuple[str, Optional[str], bool]]:
+        """
+        Walk the document body once, yielding the text of each block.
+
+        Args:
+            doc: Document object
+
+        Yields:
+            (text, current section title, is_heading) for each non-empty
+            paragraph or table
+        """
+        heading_style_ids = self._heading_style_ids(doc)
         current_section = None
 
         for element in doc.element.body:
             if isinstance(element, CT_P):
-                para = Paragraph(element, doc)
-                text = para.text.strip()
+                text = self._element_text(element).strip()
 
                 if not text:
                     continue
 
                 # Check if this is a heading
-                if para.style.name.startswith('Heading'):
+                style_ids = _PSTYLE_XPATH(element)
+                if style_ids and style_ids[0] in heading_style_ids:
                     current_section = text
-                    full_text_parts.append(f"\n## {text}\n")
-                else:
-                    full_text_parts.append(text)
+                    yield text, current_section, True
+                    continue
+
+                yield text, current_section, False
 
             elif isinstance(element, CT_Tbl):
                 # Handle tables
-                table = Table(element, doc)
-                table_text = self._extract_table_text(table)
-                if table_text:
-                    full_text_parts.append(table_text)
-
-        full_text = '\n'.join(full_text_parts)
-        
-        # Use LLM chunking if available, otherwise use regular chunking
-        if hasattr(self, 'openai_service') and self.openai_service:
-            # Use LLM-based chunking for better paragraph boundaries
-            chunks = await self.chunk_text_with_llm(
-                full_text,
-                self.openai_service,
-                section_title=current_section,
-            )
-        else:
-            # Fallback to regular chunking
-            chunks = []
-            chunk_index = 0
-            current_section = None
-            for element in doc.element.body:
-                if isinstance(element, CT_P):
-                    para = Paragraph(element, doc)
-                    text = para.text.strip()
-
-                    if not text:
-                        continue
+                text = self._extract_table_text(element)
+                if text:
+                    yield text, current_section, False
 
-                    # Check if this is a heading
-                    if para.style.name.startswith('Heading'):
-                        current_section = text
-                    else:
-                        # Create chunks for paragraph
-                        para_chunks = self.chunk_text(
-                            text,
-                            section_title=current_section,
-                        )
+    def _heading_style_ids(self, doc: Document) -> frozenset[str]:
+        """
+        Collect the IDs of paragraph styles whose name marks a heading.
 
-                        # Update chunk indices
-                        for chunk in para_chunks:
-                            chunk.chunk_index = chunk_index
-                            chunk_index += 1
-                            chunks.append(chunk)
-                
-                elif isinstance(element, CT_Tbl):
-                    # Handle tables
-                    table = Table(element, doc)
-                    table_text = self._extract_table_text(table)
-                    if table_text:
-                        # Create chunks for table
-                        table_chunks = self.chunk_text(
-                            table_text,
-                            section_title=current_section,
-                        )
+        Args:
+            doc: Document object
 
-                        for chunk in table_chunks:
-                            chunk.chunk_index = chunk_index
-                            chunk_index += 1
-                            chunks.append(chunk)
+        Returns:
+            Frozenset of heading style IDs
+        """
+        return frozenset(
+            style.style_id
+            for style in doc.styles
+            if style.type == WD_STYLE_TYPE.PARAGRAPH
+            and style.name
+            and style.name.startswith('Heading')
+        )
 
-        # Extract images
-        figures = []
-        if self.extract_images:
-            figures = await self._extract_images(doc)
+    def _element_text(self, element) -> str:
+        """
+        Join the text runs of a paragraph element without building wrappers.
 
-        logger.info(
-            f"Parsed DOCX: {len(chunks)} chunks, {len(figures)} figures"
-        )
+        Mirrors python-docx paragraph text: only the paragraph's own runs
+        (directly or inside a hyperlink) are read, so text boxes nested in
+        drawings are not picked up. Tabs become '\\t' and line breaks '\\n'.
 
-        return ParsedDocument(
-            filename=filename,
-            file_type='docx',
-            chunks=chunks,
-            figures=figures,
-            metadata=metadata,
-            full_text=full_text,
-            page_count=None,  # DOCX doesn't have explicit page count
-        )
+        Args:
+            element: Paragraph XML element
 
-    def _extract_table_text(self, table: Table) -> str:
+        Returns:
+            Paragraph text
+        """
+        parts = []
+        for child in element.iterchildren(W_R, W_HYPERLINK):
+            runs = child.iterchildren(W_R) if child.tag == W_HYPERLINK else (child,)
+            for run in runs:
+                for node in run.iterchildren(W_T, W_TAB, W_PTAB, W_BR, W_CR, W_NO_BREAK_HYPHEN):
+                    tag = node.tag
+                    if tag == W_T:
+                        parts.append(node.text or '')
+                    elif tag in (W_TAB, W_PTAB):
+                        parts.append('\t')
+                    elif tag == W_NO_BREAK_HYPHEN:
+                        parts.append('-')
+                    elif tag == W_CR or node.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+        return ''.join(parts)
+
+    def _extract_table_text(self, table: CT_Tbl) -> str:
         """
         Extract text from a table in readable format.
 
+        Each cell is read once, so horizontally merged cells are not repeated.
+        Vertically merged continuation cells repeat the text of the cell they
+        continue, as python-docx's row cells do.
+
         Args:
-            table: Table object
+            table: Table XML element
 
         Returns:
             Formatted table text
         """
         rows_text = []
-        for row in table.rows:
-            cells_text = [cell.text.strip() for cell in row.cells]
+        above: dict[int, str] = {}  # grid column -> text of the previous row's cell
+        for row in table.iterchildren(W_TR):
+            current: dict[int, str] = {}
+            cells_text = []
+            offset = row.grid_before
+            for cell in row.iterchildren(W_TC):
+                if cell.vMerge == 'continue':
+                    text = above.get(offset, '')
+                else:
+                    text = '\n'.join(
+                        self._element_text(p) for p in cell.iterchildren(W_P)
+                    ).strip()
+                current[offset] = text
+                cells_text.append(text)
+                offset += cell.grid_span
+            above = current
             if any(cells_text):  # Skip empty rows
                 rows_text.append(' | '.join(cells_text))
 
         return '\n'.join(rows_text)
 
-    async def _extract_images(self, doc: Document) -> list[ParsedFigure]:
+    def _extract_images(self, doc: Document) -> list[ParsedFigure]:
         """
         Extract images from DOCX document.
 
@@ -207,19 +370,30 @@ class DOCXParser(BaseParser):
         """
         figures = []
         figure_index = 0
+        seen_digests = set()
 
-        # Iterate through all relationships to find images
+        # Iterate through all relationships to find embedded images
         for rel in doc.part.rels.values():
-            if "image" in rel.target_ref:
+            if rel.reltype == RT.IMAGE and not rel.is_external:
                 try:
                     image_part = rel.target_part
                     image_bytes = image_part.blob
+
+                    # The same image (logos, headers) is often embedded
+                    # several times; emit each distinct image once
+                    digest = content_digest(image_bytes)
+                    if digest in seen_digests:
+                        continue
+                    seen_digests.add(digest)
                     image_ext = image_part.content_type.split('/')[-1]
 
-                    # Try to get dimensions
-                    from PIL import Image
-                    img = Image.open(io.BytesIO(image_bytes))
-                    width, height = img.size
+                    # Read dimensions from the header, falling back to PIL
+                    # for formats the header probe does not know
+                    size = _peek_image_size(image_bytes)
+                    if size is None:
+                        from PIL import Image
+                        size = Image.open(io.BytesIO(image_bytes)).size
+                    width, height = size
 
                     figures.append(
                         ParsedFigure(
@@ -237,3 +411,23 @@ class DOCXParser(BaseParser):
                     continue
 
         return figures
+
+
+def _parse_docx_sync(
+    file_content: bytes,
+    max_chunk_size: int,
+    chunk_overlap: int,
+    extract_images: bool,
+    build_chunks: bool,
+) -> tuple[dict, str, list[ParsedChunk], list[ParsedFigure], Optional[str]]:
+    """
+    Process pool entry point for DOCXParser._parse_sync.
+
+    Kept at module level so it can be pickled by reference.
+    """
+    parser = DOCXParser(
+        max_chunk_size=max_chunk_size,
+        chunk_overlap=chunk_overlap,
+        extract_images=extract_images,
+    )
+    return parser._parse_sync(file_content, build_chunks)
@@ -1,6 +1,7 @@
 """
 PDF document parser using PyMuPDF (fitz).
 """
+import asyncio
 import io
 from typing import Optional
 import fitz  # PyMuPDF
@@ -12,6 +13,7 @@ from app.parsers.base_parser import (
     ParsedChunk,
     ParsedFigure,
 )
+from app.parsers.process_pool import get_parser_pool
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -52,6 +54,9 @@ class PDFParser(BaseParser):
         """
         Parse a PDF document.
 
+        Text and image extraction run in the shared parser process pool;
+        LLM chunking stays on the event loop.
+
         Args:
             file_content: Raw PDF bytes
             filename: Original filename
@@ -61,19 +66,75 @@ class PDFParser(BaseParser):
         """
         logger.info(f"Parsing PDF document: {filename}")
 
+        use_llm_chunking = bool(getattr(self, 'openai_service', None))
+
+        loop = asyncio.get_running_loop()
+        metadata, full_text, chunks, figures, page_count = (
+            await loop.run_in_executor(
+                get_parser_pool(),
+                _parse_pdf_sync,
+                file_content,
+                self.max_chunk_size,
+                self.chunk_overlap,
+                self.extract_images,
+                self.min_image_size,
+                not use_llm_chunking,
+            )
+        )
+
+        # Use LLM chunking if available, otherwise keep the regular chunks
+        if use_llm_chunking:
+            # Use LLM-based chunking for better paragraph boundaries
+            chunks = await self.chunk_text_with_llm(
+                full_text,
+                self.openai_service,
+                page_number=1,  # Will be set per chunk if needed
+            )
+
+        logger.info(
+            f"Parsed PDF: {len(chunks)} chunks, {len(figures)} figures, "
+            f"{page_count} pages"
+        )
+
+        return ParsedDocument(
+            filename=filename,
+            file_type='pdf',
+            chunks=chunks,
+            figures=figures,
+            metadata=metadata,
+            full_text=full_text,
+            page_count=page_count,
+        )
+
+    def _parse_sync(
+        self,
+        file_content: bytes,
+        build_chunks: bool,
+    ) -> tuple[dict, str, list[ParsedChunk], list[ParsedFigure], int]:
+        """
+        Do the CPU-bound part of parsing a PDF document.
+
+        Args:
+            file_content: Raw PDF bytes
+            build_chunks: Whether to build size-based chunks per page
+
+        Returns:
+            Tuple of (metadata, full text, chunks, figures, page count)
+        """
         # Open PDF from bytes
         pdf_document = fitz.open(stream=file_content, filetype="pdf")
 
         try:
             # Extract metadata
+            page_count = len(pdf_document)
             metadata = self.extract_metadata(pdf_document.metadata)
-            metadata['page_count'] = len(pdf_document)
+            metadata['page_count'] = page_count
 
             # Extract text and create chunks
             chunks = []
             full_text_parts = []
 
-            for page_num in range(len(pdf_document)):
+            for page_num in range(page_count):
                 page = pdf_document[page_num]
                 page_text = page.get_text()
 
@@ -81,20 +142,9 @@ class PDFParser(BaseParser):
                     full_text_parts.append(page_text)
 
             full_text = '\n\n'.join(full_text_parts)
-            
-            # Use LLM chunking if available, otherwise use regular chunking
-            # Note: openai_service should be passed via a class attribute or parameter
-            # For now, we'll use regular chunking and add LLM chunking option later
-            # This will be handled at the service level
-            if hasattr(self, 'openai_service') and self.openai_service:
-                # Use LLM-based chunking for better paragraph boundaries
-                chunks = await self.chunk_text_with_llm(
-                    full_text,
-                    self.openai_service,
-                    page_number=1,  # Will be set per chunk if needed
-                )
-            else:
-                # Fallback to regular chunking
+
+            if build_chunks:
+                # Regular chunking, used when no LLM service is available
                 chunk_index = 0
                 for page_num, page_text in enumerate(full_text_parts, 1):
                     page_chunks = self.chunk_text(
@@ -109,27 +159,14 @@ class PDFParser(BaseParser):
             # Extract figures/images
             figures = []
             if self.extract_images:
-                figures = await self._extract_images(pdf_document)
+                figures = self._extract_images(pdf_document)
 
-            logger.info(
-                f"Parsed PDF: {len(chunks)} chunks, {len(figures)} figures, "
-                f"{len(pdf_document)} pages"
-            )
-
-            return ParsedDocument(
-                filename=filename,
-                file_type='pdf',
-                chunks=chunks,
-                figures=figures,
-                metadata=metadata,
-                full_text=full_text,
-                page_count=len(pdf_document),
-            )
+            return metadata, full_text, chunks, figures, page_count
 
         finally:
             pdf_document.close()
 
-    async def _extract_images(self, pdf_document: fitz.Document) -> list[ParsedFigure]:
+    def _extract_images(self, pdf_document: fitz.Document) -> list[ParsedFigure]:
         """
         Extract images from PDF document.
 
@@ -217,3 +254,25 @@ class PDFParser(BaseParser):
                     return line_stripped[:200]  # Limit caption length
 
         return None
+
+
+def _parse_pdf_sync(
+    file_content: bytes,
+    max_chunk_size: int,
+    chunk_overlap: int,
+    extract_images: bool,
+    min_image_size: int,
+    build_chunks: bool,
+) -> tuple[dict, str, list[ParsedChunk], list[ParsedFigure], int]:
+    """
+    Process pool entry point for PDFParser._parse_sync.
+
+    Kept at module level so it can be pickled by reference.
+    """
+    parser = PDFParser(
+        max_chunk_size=max_chunk_size,
+        chunk_overlap=chunk_overlap,
+        extract_images=extract_images,
+        min_image_size=min_image_size,
+    )
+    return parser._parse_sync(file_content, build_chunks)
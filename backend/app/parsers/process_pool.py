@@ -0,0 +1,35 @@
+"""
+Shared process pool for CPU-bound document parsing.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parser_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool used to parse documents off the event loop.
+
+    The pool is created on first use and shared by all parser instances.
+
+    Returns:
+        ProcessPoolExecutor sized by the parser_workers setting
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.parser_workers or os.cpu_count(),
+        )
+    return _pool
+
+
+def shutdown_parser_pool() -> None:
+    """Shut down the parser pool, if one was created, without waiting for workers."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
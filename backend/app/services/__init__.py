@@ -1,6 +1,6 @@
 """Business logic services."""
 from app.services.openai_service import OpenAIService
-from app.services.vector_store import VectorStore
+from app.services.vector_store import VectorStore, get_vector_store
 from app.services.storage_service import StorageService
 from app.services.indexing_service import IndexingService
 from app.services.synthesis_service import SynthesisService
@@ -8,6 +8,7 @@ from app.services.synthesis_service import SynthesisService
 __all__ = [
     "OpenAIService",
     "VectorStore",
+    "get_vector_store",
     "StorageService",
     "IndexingService",
     "SynthesisService",
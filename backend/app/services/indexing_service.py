@@ -1,19 +1,34 @@
 """
 Service for indexing documents from the data folder into local HNSW vector store.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import asdict
 from pathlib import Path
-import hashlib
+import asyncio
+import os
+
+import numpy as np
+import xxhash
 
 from app.services.storage_service import StorageService
 from app.services.openai_service import OpenAIService
-from app.services.vector_store import VectorStore
-from app.parsers import ParserFactory
+from app.services.vector_store import get_vector_store
+from app.parsers import ParserFactory, ParsedChunk, ParsedDocument
 from app.core.config import settings
+from app.core.json import dumps as json_dumps, loads as json_loads
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Texts per embedding request when embedding chunks across documents
+EMBEDDING_BATCH_SIZE = 256
+
+# File extensions picked up from the data folder
+INDEXED_EXTENSIONS = frozenset({".pdf", ".docx", ".doc"})
+
+# Records the content hash and vector IDs of each indexed file
+MANIFEST_FILENAME = ".index_manifest.json"
+
 
 class IndexingService:
     """Service for processing and indexing documents."""
@@ -22,8 +37,14 @@ class IndexingService:
         """Initialize indexing service."""
         self.storage_service = StorageService()
         self.openai_service = OpenAIService()
-        self.vector_store = VectorStore(dimension=1536)  # ada-002 dimension
+        self.vector_store = get_vector_store()
         self.parser_factory = ParserFactory()
+        self.manifest_path = self.storage_service.data_dir / MANIFEST_FILENAME
+        self.chunk_cache_dir = (
+            Path(settings.chunk_cache_dir)
+            if settings.chunk_cache_dir
+            else self.storage_service.data_dir / ".chunk_cache"
+        )
 
     async def create_index_if_not_exists(self) -> bool:
         """
@@ -66,11 +87,14 @@ class IndexingService:
             all_files = []
 
             if data_dir.exists():
-                for file_path in data_dir.iterdir():
-                    if file_path.is_file():
-                        ext = file_path.suffix.lower()
-                        if ext in [".pdf", ".docx", ".doc"]:
-                            all_files.append(file_path)
+                # scandir reports the entry type without a stat call per file
+                with os.scandir(data_dir) as entries:
+                    all_files = [
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.is_file()
+                        and os.path.splitext(entry.name)[1].lower() in INDEXED_EXTENSIONS
+                    ]
 
             if not all_files:
                 logger.warning("No documents found in data folder")
@@ -85,97 +109,172 @@ class IndexingService:
 
             total_chunks = 0
             processed_docs = 0
+            skipped_docs = 0
             failed_docs = []
 
-            # Process each document
-            for file_path in all_files:
-                try:
-                    logger.info(f"Processing document: {file_path.name}")
+            manifest = await asyncio.to_thread(self._load_manifest)
 
-                    # Read file
-                    file_content = file_path.read_bytes()
+            # Parse and embed as a pipeline. Documents are parsed concurrently
+            # (LLM chunking is network-bound) and queued as they finish; the
+            # embedder packs their chunks into full-sized requests and sends
+            # each one as soon as it fills, overlapping with ongoing parsing.
+            semaphore = asyncio.Semaphore(settings.index_concurrency)
+            parsed_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.index_concurrency)
+            parsed_docs = []
 
-                    # Parse document
-                    parser = self.parser_factory.get_parser(file_path.name)
-                    # Pass openai_service to parser for LLM chunking
-                    parser.openai_service = self.openai_service
-                    parsed_doc = await parser.parse(file_content, file_path.name)
+            async def parse_with_limit(file_path: Path) -> bool:
+                async with semaphore:
+                    # Read file off the event loop
+                    file_content = await asyncio.to_thread(file_path.read_bytes)
+                    content_hash = xxhash.xxh128_hexdigest(file_content)
 
-                    if not parsed_doc.chunks:
-                        logger.warning(f"No chunks extracted from {file_path.name}")
-                        continue
-
-                    # Generate embeddings for all chunks
-                    chunk_texts = [chunk.content for chunk in parsed_doc.chunks]
-                    logger.info(
-                        f"Generating embeddings for {len(chunk_texts)} chunks from {file_path.name}"
-                    )
+                    if self._is_unchanged(
+                        manifest.get(file_path.name), content_hash, session_id
+                    ):
+                        logger.info(f"Skipped {file_path.name} (unchanged)")
+                        return False
 
-                    embeddings = await self.openai_service.generate_embeddings_batch(
-                        chunk_texts, batch_size=100  # Larger batch size for better performance
+                    parsed_doc = await self._parse_document(
+                        file_path, file_content, content_hash
                     )
 
-                    if len(embeddings) != len(parsed_doc.chunks):
-                        logger.warning(
-                            f"Embedding count mismatch: {len(embeddings)} embeddings "
-                            f"for {len(parsed_doc.chunks)} chunks"
-                        )
-                        # Skip this document if embedding generation failed
-                        continue
+                if parsed_doc is not None:
+                    await parsed_queue.put((file_path, content_hash, parsed_doc))
+                return True
 
-                    # Prepare chunks for indexing
-                    vector_ids = []
-                    vectors = []
-                    metadata_list = []
-                    
-                    for idx, (chunk, embedding) in enumerate(
-                        zip(parsed_doc.chunks, embeddings)
-                    ):
-                        # Create unique ID for chunk
-                        chunk_hash = hashlib.md5(
-                            f"{file_path.name}_{idx}_{chunk.content[:100]}".encode()
-                        ).hexdigest()
-                        vector_id = f"{chunk_hash}_{idx}"
-
-                        # Prepare metadata
-                        metadata = {
-                            "content": chunk.content,
-                            "filename": file_path.name,
-                            "page_number": chunk.page_number,
-                            "section_title": chunk.section_title,
-                            "chunk_index": chunk.chunk_index,
-                            "session_id": session_id if session_id else 0,
-                            "file_type": parsed_doc.file_type,
-                            "page_count": parsed_doc.page_count or 0,
-                        }
-
-                        vector_ids.append(vector_id)
-                        vectors.append(embedding)
-                        metadata_list.append(metadata)
-
-                    # Add vectors to HNSW index
-                    indexed_count = await self.vector_store.add_vectors(
-                        vectors=vectors,
-                        ids=vector_ids,
-                        metadata_list=metadata_list,
+            async def parse_all() -> List[Any]:
+                try:
+                    return await asyncio.gather(
+                        *(parse_with_limit(file_path) for file_path in all_files),
+                        return_exceptions=True,
                     )
+                finally:
+                    # Sentinel: no more parsed documents
+                    await parsed_queue.put(None)
 
-                    total_chunks += indexed_count
-                    processed_docs += 1
+            async def embed_parsed() -> List[Tuple[int, int, Any]]:
+                embed_semaphore = asyncio.Semaphore(settings.openai_concurrency)
 
-                    logger.info(
-                        f"Indexed {indexed_count} chunks from {file_path.name}"
-                    )
+                async def embed(batch: List[str]) -> np.ndarray:
+                    async with embed_semaphore:
+                        return await self.openai_service.generate_embeddings_batch(
+                            batch, batch_size=EMBEDDING_BATCH_SIZE
+                        )
 
-                except Exception as e:
-                    logger.error(f"Error processing {file_path.name}: {e}")
-                    failed_docs.append({"filename": file_path.name, "error": str(e)})
-                    continue
+                tasks = []
+                bounds = []  # (first row, end row) of each request
+                pending = []
+                offset = 0
+                while (item := await parsed_queue.get()) is not None:
+                    parsed_docs.append(item)
+                    pending.extend(chunk.content for chunk in item[2].chunks)
+                    while len(pending) >= EMBEDDING_BATCH_SIZE:
+                        tasks.append(asyncio.create_task(embed(pending[:EMBEDDING_BATCH_SIZE])))
+                        bounds.append((offset, offset + EMBEDDING_BATCH_SIZE))
+                        offset += EMBEDDING_BATCH_SIZE
+                        del pending[:EMBEDDING_BATCH_SIZE]
+                if pending:
+                    tasks.append(asyncio.create_task(embed(pending)))
+                    bounds.append((offset, offset + len(pending)))
+
+                logger.info(
+                    f"Generating embeddings in {len(tasks)} requests "
+                    f"for {len(parsed_docs)} documents"
+                )
+
+                # Wait for every request so none is left running on failure;
+                # a failed request only fails the documents it covers
+                batches = await asyncio.gather(*tasks, return_exceptions=True)
+                return [(start, end, batch) for (start, end), batch in zip(bounds, batches)]
+
+            embed_task = asyncio.create_task(embed_parsed())
+            results = await parse_all()
+
+            try:
+                batches = await embed_task
+            except Exception as e:
+                logger.error(f"Error generating embeddings: {e}")
+                batches = None
+                failed_docs.extend(
+                    {"filename": file_path.name, "error": str(e)}
+                    for file_path, _, _ in parsed_docs
+                )
+
+            for file_path, outcome in zip(all_files, results):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error processing {file_path.name}: {outcome}")
+                    failed_docs.append({"filename": file_path.name, "error": str(outcome)})
+                elif not outcome:
+                    skipped_docs += 1
+
+            # Embedding rows follow the order documents left the queue; each
+            # document is checked on its own rows so a bad request or vector
+            # only fails the documents it belongs to
+            indexable_docs = []
+            document_vectors = []
+            if batches is not None:
+                dimension = self.vector_store.dimension
+                row = 0
+                for file_path, content_hash, parsed_doc in parsed_docs:
+                    start, end = row, row + len(parsed_doc.chunks)
+                    row = end
+                    vectors, error = self._document_embeddings(batches, start, end, dimension)
+                    if error is not None:
+                        logger.warning(f"Skipping {file_path.name}: {error}")
+                        failed_docs.append({"filename": file_path.name, "error": error})
+                        continue
+                    indexable_docs.append((file_path, content_hash, parsed_doc))
+                    document_vectors.append(vectors)
+
+            if indexable_docs:
+                # Embedding rows are already in chunk order, so only IDs and
+                # metadata are built per document
+                vector_ids = []
+                metadata_list = []
+                stale_ids = []
+
+                for file_path, content_hash, parsed_doc in indexable_docs:
+                    doc_ids, doc_metadata = self._build_vector_entries(
+                        file_path, parsed_doc, session_id
+                    )
+                    vector_ids.extend(doc_ids)
+                    metadata_list.extend(doc_metadata)
+
+                    # Vectors from a previous version of the file are replaced
+                    previous = manifest.get(file_path.name)
+                    if previous:
+                        stale_ids.extend(previous["chunk_ids"])
+                    manifest[file_path.name] = {
+                        "content_hash": content_hash,
+                        "mtime": file_path.stat().st_mtime,
+                        "session_id": session_id,
+                        "chunk_ids": doc_ids,
+                    }
+
+                if stale_ids:
+                    await self.vector_store.delete_by_ids(stale_ids, persist=False)
+
+                # Add all vectors to the HNSW index in one write; add_vectors
+                # sizes the index for the whole batch, reusing deleted slots
+                total_chunks = await self.vector_store.add_vectors(
+                    vectors=np.concatenate(document_vectors),
+                    ids=vector_ids,
+                    metadata_list=metadata_list,
+                    persist=False,
+                )
+                processed_docs = len(indexable_docs)
+
+                # Save the index once for the whole run
+                await self.vector_store.persist()
+
+                if processed_docs:
+                    await asyncio.to_thread(self._save_manifest, manifest)
 
             result = {
                 "success": True,
                 "message": f"Processed {processed_docs} documents, indexed {total_chunks} chunks",
                 "processed": processed_docs,
+                "skipped": skipped_docs,
                 "failed": len(failed_docs),
                 "indexed_chunks": total_chunks,
                 "failed_documents": failed_docs,
@@ -191,6 +290,259 @@ class IndexingService:
             logger.error(f"Error in process_and_index_documents: {e}")
             raise
 
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the index manifest from the data folder.
+
+        Returns:
+            Mapping of filename to its content_hash, mtime, session_id and
+            chunk_ids; empty if no readable manifest exists
+        """
+        try:
+            return json_loads(self.manifest_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index manifest: {e}")
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Atomically write the index manifest to the data folder.
+
+        Args:
+            manifest: Mapping of filename to manifest entry
+        """
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp_path.write_text(json_dumps(manifest, indent=True), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def _is_unchanged(
+        self,
+        entry: Optional[Dict[str, Any]],
+        content_hash: str,
+        session_id: Optional[int],
+    ) -> bool:
+        """
+        Check whether a file is already indexed with its current content.
+
+        Args:
+            entry: Manifest entry for the file, if any
+            content_hash: xxh128 hex digest of the current file content
+            session_id: Session ID the vectors would be stored with
+
+        Returns:
+            True if the file can be skipped
+        """
+        if not entry:
+            return False
+        if entry["content_hash"] != content_hash or entry.get("session_id") != session_id:
+            return False
+        # The vector store may have been cleared since the manifest was written
+        return all(
+            chunk_id in self.vector_store.metadata for chunk_id in entry["chunk_ids"]
+        )
+
+    def _load_cached_chunks(
+        self,
+        filename: str,
+        content_hash: str,
+    ) -> Optional[ParsedDocument]:
+        """
+        Load previously chunked content for a file from the chunk cache.
+
+        Args:
+            filename: Name of the document
+            content_hash: xxh128 hex digest of the file content
+
+        Returns:
+            ParsedDocument with chunks only, or None on a cache miss
+        """
+        cache_path = self.chunk_cache_dir / f"{content_hash}.json"
+        try:
+            data = json_loads(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable chunk cache entry {cache_path.name}: {e}")
+            return None
+
+        # Record the hit for LRU eviction; atime updates may be disabled
+        os.utime(cache_path)
+
+        return ParsedDocument(
+            filename=filename,
+            file_type=data["file_type"],
+            chunks=[ParsedChunk(**chunk) for chunk in data["chunks"]],
+            figures=[],
+            metadata={},
+            page_count=data["page_count"],
+        )
+
+    def _store_cached_chunks(self, content_hash: str, parsed_doc: ParsedDocument) -> None:
+        """
+        Atomically write a document's chunks to the chunk cache.
+
+        Evicts the least recently used entries once the cache exceeds
+        chunk_cache_max_entries.
+
+        Args:
+            content_hash: xxh128 hex digest of the file content
+            parsed_doc: Parsed document whose chunks are cached
+        """
+        self.chunk_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "file_type": parsed_doc.file_type,
+            "page_count": parsed_doc.page_count,
+            "chunks": [asdict(chunk) for chunk in parsed_doc.chunks],
+        }
+        cache_path = self.chunk_cache_dir / f"{content_hash}.json"
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_text(json_dumps(data), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+        entries = list(self.chunk_cache_dir.glob("*.json"))
+        excess = len(entries) - settings.chunk_cache_max_entries
+        if excess > 0:
+            entries.sort(key=lambda path: path.stat().st_atime)
+            for path in entries[:excess]:
+                path.unlink(missing_ok=True)
+
+    async def _parse_document(
+        self,
+        file_path: Path,
+        file_content: bytes,
+        content_hash: str,
+    ) -> Optional[ParsedDocument]:
+        """
+        Parse a single document, reusing cached chunks for known content.
+
+        Args:
+            file_path: Path of the document in the data folder
+            file_content: Raw file bytes
+            content_hash: xxh128 hex digest of file_content
+
+        Returns:
+            ParsedDocument, or None if no chunks were extracted
+        """
+        parsed_doc = await asyncio.to_thread(
+            self._load_cached_chunks, file_path.name, content_hash
+        )
+        if parsed_doc is not None:
+            logger.info(f"Using cached chunks for {file_path.name}")
+            return parsed_doc
+
+        logger.info(f"Processing document: {file_path.name}")
+
+        # Parse document
+        parser = self.parser_factory.get_parser(file_path.name)
+        # Pass openai_service to parser for LLM chunking
+        parser.openai_service = self.openai_service
+        parsed_doc = await parser.parse(file_content, file_path.name)
+
+        if not parsed_doc.chunks:
+            logger.warning(f"No chunks extracted from {file_path.name}")
+            return None
+
+        try:
+            await asyncio.to_thread(self._store_cached_chunks, content_hash, parsed_doc)
+        except OSError as e:
+            logger.warning(f"Could not cache chunks for {file_path.name}: {e}")
+
+        return parsed_doc
+
+    def _document_embeddings(
+        self,
+        batches: List[Tuple[int, int, Any]],
+        start: int,
+        end: int,
+        dimension: int,
+    ) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        """
+        Collect and validate the embedding rows of one document.
+
+        Args:
+            batches: (first row, end row, result) of each embedding request,
+                where result is an array or the exception the request raised
+            start: First row of the document
+            end: End row (exclusive) of the document
+            dimension: Expected embedding dimension
+
+        Returns:
+            Tuple of (embeddings of shape (end - start, dimension), None), or
+            (None, error message) if the document cannot be indexed
+        """
+        parts = []
+        for batch_start, batch_end, batch in batches:
+            if batch_end <= start or batch_start >= end:
+                continue
+            if isinstance(batch, BaseException):
+                return None, f"Embedding request failed: {batch}"
+            if batch.shape != (batch_end - batch_start, dimension):
+                return None, (
+                    f"Invalid embeddings: shape {batch.shape} for expected "
+                    f"{(batch_end - batch_start, dimension)}"
+                )
+            first = max(start, batch_start) - batch_start
+            last = min(end, batch_end) - batch_start
+            parts.append(batch[first:last])
+
+        vectors = np.concatenate(parts) if parts else np.empty((0, dimension), dtype=np.float32)
+        if vectors.shape != (end - start, dimension):
+            return None, f"Invalid embeddings: {vectors.shape[0]} rows for {end - start} chunks"
+        # Skip the document rather than corrupt the HNSW graph
+        if not np.isfinite(vectors).all():
+            return None, "Invalid embeddings: non-finite values"
+        return vectors, None
+
+    def _build_vector_entries(
+        self,
+        file_path: Path,
+        parsed_doc: ParsedDocument,
+        session_id: Optional[int],
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Build vector IDs and metadata for the chunks of a parsed document.
+
+        Args:
+            file_path: Path of the document in the data folder
+            parsed_doc: Parsed document
+            session_id: Optional session ID stored with each vector
+
+        Returns:
+            Tuple of (vector IDs, metadata dicts), in chunk order
+        """
+        chunks = parsed_doc.chunks
+        name_prefix = f"{file_path.name}_".encode()
+
+        # Create unique ID for each chunk; the chunk index is part of the key
+        xxh128_hexdigest = xxhash.xxh128_hexdigest
+        vector_ids = [
+            xxh128_hexdigest(name_prefix + f"{idx}_{chunk.content[:100]}".encode())
+            for idx, chunk in enumerate(chunks)
+        ]
+
+        # Fields shared by every chunk of the document
+        common = {
+            "filename": file_path.name,
+            "session_id": session_id if session_id else 0,
+            "file_type": parsed_doc.file_type,
+            "page_count": parsed_doc.page_count or 0,
+        }
+        metadata_list = [
+            {
+                **common,
+                "content": chunk.content,
+                "page_number": chunk.page_number,
+                "section_title": chunk.section_title,
+                "chunk_index": chunk.chunk_index,
+            }
+            for chunk in chunks
+        ]
+
+        return vector_ids, metadata_list
+
     async def generate_index_schema_json(self) -> Dict[str, Any]:
         """
         Generate the vector store schema as JSON for reference.
@@ -205,9 +557,9 @@ class IndexingService:
             "dimension": 1536,
             "space": "cosine",
             "parameters": {
-                "M": 16,
-                "ef_construction": 200,
-                "ef_search": 50,
+                "M": settings.hnsw_m,
+                "ef_construction": settings.hnsw_ef_construction,
+                "ef_search": settings.hnsw_ef_search,
                 "max_elements": stats.get("max_elements", 10000),
             },
             "metadata_fields": [
@@ -1,15 +1,95 @@
 """
 Gemini service wrapper for text generation using LiteLLM proxy.
 """
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, List
+import asyncio
 import os
-from litellm import acompletion
+import random
+import httpx
+import litellm
+import numpy as np
+import tiktoken
+from litellm import acompletion, aembedding
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Transient failures that are worth retrying
+_RETRYABLE_ERRORS = (
+    httpx.TimeoutException,
+    litellm.exceptions.Timeout,
+    litellm.exceptions.RateLimitError,
+    litellm.exceptions.APIConnectionError,
+    litellm.exceptions.ServiceUnavailableError,
+)
+
+
+class CompletionError(Exception):
+    """Raised when a completion request still fails after all retries."""
+
+
+# Shared by all service instances so LLM requests reuse pooled connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client used by LiteLLM.
+
+    The client is created on first use with HTTP/2 enabled, so concurrent
+    requests are multiplexed over kept-alive connections instead of paying
+    a TCP and TLS handshake each.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(600.0, connect=10.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        litellm.aclient_session = _http_client
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        litellm.aclient_session = None
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional[tiktoken.Encoding]:
+    """
+    Load the BPE encoding used for token counting.
+
+    Returns:
+        cl100k_base encoding, or None if it cannot be loaded
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, estimating token counts: {e}")
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _count_tokens(text: str) -> int:
+    """Count tokens in text, cached for repeated prompts and windows."""
+    encoding = _get_encoding()
+    if encoding is None:
+        # Rough approximation: ~4 characters per token
+        return len(text) // 4
+    return len(encoding.encode_ordinary(text))
+
 
 class OpenAIService:
     """Service for interacting with Gemini via LiteLLM proxy."""
@@ -32,8 +112,12 @@ class OpenAIService:
         if settings.api_key:
             os.environ["OPENAI_API_KEY"] = settings.api_key
         
-        # Use the deployment name as the model
+        # Use the deployment names as the models
         self.completion_model = settings.deployment_name
+        self.embedding_model = settings.embedding_deployment
+
+        # Route LiteLLM requests through the shared connection pool
+        _get_http_client()
         
         logger.info(f"Initialized Gemini service with model: {self.completion_model}")
         if settings.endpoint:
@@ -50,10 +134,10 @@ class OpenAIService:
             text: Text to count tokens for
 
         Returns:
-            Approximate number of tokens (using character-based estimation)
+            Approximate number of tokens (cl100k_base BPE, falling back to
+            character-based estimation if the encoding is unavailable)
         """
-        # Rough approximation: ~4 characters per token for Gemini
-        return len(text) // 4
+        return _count_tokens(text)
 
     async def generate_completion(
         self,
@@ -84,6 +168,7 @@ class OpenAIService:
             # Prepare model kwargs
             model_kwargs = {
                 "temperature": temperature or settings.temperature,
+                "timeout": settings.completion_timeout,
             }
             
             # Add max_tokens if specified
@@ -111,11 +196,25 @@ class OpenAIService:
             if not message_list:
                 raise ValueError("Either messages or prompt must be provided")
             
-            response = await acompletion(
-                model=self.completion_model,
-                messages=message_list,
-                **model_kwargs
-            )
+            # Retry transient failures with exponential backoff and jitter
+            for attempt in range(settings.completion_max_retries + 1):
+                try:
+                    response = await acompletion(
+                        model=self.completion_model,
+                        messages=message_list,
+                        **model_kwargs
+                    )
+                    break
+                except _RETRYABLE_ERRORS as e:
+                    if attempt == settings.completion_max_retries:
+                        raise CompletionError(
+                            f"Completion failed after {attempt + 1} attempts: {e}"
+                        ) from e
+                    delay = min(2 ** attempt, 30) + random.uniform(0, 1)
+                    logger.warning(
+                        f"Completion attempt {attempt + 1} failed ({e}), retrying in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
             
             # Handle response
             if hasattr(response, 'choices') and len(response.choices) > 0:
@@ -133,3 +232,65 @@ class OpenAIService:
         except Exception as e:
             logger.error(f"Error generating completion: {e}")
             raise
+
+    async def generate_embedding(self, text: str) -> np.ndarray:
+        """
+        Generate an embedding for a single text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector as a float32 array
+        """
+        embeddings = await self.generate_embeddings_batch([text])
+        return embeddings[0]
+
+    async def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 100,
+    ) -> np.ndarray:
+        """
+        Generate embeddings for many texts.
+
+        Texts are split into requests of batch_size, which are sent
+        concurrently (bounded by openai_concurrency).
+
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum number of texts per embedding request
+
+        Returns:
+            float32 array of shape (len(texts), dimension), one row per text
+            in the same order as texts
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        semaphore = asyncio.Semaphore(settings.openai_concurrency)
+
+        async def embed(batch: List[str]) -> np.ndarray:
+            async with semaphore:
+                response = await aembedding(model=self.embedding_model, input=batch)
+            # Convert each response right away so Python float lists are
+            # not held for the whole run
+            return np.asarray(
+                [item["embedding"] for item in response.data], dtype=np.float32
+            )
+
+        try:
+            logger.info(
+                f"Generating embeddings for {len(texts)} texts with model: {self.embedding_model}"
+            )
+
+            batches = await asyncio.gather(*(
+                embed(texts[start:start + batch_size])
+                for start in range(0, len(texts), batch_size)
+            ))
+
+            return np.concatenate(batches)
+
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            raise
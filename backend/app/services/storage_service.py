@@ -3,6 +3,7 @@ Local filesystem storage service for document storage.
 """
 from typing import Optional, BinaryIO
 from pathlib import Path
+import asyncio
 import os
 import shutil
 from datetime import datetime
@@ -128,7 +129,8 @@ class StorageService:
             if not path.exists():
                 raise FileNotFoundError(f"File not found: {path}")
 
-            file_content = path.read_bytes()
+            # Read off the event loop
+            file_content = await asyncio.to_thread(path.read_bytes)
             logger.info(f"Read file: {path}")
             return file_content
 
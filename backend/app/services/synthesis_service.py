@@ -2,34 +2,108 @@
 Service for document synthesis - creating unified documents from multiple sources.
 """
 from typing import List, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
-import json
+import os
 import re
+import tempfile
+import zipfile
 from io import BytesIO
 
+import numpy as np
+from pydantic import BaseModel, ValidationError, field_validator
+
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from app.services.storage_service import StorageService
 from app.services.openai_service import OpenAIService
-from app.services.vector_store import VectorStore
+from app.services.vector_store import VectorStore, get_vector_store
 from app.parsers import ParserFactory
 from app.core.config import settings
+from app.core.hashing import content_digest
+from app.core.json import dumps as json_dumps, loads as json_loads
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Common heading patterns, combined into one alternation so a line is
+# checked with a single match call
+_HEADING_RE = re.compile("|".join(f"(?:{pattern})" for pattern in [
+    r'^\d+\.?\s+[A-Z]',  # Numbered headings: "1. Introduction"
+    r'^[A-Z][A-Z\s]{2,50}$',  # All caps short lines
+    r'^[A-Z][a-z]+\s+[A-Z]',  # Title Case
+    r'^Chapter\s+\d+',  # Chapter headings
+    r'^Section\s+\d+',  # Section headings
+    r'^\d+\.\d+',  # Numbered sections: "1.1", "2.3"
+]))
+
+# Query embeddings of section titles, keyed by a digest of model and text.
+# Shared across service instances and persisted so restarts start warm.
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+QUERY_EMBEDDING_CACHE_FILENAME = ".query_embedding_cache.npz"
+_query_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_query_embedding_cache_loaded = False
+_query_embedding_cache_lock = asyncio.Lock()
+
+# Limits for packing several sections into one paragraph validation request
+VALIDATION_BATCH_MAX_SECTIONS = 4
+VALIDATION_BATCH_MAX_PROMPT_TOKENS = 16000
+
+_VALIDATION_SYSTEM_MESSAGE = """You are an expert technical document analyst specializing in content relevance assessment.
+Your task is to carefully evaluate whether paragraphs are truly relevant to a given section topic, considering the full document context."""
+
+
+# Lengths used when laying out the synthesis DOCX
+_PAGE_MARGIN = Inches(1)
+_SPACE_LARGE = Pt(12)
+_SPACE_SMALL = Pt(6)
+_FIRST_LINE_INDENT = Inches(0.25)
+_NO_INDENT = Inches(0)
+_SOURCE_REF_SIZE = Pt(9)
+_EMPTY_NOTE_SIZE = Pt(10)
+
+
+class _InventorySection(BaseModel):
+    """One inventory table entry as returned by the LLM."""
+    title: str
+    level: int = 1
+    order: Optional[int] = None
+
+    @field_validator('title')
+    @classmethod
+    def _strip_title(cls, value: str) -> str:
+        return value.strip()
+
+    @field_validator('level')
+    @classmethod
+    def _clamp_level(cls, value: int) -> int:
+        return min(max(value, 1), 4)  # Limit to 4 levels
+
+
+class _InventoryResponse(BaseModel):
+    """Expected shape of the inventory table response."""
+    sections: List[_InventorySection]
+
 
 class SynthesisService:
     """Service for synthesizing documents from multiple sources."""
 
-    def __init__(self):
-        """Initialize synthesis service."""
+    def __init__(self, vector_store: Optional[VectorStore] = None):
+        """
+        Initialize synthesis service.
+        
+        Args:
+            vector_store: Vector store to search; the shared store if not given
+        """
         self.storage_service = StorageService()
         self.openai_service = OpenAIService()
-        self.vector_store = VectorStore(dimension=1536)
+        self.vector_store = vector_store or get_vector_store()
         self.parser_factory = ParserFactory()
+        self.structure_cache_dir = Path(settings.data_directory) / ".structure_cache"
 
     async def analyze_document_structures(
         self,
@@ -47,50 +121,117 @@ class SynthesisService:
         logger.info(f"Analyzing document structures for {len(filenames)} documents")
         
         data_dir = Path(settings.data_directory)
-        structures = []
-        all_sections = set()
-        
-        # Parse each document and extract structure
-        for filename in filenames:
+
+        # Parse documents concurrently; LLM chunking is network-bound
+        semaphore = asyncio.Semaphore(settings.index_concurrency)
+
+        async def analyze_one(filename: str) -> Optional[Dict[str, Any]]:
             file_path = data_dir / filename
-            if not file_path.exists():
-                logger.warning(f"File not found: {file_path}")
-                continue
-                
+
             try:
-                # Read and parse document
-                # Use LLM chunking to match the chunks in the vector store
-                file_content = file_path.read_bytes()
-                parser = self.parser_factory.get_parser(filename)
-                # Pass openai_service to parser for LLM chunking (same as indexing)
-                parser.openai_service = self.openai_service
-                parsed_doc = await parser.parse(file_content, filename)
-                
+                async with semaphore:
+                    # Read and parse document; the read runs off the event
+                    # loop so other documents' LLM requests keep progressing
+                    # Use LLM chunking to match the chunks in the vector store
+                    try:
+                        file_content = await asyncio.to_thread(file_path.read_bytes)
+                    except FileNotFoundError:
+                        logger.warning(f"File not found: {file_path}")
+                        return None
+
+                    # Unchanged content reuses its structure without the LLM
+                    cache_key = content_digest(file_content).hex()
+                    structure = await asyncio.to_thread(
+                        self._load_cached_structure, cache_key
+                    )
+                    if structure is not None:
+                        logger.info(f"Using cached structure for {filename}")
+                        structure['filename'] = filename
+                        return structure
+
+                    parser = self.parser_factory.get_parser(filename)
+                    # Pass openai_service to parser for LLM chunking (same as indexing)
+                    parser.openai_service = self.openai_service
+                    parsed_doc = await parser.parse(file_content, filename)
+
                 # Extract structure (headings, sections)
                 structure = self._extract_structure(parsed_doc)
-                structure['filename'] = filename
                 structure['page_count'] = parsed_doc.page_count
-                structures.append(structure)
-                
-                # Collect all unique sections
-                for section in structure.get('sections', []):
-                    all_sections.add(section.get('title', ''))
-                    
+                await asyncio.to_thread(
+                    self._store_cached_structure, cache_key, structure
+                )
+                structure['filename'] = filename
+                return structure
+
             except Exception as e:
                 logger.error(f"Error analyzing {filename}: {e}")
-                continue
+                return None
+
+        results = await asyncio.gather(
+            *(analyze_one(filename) for filename in filenames)
+        )
+        structures = [structure for structure in results if structure is not None]
+
+        # Collect all unique sections, sorted once for both uses below
+        all_sections = sorted({
+            section.get('title', '')
+            for structure in structures
+            for section in structure.get('sections', [])
+        })
         
         # Generate common structure using AI
         common_structure = await self._generate_common_structure(
-            structures, list(all_sections)
+            structures, all_sections
         )
         
         return {
             'document_structures': structures,
             'common_structure': common_structure,
-            'all_sections': sorted(list(all_sections))
+            'all_sections': all_sections
         }
     
+    def _load_cached_structure(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a previously extracted document structure.
+
+        Args:
+            cache_key: Hex content digest of the document
+
+        Returns:
+            Structure dictionary, or None on a miss or when caching is disabled
+        """
+        if not settings.synthesis_structure_cache_enabled:
+            return None
+
+        cache_path = self.structure_cache_dir / f"{cache_key}.json"
+        try:
+            return json_loads(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable structure cache entry {cache_path.name}: {e}")
+            return None
+
+    def _store_cached_structure(self, cache_key: str, structure: Dict[str, Any]) -> None:
+        """
+        Atomically write a document structure to the cache.
+
+        Args:
+            cache_key: Hex content digest of the document
+            structure: Structure dictionary to cache
+        """
+        if not settings.synthesis_structure_cache_enabled:
+            return
+
+        try:
+            self.structure_cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = self.structure_cache_dir / f"{cache_key}.json"
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            tmp_path.write_text(json_dumps(structure), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache document structure: {e}")
+
     def _extract_structure(self, parsed_doc) -> Dict[str, Any]:
         """
         Extract document structure from parsed document with improved heading detection.
@@ -107,11 +248,13 @@ class SynthesisService:
         # Analyze chunks to find sections - look for headings at start of chunks
         for chunk in parsed_doc.chunks:
             content = chunk.content.strip()
+            page_number = chunk.page_number
+            chunk_index = chunk.chunk_index
             
-            # Split content into lines to find headings
-            lines = content.split('\n')
-            first_line = lines[0].strip() if lines else ""
-            rest_content = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
+            # Split off the first line to check for a heading
+            first_line, _, rest_content = content.partition('\n')
+            first_line = first_line.strip()
+            rest_content = rest_content.strip()
             
             # Check if first line is a heading
             if first_line and self._is_heading(first_line):
@@ -122,7 +265,7 @@ class SynthesisService:
                 # Start new section
                 current_section = {
                     'title': first_line[:200],  # Limit title length
-                    'page_number': chunk.page_number,
+                    'page_number': page_number,
                     'chunks': []
                 }
                 
@@ -130,15 +273,15 @@ class SynthesisService:
                 if rest_content:
                     current_section['chunks'].append({
                         'content': rest_content,
-                        'chunk_index': chunk.chunk_index,
-                        'page_number': chunk.page_number
+                        'chunk_index': chunk_index,
+                        'page_number': page_number
                     })
             elif current_section:
                 # Add to current section
                 current_section['chunks'].append({
                     'content': content,
-                    'chunk_index': chunk.chunk_index,
-                    'page_number': chunk.page_number
+                    'chunk_index': chunk_index,
+                    'page_number': page_number
                 })
             else:
                 # No current section, check if this chunk might be a heading
@@ -148,18 +291,18 @@ class SynthesisService:
                         sections.append(current_section)
                     current_section = {
                         'title': content[:200],
-                        'page_number': chunk.page_number,
+                        'page_number': page_number,
                         'chunks': []
                     }
                 else:
                     # Start a section with this content
                     current_section = {
                         'title': 'Content',  # Temporary title
-                        'page_number': chunk.page_number,
+                        'page_number': page_number,
                         'chunks': [{
                             'content': content,
-                            'chunk_index': chunk.chunk_index,
-                            'page_number': chunk.page_number
+                            'chunk_index': chunk_index,
+                            'page_number': page_number
                         }]
                     }
         
@@ -190,6 +333,12 @@ class SynthesisService:
                 ]
             })
         
+        # Sample of each section's first chunk, used to describe the section
+        # when generating the common structure
+        for section in sections:
+            chunks = section['chunks']
+            section['sample_content'] = chunks[0]['content'][:500] if chunks else ""
+        
         return {
             'sections': sections,
             'total_chunks': len(parsed_doc.chunks),
@@ -207,39 +356,54 @@ class SynthesisService:
         Returns:
             List of inferred sections
         """
+        # Locate heading lines and their character offsets in one pass
+        is_heading = self._is_heading
+        heading_offsets = []
+        headings = []
+        offset = 0
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            if line and len(line) < 200 and is_heading(line):
+                heading_offsets.append(offset)
+                headings.append(line)
+            offset += len(raw_line) + 1
+
+        if not headings:
+            return []
+
+        # Locate each chunk in the text; chunks that cannot be found (e.g.
+        # reworded by LLM chunking) stay at the previous chunk's position
+        chunk_offsets = []
+        cursor = 0
+        for chunk in chunks:
+            probe = chunk.content.strip()[:80]
+            position = text.find(probe, cursor) if probe else -1
+            if position != -1:
+                cursor = position
+            chunk_offsets.append(cursor)
+
         sections = []
-        lines = text.split('\n')
-        
-        current_section = None
-        current_chunk_idx = 0
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check if line looks like a heading
-            if self._is_heading(line) and len(line) < 200:
-                # Save previous section
-                if current_section and current_section.get('chunks'):
-                    sections.append(current_section)
-                
-                # Find which chunk this might belong to
-                page_num = 1
-                if current_chunk_idx < len(chunks):
-                    page_num = chunks[current_chunk_idx].page_number or 1
-                
-                current_section = {
-                    'title': line[:200],
-                    'page_number': page_num,
-                    'chunks': []
-                }
-        
-        # Add last section
-        if current_section and current_section.get('chunks'):
-            sections.append(current_section)
-        
-        return sections
+        for heading_offset, title in zip(heading_offsets, headings):
+            # Page of the first chunk at or after the heading
+            chunk_idx = min(bisect_left(chunk_offsets, heading_offset), len(chunks) - 1)
+            page_num = chunks[chunk_idx].page_number if chunks else None
+            sections.append({
+                'title': title[:200],
+                'page_number': page_num or 1,
+                'chunks': []
+            })
+
+        # Assign each chunk to the last heading at or before it; content
+        # before the first heading belongs to the first section
+        for chunk, chunk_offset in zip(chunks, chunk_offsets):
+            section_idx = max(bisect_right(heading_offsets, chunk_offset) - 1, 0)
+            sections[section_idx]['chunks'].append({
+                'content': chunk.content,
+                'chunk_index': chunk.chunk_index,
+                'page_number': chunk.page_number
+            })
+
+        return [section for section in sections if section['chunks']]
     
     def _is_heading(self, text: str) -> bool:
         """
@@ -259,18 +423,8 @@ class SynthesisService:
             return False
         
         # Check for common heading patterns
-        heading_patterns = [
-            r'^\d+\.?\s+[A-Z]',  # Numbered headings: "1. Introduction"
-            r'^[A-Z][A-Z\s]{2,50}$',  # All caps short lines
-            r'^[A-Z][a-z]+\s+[A-Z]',  # Title Case
-            r'^Chapter\s+\d+',  # Chapter headings
-            r'^Section\s+\d+',  # Section headings
-            r'^\d+\.\d+',  # Numbered sections: "1.1", "2.3"
-        ]
-        
-        for pattern in heading_patterns:
-            if re.match(pattern, text):
-                return True
+        if _HEADING_RE.match(text):
+            return True
         
         # Check if it's a short line with no sentence-ending punctuation
         if len(text) < 100 and not text.endswith(('.', '!', '?')):
@@ -300,13 +454,12 @@ class SynthesisService:
         for struct in structures:
             sections_info = []
             for section in struct.get('sections', []):
-                # Get sample content from first chunk to understand the section
                 chunks = section.get('chunks', [])
-                sample_content = ""
-                if chunks:
-                    # Get first 500 chars of first chunk as sample
-                    first_chunk = chunks[0].get('content', '')
-                    sample_content = first_chunk[:500] if len(first_chunk) > 500 else first_chunk
+                # Sample content precomputed by _extract_structure; structures
+                # cached before it was added are sampled here
+                sample_content = section.get('sample_content')
+                if sample_content is None:
+                    sample_content = chunks[0].get('content', '')[:500] if chunks else ""
                 
                 sections_info.append({
                     'title': section.get('title', ''),
@@ -326,7 +479,7 @@ class SynthesisService:
         prompt = f"""You are an expert technical document analyst. Analyze the following document structures from multiple source documents and create a comprehensive, unified table of contents (inventory table) that synthesizes all information.
 
 DOCUMENT STRUCTURES TO ANALYZE:
-{json.dumps(structure_summary, indent=2, ensure_ascii=False)}
+{json_dumps(structure_summary, indent=True)}
 
 YOUR TASK:
 1. Analyze each document's structure and content samples to understand the topics and themes
@@ -386,62 +539,21 @@ Your task is to analyze multiple document structures and create a comprehensive,
                 response_format={"type": "json_object"}
             )
             
-            # Parse response
-            result = json.loads(response)
-            
-            # Extract sections array
-            if isinstance(result, dict):
-                if 'sections' in result:
-                    inventory_table = result['sections']
-                elif 'table_of_contents' in result:
-                    inventory_table = result['table_of_contents']
-                elif 'inventory_table' in result:
-                    inventory_table = result['inventory_table']
-                else:
-                    # Try to find any array in the response
-                    for key, value in result.items():
-                        if isinstance(value, list):
-                            inventory_table = value
-                            break
-                    else:
-                        inventory_table = []
-            else:
-                inventory_table = result if isinstance(result, list) else []
-            
-            # Ensure proper format and validate
-            if not isinstance(inventory_table, list):
-                logger.warning("AI response did not contain a list, using fallback")
-                inventory_table = []
-            
-            # Clean and validate each section
-            cleaned_table = []
-            for idx, section in enumerate(inventory_table, 1):
-                if isinstance(section, dict):
-                    # Ensure required fields
-                    title = section.get('title', '').strip()
-                    if not title:
-                        continue  # Skip empty titles
-                    
-                    level = int(section.get('level', 1))
-                    if level < 1:
-                        level = 1
-                    if level > 4:
-                        level = 4  # Limit to 4 levels
-                    
-                    order = int(section.get('order', idx))
-                    
-                    cleaned_table.append({
-                        'title': title,
-                        'level': level,
-                        'order': order
-                    })
-                elif isinstance(section, str):
-                    # Handle string entries
-                    cleaned_table.append({
-                        'title': section.strip(),
-                        'level': 1,
-                        'order': idx
-                    })
+            # Typed single-pass decode of the expected {"sections": [...]}
+            # shape; anything else goes through the lenient parser
+            try:
+                parsed = _InventoryResponse.model_validate_json(response)
+                cleaned_table = [
+                    {
+                        'title': section.title,
+                        'level': section.level,
+                        'order': idx if section.order is None else section.order
+                    }
+                    for idx, section in enumerate(parsed.sections, 1)
+                    if section.title
+                ]
+            except ValidationError:
+                cleaned_table = self._parse_inventory_table(response)
             
             # Sort by order
             cleaned_table.sort(key=lambda x: x.get('order', 999))
@@ -469,6 +581,77 @@ Your task is to analyze multiple document structures and create a comprehensive,
                 'total_sections': len(inventory_table)
             }
     
+    def _parse_inventory_table(self, response: str) -> List[Dict[str, Any]]:
+        """
+        Leniently extract inventory sections from an LLM response.
+        
+        Accepts the sections array under alternative keys or at the top
+        level, and string entries in place of section objects.
+        
+        Args:
+            response: Raw JSON response text
+            
+        Returns:
+            List of section dictionaries with title, level and order
+        """
+        result = json_loads(response)
+        
+        # Extract sections array
+        if isinstance(result, dict):
+            if 'sections' in result:
+                inventory_table = result['sections']
+            elif 'table_of_contents' in result:
+                inventory_table = result['table_of_contents']
+            elif 'inventory_table' in result:
+                inventory_table = result['inventory_table']
+            else:
+                # Try to find any array in the response
+                for key, value in result.items():
+                    if isinstance(value, list):
+                        inventory_table = value
+                        break
+                else:
+                    inventory_table = []
+        else:
+            inventory_table = result if isinstance(result, list) else []
+        
+        # Ensure proper format and validate
+        if not isinstance(inventory_table, list):
+            logger.warning("AI response did not contain a list, using fallback")
+            inventory_table = []
+        
+        # Clean and validate each section
+        cleaned_table = []
+        for idx, section in enumerate(inventory_table, 1):
+            if isinstance(section, dict):
+                # Ensure required fields
+                title = section.get('title', '').strip()
+                if not title:
+                    continue  # Skip empty titles
+                
+                level = int(section.get('level', 1))
+                if level < 1:
+                    level = 1
+                if level > 4:
+                    level = 4  # Limit to 4 levels
+                
+                order = int(section.get('order', idx))
+                
+                cleaned_table.append({
+                    'title': title,
+                    'level': level,
+                    'order': order
+                })
+            elif isinstance(section, str):
+                # Handle string entries
+                cleaned_table.append({
+                    'title': section.strip(),
+                    'level': 1,
+                    'order': idx
+                })
+        
+        return cleaned_table
+    
     async def find_paragraphs_for_section(
         self,
         section_title: str,
@@ -488,81 +671,263 @@ Your task is to analyze multiple document structures and create a comprehensive,
         Returns:
             List of relevant paragraphs with metadata, validated by LLM
         """
-        logger.info(f"Finding paragraphs for section: {section_title}")
+        results = await self.find_paragraphs_for_sections(
+            section_titles=[section_title],
+            filenames=filenames,
+            top_k=top_k,
+            used_paragraph_ids=used_paragraph_ids
+        )
+        return results[section_title]
+    
+    async def find_paragraphs_for_sections(
+        self,
+        section_titles: List[str],
+        filenames: List[str],
+        top_k: int = 10,
+        used_paragraph_ids: Optional[set] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find relevant paragraphs for several sections at once.
+        
+        All titles are embedded in a single request, and the vector searches
+        and LLM validations for the sections run concurrently. A paragraph
+        is assigned to at most one section; when several sections select it,
+        the one listed first keeps it.
         
+        Args:
+            section_titles: Titles of the sections (duplicates are searched once)
+            filenames: List of source document filenames
+            top_k: Number of results to return per section
+            used_paragraph_ids: Set of paragraph IDs already used in this session (to avoid duplicates)
+            
+        Returns:
+            Dictionary mapping each section title to its validated paragraphs
+        """
         # Initialize used paragraph IDs set
         if used_paragraph_ids is None:
             used_paragraph_ids = set()
         
+        titles = list(dict.fromkeys(section_titles))
+        if not titles:
+            return {}
+        
+        logger.info(f"Finding paragraphs for {len(titles)} sections")
+        
         # Use vector search to find relevant content
-        query_embedding = await self.openai_service.generate_embedding(section_title)
+        query_embeddings = await self._embed_queries(titles)
+        
+        async def find_candidates(query_embedding) -> List[Dict[str, Any]]:
+            # The store only searches the requested files; fetch extra
+            # results to cover paragraphs already used in this session.
+            # Validation only considers the top_k best candidates, so no
+            # more are retrieved.
+            search_results = await self.vector_store.search(
+                query_vector=query_embedding,
+                top_k=top_k + len(used_paragraph_ids),
+                filters={'filename': filenames}
+            )
+            
+            return self._collect_candidate_paragraphs(
+                search_results=search_results,
+                filenames=filenames,
+                used_paragraph_ids=used_paragraph_ids,
+                limit=top_k
+            )
+        
+        candidates = await asyncio.gather(*(
+            find_candidates(embedding) for embedding in query_embeddings
+        ))
+        
+        jobs = []
+        for section_title, candidate_paragraphs in zip(titles, candidates):
+            if candidate_paragraphs:
+                jobs.append((section_title, candidate_paragraphs))
+            else:
+                logger.warning(f"No candidate paragraphs found for section: {section_title}")
         
-        # Search with more results to have options after filtering
-        search_results = await self.vector_store.search(
-            query_vector=query_embedding,
-            top_k=top_k * 3 * len(filenames),  # Get more results for filtering
-            filters=None
+        # Validate paragraphs with LLM - check relevance to each section
+        validated = await self._validate_paragraphs_batch(
+            jobs=jobs,
+            filenames=filenames,
+            max_results=top_k
         )
         
-        # Filter by filename and remove duplicates
-        candidate_paragraphs = []
-        seen_chunk_ids = set()
+        # Sections were validated independently; resolve overlaps in order
+        assigned_ids = set()
+        results = {}
+        for title in titles:
+            results[title] = [
+                paragraph for paragraph in validated.get(title, [])
+                if paragraph['id'] not in assigned_ids
+            ]
+            assigned_ids.update(paragraph['id'] for paragraph in results[title])
         
-        for result in search_results:
-            filename = result.get('filename', '')
-            if filename not in filenames:
-                continue
-            
-            chunk_id = result.get('id', '')
+        return results
+    
+    async def _embed_queries(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Embed query texts, reusing cached embeddings where possible.
+        
+        Only cache misses are sent to the embedding model, in one batch.
+        
+        Args:
+            texts: Unique query texts
             
-            # Skip if already used in this session
-            if chunk_id in used_paragraph_ids:
-                continue
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        global _query_embedding_cache_loaded
+        cache = _query_embedding_cache
+        cache_path = Path(settings.data_directory) / QUERY_EMBEDDING_CACHE_FILENAME
+        if not _query_embedding_cache_loaded:
+            # Concurrent callers wait for the one load instead of seeing a
+            # half-filled cache
+            async with _query_embedding_cache_lock:
+                if not _query_embedding_cache_loaded:
+                    cache.update(await asyncio.to_thread(self._load_query_embeddings, cache_path))
+                    _query_embedding_cache_loaded = True
+        
+        model = self.openai_service.embedding_model
+        keys = [
+            content_digest(f"{model}\0{text}".encode("utf-8")).hex()
+            for text in texts
+        ]
+        
+        # Take the hits before awaiting, since a concurrent request may evict
+        # them while the misses are being embedded
+        vectors: List[Optional[np.ndarray]] = [None] * len(keys)
+        missing = []
+        for i, key in enumerate(keys):
+            vector = cache.get(key)
+            if vector is None:
+                missing.append(i)
+            else:
+                cache.move_to_end(key)
+                vectors[i] = vector
+        
+        if missing:
+            embeddings = await self.openai_service.generate_embeddings_batch(
+                [texts[i] for i in missing]
+            )
+            for i, embedding in zip(missing, embeddings):
+                cache[keys[i]] = embedding
+                vectors[i] = embedding
             
-            # Skip duplicates
-            if chunk_id in seen_chunk_ids:
-                continue
+            while len(cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                cache.popitem(last=False)
+            await asyncio.to_thread(self._save_query_embeddings, cache_path, dict(cache))
+        
+        logger.info(f"Query embedding cache: {len(keys) - len(missing)} hits, {len(missing)} misses")
+        return vectors
+    
+    @staticmethod
+    def _load_query_embeddings(cache_path: Path) -> Dict[str, np.ndarray]:
+        """
+        Load persisted query embeddings.
+        
+        Args:
+            cache_path: Path of the cache file
             
-            seen_chunk_ids.add(chunk_id)
+        Returns:
+            Dictionary mapping cache keys to embeddings, least recently used first
+        """
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                return dict(zip(data["keys"].tolist(), data["vectors"]))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            logger.warning(f"Ignoring unreadable query embedding cache {cache_path.name}: {e}")
+            return {}
+    
+    @staticmethod
+    def _save_query_embeddings(cache_path: Path, entries: Dict[str, np.ndarray]) -> None:
+        """
+        Atomically persist query embeddings.
+        
+        Args:
+            cache_path: Path of the cache file
+            entries: Dictionary mapping cache keys to embeddings
+        """
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A temp file per save, so concurrent saves never share a file
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent,
+                prefix=cache_path.name,
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_path = Path(f.name)
+                np.savez(
+                    f,
+                    keys=np.array(list(entries.keys())),
+                    vectors=np.stack(list(entries.values())),
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write query embedding cache: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+    
+    def _collect_candidate_paragraphs(
+        self,
+        search_results: List[Dict[str, Any]],
+        filenames: List[str],
+        used_paragraph_ids: set,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter search results down to unused paragraphs from the given files.
+        
+        Args:
+            search_results: Vector search results, best first
+            filenames: List of source document filenames to keep
+            used_paragraph_ids: Set of paragraph IDs already used in this session
+            limit: Maximum number of candidates to return
             
-            candidate_paragraphs.append({
+        Returns:
+            List of candidate paragraphs with metadata
+        """
+        # Filter by filename and remove duplicates; dict keeps result order
+        wanted_filenames = frozenset(filenames)
+        selected: Dict[str, Dict[str, Any]] = {}
+        
+        for result in search_results:
+            chunk_id = result.get('id', '')
+            if (
+                result.get('filename', '') in wanted_filenames
+                and chunk_id not in used_paragraph_ids  # Already used in this session
+                and chunk_id not in selected
+            ):
+                selected[chunk_id] = result
+                if len(selected) >= limit:
+                    break
+        
+        return [
+            {
                 'id': chunk_id,
                 'content': result.get('content', ''),
-                'filename': filename,
+                'filename': result.get('filename', ''),
                 'page_number': result.get('page_number'),
                 'section_title': result.get('section_title'),
                 'chunk_index': result.get('chunk_index'),
                 'score': result.get('score', 0.0),
                 'distance': result.get('distance', 1.0)
-            })
-            
-            # Get enough candidates for LLM validation
-            if len(candidate_paragraphs) >= top_k * 2:
-                break
-        
-        if not candidate_paragraphs:
-            logger.warning(f"No candidate paragraphs found for section: {section_title}")
-            return []
-        
-        # Validate paragraphs with LLM - check relevance to section
-        validated_paragraphs = await self._validate_paragraphs_with_llm(
-            section_title=section_title,
-            paragraphs=candidate_paragraphs,
-            filenames=filenames,
-            max_results=top_k
-        )
-        
-        return validated_paragraphs
+            }
+            for chunk_id, result in selected.items()
+        ]
     
-    async def _validate_paragraphs_with_llm(
+    async def _prepare_validation_input(
         self,
         section_title: str,
         paragraphs: List[Dict[str, Any]],
         filenames: List[str],
-        max_results: int = 10
-    ) -> List[Dict[str, Any]]:
+        max_results: int
+    ) -> Dict[str, Any]:
         """
-        Validate paragraph relevance to section using LLM analysis.
+        Collect what the LLM needs to judge the candidates of one section.
         
         Args:
             section_title: Title of the section
@@ -571,32 +936,108 @@ Your task is to analyze multiple document structures and create a comprehensive,
             max_results: Maximum number of results to return
             
         Returns:
-            List of validated, relevant paragraphs
+            Dictionary with the section title, trimmed candidate paragraphs
+            and document contexts
         """
-        logger.info(f"Validating {len(paragraphs)} paragraphs for section: {section_title}")
+        # Keep only the best candidates by vector score for token efficiency
+        top_paragraphs = sorted(
+            paragraphs, key=lambda p: p.get('score', 0.0), reverse=True
+        )[:max_results]
         
-        # Get document context for each filename
+        # Get document context for each file that still has a candidate
         document_contexts = {}
         for filename in filenames:
-            # Get all chunks from this document for context
             doc_paragraphs = [
-                p for p in paragraphs if p.get('filename') == filename
+                p for p in top_paragraphs if p.get('filename') == filename
             ]
             if doc_paragraphs:
                 # Get surrounding context from vector store
                 context_text = await self._get_document_context(filename, doc_paragraphs[0])
-                document_contexts[filename] = context_text
+                document_contexts[filename] = context_text[:1000]
         
         # Prepare paragraphs for LLM validation
-        paragraphs_info = []
-        for para in paragraphs[:max_results * 2]:  # Limit for token efficiency
-            paragraphs_info.append({
+        paragraphs_info = [
+            {
                 'id': para.get('id'),
                 'content': para.get('content', '')[:800],  # Limit content length
                 'filename': para.get('filename'),
                 'page_number': para.get('page_number'),
                 'score': para.get('score', 0.0)
-            })
+            }
+            for para in top_paragraphs
+        ]
+        
+        return {
+            'section_title': section_title,
+            'candidate_paragraphs': paragraphs_info,
+            'document_contexts': document_contexts
+        }
+    
+    def _select_validated_paragraphs(
+        self,
+        validated_list: Any,
+        paragraphs: List[Dict[str, Any]],
+        max_results: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Map the LLM's relevance verdicts back to the candidate paragraphs.
+        
+        Args:
+            validated_list: "validated_paragraphs" array returned by the LLM
+            paragraphs: List of candidate paragraphs
+            max_results: Maximum number of results to return
+            
+        Returns:
+            Relevant paragraphs, most relevant first
+        """
+        if not isinstance(validated_list, list):
+            validated_list = []
+        
+        # Filter to only relevant paragraphs and sort by relevance score
+        relevant_paragraphs = [
+            vp for vp in validated_list 
+            if isinstance(vp, dict) and vp.get('is_relevant', False)
+        ]
+        relevant_paragraphs.sort(key=lambda x: x.get('relevance_score', 0.0), reverse=True)
+        
+        # Map back to original paragraph data
+        para_map = {p.get('id'): p for p in paragraphs}
+        final_paragraphs = []
+        
+        for vp in relevant_paragraphs[:max_results]:
+            para_id = vp.get('id')
+            if para_id in para_map:
+                original_para = para_map[para_id].copy()
+                original_para['llm_relevance_score'] = vp.get('relevance_score', 0.0)
+                # Don't add llm_reason to keep response clean
+                final_paragraphs.append(original_para)
+        
+        return final_paragraphs
+    
+    async def _validate_paragraphs_with_llm(
+        self,
+        section_title: str,
+        paragraphs: List[Dict[str, Any]],
+        filenames: List[str],
+        max_results: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate paragraph relevance to section using LLM analysis.
+        
+        Args:
+            section_title: Title of the section
+            paragraphs: List of candidate paragraphs
+            filenames: Source document filenames
+            max_results: Maximum number of results to return
+            
+        Returns:
+            List of validated, relevant paragraphs
+        """
+        logger.info(f"Validating {len(paragraphs)} paragraphs for section: {section_title}")
+        
+        validation_input = await self._prepare_validation_input(
+            section_title, paragraphs, filenames, max_results
+        )
         
         # Create prompt for LLM validation
         prompt = f"""You are an expert document analyst. Your task is to evaluate which paragraphs are truly relevant for a specific section in a synthesis document.
@@ -604,10 +1045,10 @@ Your task is to analyze multiple document structures and create a comprehensive,
 SECTION TITLE: "{section_title}"
 
 CANDIDATE PARAGRAPHS:
-{json.dumps(paragraphs_info, indent=2, ensure_ascii=False)}
+{json_dumps(validation_input['candidate_paragraphs'])}
 
 DOCUMENT CONTEXTS:
-{json.dumps({k: v[:1000] for k, v in document_contexts.items()}, indent=2, ensure_ascii=False)}
+{json_dumps(validation_input['document_contexts'])}
 
 YOUR TASK:
 1. Analyze each paragraph's content in the context of the section title
@@ -627,43 +1068,21 @@ Only include paragraphs that are relevant (is_relevant: true). Order them by rel
 
 Return ONLY valid JSON, no other text."""
 
-        system_message = """You are an expert technical document analyst specializing in content relevance assessment.
-Your task is to carefully evaluate whether paragraphs are truly relevant to a given section topic, considering the full document context."""
-
         try:
             response = await self.openai_service.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
+                system_message=_VALIDATION_SYSTEM_MESSAGE,
                 temperature=0.2,  # Lower temperature for more consistent evaluation
                 max_tokens=3000,
                 response_format={"type": "json_object"}
             )
             
-            result = json.loads(response)
+            result = json_loads(response)
             
             # Extract validated paragraphs
-            validated_list = result.get('validated_paragraphs', [])
-            if not isinstance(validated_list, list):
-                validated_list = []
-            
-            # Filter to only relevant paragraphs and sort by relevance score
-            relevant_paragraphs = [
-                vp for vp in validated_list 
-                if isinstance(vp, dict) and vp.get('is_relevant', False)
-            ]
-            relevant_paragraphs.sort(key=lambda x: x.get('relevance_score', 0.0), reverse=True)
-            
-            # Map back to original paragraph data
-            para_map = {p.get('id'): p for p in paragraphs}
-            final_paragraphs = []
-            
-            for vp in relevant_paragraphs[:max_results]:
-                para_id = vp.get('id')
-                if para_id in para_map:
-                    original_para = para_map[para_id].copy()
-                    original_para['llm_relevance_score'] = vp.get('relevance_score', 0.0)
-                    # Don't add llm_reason to keep response clean
-                    final_paragraphs.append(original_para)
+            final_paragraphs = self._select_validated_paragraphs(
+                result.get('validated_paragraphs', []), paragraphs, max_results
+            )
             
             logger.info(f"LLM validated {len(final_paragraphs)} relevant paragraphs out of {len(paragraphs)} candidates")
             
@@ -674,6 +1093,159 @@ Your task is to carefully evaluate whether paragraphs are truly relevant to a gi
             # Fallback: return top paragraphs by vector score
             return sorted(paragraphs, key=lambda x: x.get('score', 0.0), reverse=True)[:max_results]
     
+    async def _validate_paragraphs_batch(
+        self,
+        jobs: List[tuple],
+        filenames: List[str],
+        max_results: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Validate the candidates of several sections with as few LLM calls as possible.
+        
+        Sections are packed into shared prompts up to VALIDATION_BATCH_MAX_SECTIONS
+        sections and VALIDATION_BATCH_MAX_PROMPT_TOKENS tokens each, so the
+        instructions are sent once per group instead of once per section.
+        Groups are validated concurrently, at most openai_concurrency at a
+        time. Sections missing from a batched
+        response, or whose batch fails, are validated on their own.
+        
+        Args:
+            jobs: List of (section_title, candidate_paragraphs) tuples
+            filenames: Source document filenames
+            max_results: Maximum number of results to return per section
+            
+        Returns:
+            Dictionary mapping section titles to validated paragraphs
+        """
+        if not jobs:
+            return {}
+        
+        inputs = await asyncio.gather(*(
+            self._prepare_validation_input(title, paragraphs, filenames, max_results)
+            for title, paragraphs in jobs
+        ))
+        
+        # Pack sections into groups bounded by section count and prompt size
+        groups: List[List[int]] = []
+        group_tokens = 0
+        for i, validation_input in enumerate(inputs):
+            tokens = self.openai_service.count_tokens(json_dumps(validation_input))
+            if (
+                not groups
+                or len(groups[-1]) >= VALIDATION_BATCH_MAX_SECTIONS
+                or group_tokens + tokens > VALIDATION_BATCH_MAX_PROMPT_TOKENS
+            ):
+                groups.append([])
+                group_tokens = 0
+            groups[-1].append(i)
+            group_tokens += tokens
+        
+        # Bound concurrent completions to stay clear of rate limits
+        semaphore = asyncio.Semaphore(settings.openai_concurrency)
+        
+        async def validate_group(group: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+            async with semaphore:
+                return await validate_group_unbounded(group)
+        
+        async def validate_group_unbounded(group: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+            if len(group) == 1:
+                title, paragraphs = jobs[group[0]]
+                return {title: await self._validate_paragraphs_with_llm(
+                    title, paragraphs, filenames, max_results
+                )}
+            
+            validated_by_title: Dict[str, Any] = {}
+            try:
+                validated_by_title = await self._request_batch_validation(
+                    [inputs[i] for i in group]
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batched validation of {len(group)} sections failed, validating individually: {e}"
+                )
+            
+            results = {}
+            fallback = []
+            for i in group:
+                title, paragraphs = jobs[i]
+                if title in validated_by_title:
+                    results[title] = self._select_validated_paragraphs(
+                        validated_by_title[title], paragraphs, max_results
+                    )
+                else:
+                    fallback.append((title, paragraphs))
+            
+            fallback_results = await asyncio.gather(*(
+                self._validate_paragraphs_with_llm(title, paragraphs, filenames, max_results)
+                for title, paragraphs in fallback
+            ))
+            results.update(zip((title for title, _ in fallback), fallback_results))
+            return results
+        
+        validated: Dict[str, List[Dict[str, Any]]] = {}
+        for group_results in await asyncio.gather(*(validate_group(group) for group in groups)):
+            validated.update(group_results)
+        
+        logger.info(f"Validated {len(jobs)} sections in {len(groups)} LLM batches")
+        return validated
+    
+    async def _request_batch_validation(
+        self,
+        validation_inputs: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Ask the LLM to judge the candidates of several sections in one request.
+        
+        Args:
+            validation_inputs: Per-section inputs from _prepare_validation_input
+            
+        Returns:
+            Dictionary mapping section titles to their "validated_paragraphs" arrays
+        """
+        prompt = f"""You are an expert document analyst. Your task is to evaluate, for each of several sections in a synthesis document, which of its candidate paragraphs are truly relevant.
+
+SECTIONS (each with its candidate paragraphs and document contexts):
+{json_dumps(validation_inputs)}
+
+YOUR TASK, FOR EACH SECTION:
+1. Analyze each candidate paragraph's content in the context of the section title
+2. Determine if the paragraph is truly relevant to the section topic
+3. Consider the document context to understand the paragraph's meaning
+4. Rank paragraphs by relevance (most relevant first)
+5. Exclude paragraphs that are not relevant to the section topic
+
+OUTPUT FORMAT:
+Return a JSON object with a "results" array containing one object per section, with:
+- "section_title": The section title, exactly as given (string)
+- "validated_paragraphs": An array where each object has:
+  - "id": The paragraph ID (string)
+  - "is_relevant": true if relevant, false if not (boolean)
+  - "relevance_score": A score from 0.0 to 1.0 indicating relevance (float)
+  - "reason": Brief explanation of why it's relevant or not (string)
+
+Only include paragraphs that are relevant (is_relevant: true). Order them by relevance_score (highest first).
+
+Return ONLY valid JSON, no other text."""
+
+        response = await self.openai_service.generate_completion(
+            prompt=prompt,
+            system_message=_VALIDATION_SYSTEM_MESSAGE,
+            temperature=0.2,  # Lower temperature for more consistent evaluation
+            max_tokens=2000 * len(validation_inputs),
+            response_format={"type": "json_object"}
+        )
+        
+        result = json_loads(response)
+        results = result.get('results', []) if isinstance(result, dict) else []
+        if not isinstance(results, list):
+            return {}
+        
+        return {
+            entry['section_title']: entry.get('validated_paragraphs', [])
+            for entry in results
+            if isinstance(entry, dict) and isinstance(entry.get('section_title'), str)
+        }
+    
     async def _get_document_context(self, filename: str, sample_paragraph: Dict[str, Any]) -> str:
         """
         Get document context around a paragraph for better LLM understanding.
@@ -686,18 +1258,8 @@ Your task is to carefully evaluate whether paragraphs are truly relevant to a gi
             Context text from the document
         """
         try:
-            # Get all paragraphs from this document
-            doc_paragraphs = []
-            for para_id, metadata in self.vector_store.metadata.items():
-                if metadata.get('filename') == filename:
-                    doc_paragraphs.append({
-                        'content': metadata.get('content', ''),
-                        'page_number': metadata.get('page_number'),
-                        'chunk_index': metadata.get('chunk_index', 0)
-                    })
-            
-            # Sort by chunk_index
-            doc_paragraphs.sort(key=lambda x: x.get('chunk_index', 0))
+            # All paragraphs from this document, sorted by chunk_index
+            doc_paragraphs = self.vector_store.chunks_for_file(filename)
             
             # Get context around the sample paragraph (surrounding chunks)
             sample_idx = sample_paragraph.get('chunk_index', 0)
@@ -732,38 +1294,52 @@ Your task is to carefully evaluate whether paragraphs are truly relevant to a gi
         """
         logger.info("Generating synthesis document as DOCX")
         
-        # Load paragraph content from vector store
-        vector_store = VectorStore(dimension=1536)
-        # Access metadata directly from vector store
-        metadata = vector_store.metadata
+        # Load paragraph content from the already loaded vector store
+        metadata = self.vector_store.metadata
         
         # Create a new Document
         doc = Document()
         
+        # python-docx appends each body paragraph after a linear scan for the
+        # trailing section properties; inserting before a sentinel paragraph
+        # is constant time, so content is added there and the sentinel is
+        # removed at the end
+        sentinel = doc.add_paragraph()
+        
+        # Styles looked up by name scan the styles part; resolve each once
+        paragraph_styles = {}
+        
+        def add_paragraph(text: str = '', style: Optional[str] = None):
+            if style is not None:
+                if style not in paragraph_styles:
+                    paragraph_styles[style] = doc.styles[style]
+                style = paragraph_styles[style]
+            return sentinel.insert_paragraph_before(text, style=style)
+        
         # Set document margins
         sections = doc.sections
         for section in sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+            section.top_margin = _PAGE_MARGIN
+            section.bottom_margin = _PAGE_MARGIN
+            section.left_margin = _PAGE_MARGIN
+            section.right_margin = _PAGE_MARGIN
         
         # Add title
-        title = doc.add_heading('Synthesis Document', 0)
+        title = add_paragraph('Synthesis Document', style='Title')
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # Add introduction paragraph
-        intro = doc.add_paragraph('This document synthesizes information from the following sources:')
+        intro = add_paragraph('This document synthesizes information from the following sources:')
         intro_format = intro.paragraph_format
-        intro_format.space_after = Pt(12)
+        intro_format.space_after = _SPACE_LARGE
         
         # Add source list
         for filename in filenames:
-            source_para = doc.add_paragraph(filename, style='List Bullet')
-            source_para.paragraph_format.space_after = Pt(6)
+            source_para = add_paragraph(filename, style='List Bullet')
+            source_para.paragraph_format.space_after = _SPACE_SMALL
         
         # Add separator
-        doc.add_paragraph('─' * 50).paragraph_format.space_after = Pt(12)
+        add_paragraph('─' * 50).paragraph_format.space_after = _SPACE_LARGE
         
         # Build document section by section
         for section in sorted(inventory_table, key=lambda x: x.get('order', 999)):
@@ -771,11 +1347,14 @@ Your task is to carefully evaluate whether paragraphs are truly relevant to a gi
             level = section.get('level', 1)
             
             # Add section header with appropriate heading level
-            # DOCX supports heading levels 1-9, map our levels accordingly
-            heading_level = min(level, 9)
-            heading = doc.add_heading(section_title, level=heading_level)
-            heading.paragraph_format.space_before = Pt(12) if level == 1 else Pt(6)
-            heading.paragraph_format.space_after = Pt(6)
+            # DOCX supports heading levels 1-9, map our levels accordingly;
+            # level 0 uses the Title style, as add_heading does
+            heading_level = min(max(level, 0), 9)
+            heading_style = 'Title' if heading_level == 0 else f'Heading {heading_level}'
+            heading = add_paragraph(section_title, style=heading_style)
+            heading_format = heading.paragraph_format
+            heading_format.space_before = _SPACE_LARGE if level == 1 else _SPACE_SMALL
+            heading_format.space_after = _SPACE_SMALL
             
             # Add selected paragraphs for this section
             paragraph_ids = selected_paragraphs.get(section_title, [])
@@ -788,26 +1367,28 @@ Your task is to carefully evaluate whether paragraphs are truly relevant to a gi
                     
                     if content:
                         # Add paragraph content
-                        para = doc.add_paragraph(content)
-                        para.paragraph_format.space_after = Pt(12)
-                        para.paragraph_format.first_line_indent = Inches(0.25) if level > 1 else Inches(0)
+                        para = add_paragraph(content)
+                        para_format = para.paragraph_format
+                        para_format.space_after = _SPACE_LARGE
+                        para_format.first_line_indent = _FIRST_LINE_INDENT if level > 1 else _NO_INDENT
                         
                         # Add source reference as italic
                         filename = para_data.get('filename', 'Unknown')
                         page = para_data.get('page_number', '?')
-                        source_ref = doc.add_paragraph(f'[Source: {filename}, page {page}]', style='Intense Quote')
-                        source_ref.paragraph_format.space_after = Pt(12)
-                        # Make it italic
-                        for run in source_ref.runs:
-                            run.italic = True
-                            run.font.size = Pt(9)
+                        source_ref = add_paragraph(style='Intense Quote')
+                        source_ref.paragraph_format.space_after = _SPACE_LARGE
+                        run = source_ref.add_run(f'[Source: {filename}, page {page}]')
+                        run.italic = True
+                        run.font.size = _SOURCE_REF_SIZE
             else:
                 # No content selected
-                empty_para = doc.add_paragraph('[No content selected for this section]', style='Intense Quote')
-                empty_para.paragraph_format.space_after = Pt(12)
-                for run in empty_para.runs:
-                    run.italic = True
-                    run.font.size = Pt(10)
+                empty_para = add_paragraph(style='Intense Quote')
+                empty_para.paragraph_format.space_after = _SPACE_LARGE
+                run = empty_para.add_run('[No content selected for this section]')
+                run.italic = True
+                run.font.size = _EMPTY_NOTE_SIZE
+        
+        sentinel._element.getparent().remove(sentinel._element)
         
         # Save document to bytes
         doc_bytes = BytesIO()
@@ -1,18 +1,81 @@
 """
 Local HNSW vector store for semantic search using hnswlib.
 """
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
+from contextlib import asynccontextmanager
+from itertools import islice
 from pathlib import Path
-import json
+import asyncio
 import os
+import threading
 import numpy as np
 import hnswlib
 
 from app.core.config import settings
+from app.core.json import dumps as json_dumps, loads as json_loads
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Deletions are appended to the tombstone log until it holds this fraction
+# of the live vectors; the next deletion then rewrites the snapshot
+TOMBSTONE_COMPACT_RATIO = 0.1
+
+# Filters matching at most this many vectors are searched exhaustively;
+# graph traversal with a selective filter visits many rejected nodes, each
+# costing a call back into Python
+EXACT_SEARCH_MAX_CANDIDATES = 128
+
+
+class _ReadWriteLock:
+    """
+    Asyncio readers-writer lock.
+
+    Any number of readers may hold the lock together, a writer holds it
+    alone. Waiting writers block new readers, so a steady stream of
+    searches cannot starve an insert.
+    """
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        """Hold the lock shared with other readers."""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: not self._writer and not self._writers_waiting
+            )
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                self._condition.notify_all()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """Hold the lock exclusively."""
+        async with self._condition:
+            self._writers_waiting += 1
+            try:
+                await self._condition.wait_for(
+                    lambda: not self._writer and self._readers == 0
+                )
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
 
 class VectorStore:
     """Local HNSW vector store for semantic search."""
@@ -37,42 +100,174 @@ class VectorStore:
         
         self.index_path = self.data_dir / "vector_index.bin"
         self.metadata_path = self.data_dir / "vector_metadata.json"
+        self.tombstone_path = self.data_dir / "vector_tombstones.log"
         
-        # HNSW index
-        self.index: Optional[hnswlib.Index] = None
+        # HNSW index, read from disk on first access (see the index property)
+        self._index: Optional[hnswlib.Index] = None
+        self._index_lock = threading.Lock()
         
         # Metadata storage: {id: {content, filename, page_number, ...}}
         self.metadata: Dict[str, Dict[str, Any]] = {}
         
-        # ID to index mapping
+        # ID to index mapping; the reverse mapping is a list indexed by the
+        # (dense) internal index, with None for deleted vectors
         self.id_to_index: Dict[str, int] = {}
-        self.index_to_id: Dict[int, str] = {}
+        self.ids_by_index: List[Optional[str]] = []
         self.next_index = 0
+
+        # Unsaved changes since the last write; saves are serialized so that
+        # overlapping persist() calls coalesce into one write
+        self._dirty = False
+        self._persist_lock = asyncio.Lock()
+
+        # Deletions recorded in the tombstone log since the last snapshot
+        self._tombstone_count = 0
+
+        # hnswlib does not allow resizing, inserting or deleting while the
+        # graph is searched or saved: searches and saves share this lock,
+        # changes to the index take it exclusively
+        self._lock = _ReadWriteLock()
+
+        # Lookups derived from the metadata, built on first use and dropped
+        # whenever the metadata changes: chunks grouped by filename, and
+        # per metadata field, the internal labels holding each value
+        self._chunks_by_filename: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._labels_by_field: Dict[str, Dict[Any, set]] = {}
         
-        # Load existing index if available
-        self._load_index()
+        # Load existing metadata if available; the index itself is loaded lazily
+        self._load_metadata()
+
+    @property
+    def index(self) -> hnswlib.Index:
+        """
+        HNSW index, loaded from disk on first access.
 
-    def _load_index(self) -> None:
-        """Load existing index and metadata from disk."""
+        Metadata-only operations (document context, stats on vector counts)
+        never pay for reading the graph into memory.
+        """
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    self._load_index_lazy()
+        return self._index
+
+    @index.setter
+    def index(self, value: hnswlib.Index) -> None:
+        self._index = value
+
+    async def _ensure_index(self) -> None:
+        """Load the index off the event loop if it has not been loaded yet."""
+        if self._index is None:
+            await asyncio.to_thread(lambda: self.index)
+
+    def _load_metadata(self) -> None:
+        """Load vector metadata and ID mappings from disk."""
         try:
             # Ensure data directory exists
             self.data_dir.mkdir(parents=True, exist_ok=True)
             
             if self.index_path.exists() and self.metadata_path.exists():
                 # Load metadata
-                with open(self.metadata_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.metadata = data.get('metadata', {})
-                    self.id_to_index = data.get('id_to_index', {})
-                    self.index_to_id = {v: k for k, v in self.id_to_index.items()}
-                    self.next_index = data.get('next_index', len(self.id_to_index))
-                
-                # Load HNSW index
-                self.index = hnswlib.Index(space='cosine', dim=self.dimension)
-                self.index.load_index(str(self.index_path))
+                data = json_loads(self.metadata_path.read_bytes())
+                self.metadata = data.get('metadata', {})
+                self.id_to_index = data.get('id_to_index', {})
+                self._replay_tombstones()
+
+                # Build the reverse mapping in the same pass that validates
+                # next_index, growing the list only if a label exceeds it
+                ids_by_index: List[Optional[str]] = (
+                    [None] * data.get('next_index', len(self.id_to_index))
+                )
+                for vector_id, internal_idx in self.id_to_index.items():
+                    if internal_idx >= len(ids_by_index):
+                        ids_by_index.extend([None] * (internal_idx + 1 - len(ids_by_index)))
+                    ids_by_index[internal_idx] = vector_id
+                self.ids_by_index = ids_by_index
+                self.next_index = len(ids_by_index)
+                self._invalidate_lookups()
+                logger.info(
+                    f"Loaded metadata for {len(self.metadata)} vectors from {self.metadata_path}"
+                )
+        except Exception as e:
+            logger.warning(f"Error loading metadata, creating new index: {e}")
+            self._create_new_index()
+
+    def _replay_tombstones(self) -> None:
+        """Apply deletions logged after the metadata snapshot was written."""
+        if not self.tombstone_path.exists():
+            return
+
+        with open(self.tombstone_path, 'rb') as f:
+            for line in f:
+                try:
+                    records = json_loads(line)
+                except ValueError:
+                    # A write interrupted by a crash leaves a partial last line
+                    logger.warning(f"Skipping unreadable tombstone record in {self.tombstone_path}")
+                    continue
+                for vector_id, internal_idx in records:
+                    # The label check skips IDs re-added after the deletion
+                    if self.id_to_index.get(vector_id) == internal_idx:
+                        del self.id_to_index[vector_id]
+                        self.metadata.pop(vector_id, None)
+                    self._tombstone_count += 1
+
+    def _append_tombstones(self, records: List[List[Any]]) -> None:
+        """
+        Append deletions to the tombstone log.
+
+        Args:
+            records: [vector_id, internal_idx] pairs of deleted vectors
+        """
+        with open(self.tombstone_path, 'ab') as f:
+            f.write(json_dumps(records).encode('utf-8') + b'\n')
+
+    async def _record_deletions(self, records: List[List[Any]]) -> None:
+        """
+        Make deletions durable, appending them to the tombstone log if possible.
+
+        Deleting a few vectors then costs one small append instead of
+        rewriting the index and all metadata. The snapshot is rewritten
+        instead (which also empties the log) when there are other unsaved
+        changes, no snapshot exists yet, or the log has grown past
+        TOMBSTONE_COMPACT_RATIO of the live vectors.
+
+        Args:
+            records: [vector_id, internal_idx] pairs of deleted vectors
+        """
+        async with self._persist_lock:
+            pending = self._tombstone_count + len(records)
+            if not (
+                self._dirty
+                or not self.metadata_path.exists()
+                or pending > len(self.id_to_index) * TOMBSTONE_COMPACT_RATIO
+            ):
+                await asyncio.to_thread(self._append_tombstones, records)
+                self._tombstone_count = pending
+                return
+            self._dirty = True
+        await self.persist()
+
+    def _load_index_lazy(self) -> None:
+        """Load the HNSW index from disk, or create a new one if there is none."""
+        try:
+            if self.index_path.exists() and self.metadata_path.exists():
+                index = hnswlib.Index(space='cosine', dim=self.dimension)
+                index.load_index(str(self.index_path), allow_replace_deleted=True)
+
+                # Indexes written before deletions were marked in the graph
+                # still hold deleted vectors as live elements
+                live_labels = set(self.id_to_index.values())
+                for label in index.get_ids_list():
+                    if label not in live_labels:
+                        try:
+                            index.mark_deleted(label)
+                        except RuntimeError:
+                            pass  # Already marked
                 
                 # Set ef parameter for search
-                self.index.set_ef(50)
+                index.set_ef(settings.hnsw_ef_search)
+                self._index = index
                 
                 logger.info(
                     f"Loaded vector index with {len(self.metadata)} vectors from {self.index_path}"
@@ -89,30 +284,35 @@ class VectorStore:
         """Create a new HNSW index."""
         # Initialize HNSW index
         # max_elements: maximum number of elements (can be increased)
-        # ef_construction: controls index search speed/build speed tradeoff
-        # M: number of bi-directional links (higher = more accurate, slower)
         max_elements = 10000  # Can be increased later
-        ef_construction = 200
-        M = 16
         
         self.index = hnswlib.Index(space='cosine', dim=self.dimension)
-        self.index.init_index(max_elements=max_elements, ef_construction=ef_construction, M=M)
-        self.index.set_ef(50)  # ef should be > k for search
+        self.index.init_index(
+            max_elements=max_elements,
+            ef_construction=settings.hnsw_ef_construction,
+            M=settings.hnsw_m,
+            allow_replace_deleted=True,
+        )
+        self.index.set_ef(settings.hnsw_ef_search)
         
         self.metadata = {}
         self.id_to_index = {}
-        self.index_to_id = {}
+        self.ids_by_index = []
         self.next_index = 0
+        self._tombstone_count = 0
+        self._invalidate_lookups()
 
     def _save_index(self) -> None:
-        """Save index and metadata to disk."""
+        """Save index and metadata to disk, replacing each file atomically."""
         try:
             # Ensure directory exists
             self.index_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save HNSW index
-            if self.index is not None:
-                self.index.save_index(str(self.index_path))
+            # Save HNSW index; an index that was never loaded is unchanged
+            if self._index is not None:
+                tmp_index_path = self.index_path.with_name(self.index_path.name + ".tmp")
+                self.index.save_index(str(tmp_index_path))
+                os.replace(tmp_index_path, self.index_path)
             
             # Save metadata
             data = {
@@ -120,69 +320,160 @@ class VectorStore:
                 'id_to_index': self.id_to_index,
                 'next_index': self.next_index,
             }
-            with open(self.metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            tmp_metadata_path = self.metadata_path.with_name(self.metadata_path.name + ".tmp")
+            with open(tmp_metadata_path, 'w', encoding='utf-8') as f:
+                f.write(json_dumps(data))
+            os.replace(tmp_metadata_path, self.metadata_path)
+
+            # The snapshot now includes every logged deletion
+            self.tombstone_path.unlink(missing_ok=True)
+            self._tombstone_count = 0
             
             logger.debug(f"Saved vector index to {self.index_path}")
         except Exception as e:
             logger.error(f"Error saving index: {e}")
             raise
 
+    async def persist(self) -> None:
+        """
+        Write the index and metadata to disk if they changed.
+
+        Used after a series of add_vectors/delete_by_ids calls made with
+        persist=False, so a bulk run is saved once. A call made while a save
+        is in progress waits for it and only writes again if there were
+        further changes in the meantime.
+        """
+        async with self._persist_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                async with self._lock.read():
+                    await asyncio.to_thread(self._save_index)
+            except Exception:
+                self._dirty = True
+                raise
+
+    def _reserve(self, max_elements: int) -> None:
+        """
+        Grow the index capacity ahead of a bulk insert.
+
+        Must be called with the write lock held, since resizing frees the
+        memory concurrent searches would read.
+
+        hnswlib copies the whole graph on every resize, so add_vectors sizes
+        the index once per batch, counting deleted slots that the batch will
+        reuse.
+
+        Args:
+            max_elements: Total number of elements the index must hold
+        """
+        current_max = self.index.get_max_elements()
+        if max_elements > current_max:
+            # Resize index (can only grow, not shrink)
+            self.index.resize_index(max_elements)
+            logger.info(f"Resized index to {max_elements} elements")
+
     async def add_vectors(
         self,
-        vectors: List[List[float]],
+        vectors: Union[List[List[float]], np.ndarray, bytes, bytearray, memoryview],
         ids: List[str],
         metadata_list: List[Dict[str, Any]],
+        persist: bool = True,
     ) -> int:
         """
         Add vectors to the index.
 
         Args:
-            vectors: List of embedding vectors
+            vectors: Embedding vectors, as a list, a 2-D float array, or raw
+                native-endian float32 bytes (row-major, dimension per row)
             ids: List of unique IDs for each vector
             metadata_list: List of metadata dictionaries for each vector
+            persist: Save to disk afterwards; pass False and call persist()
+                once when making several changes in a row
 
         Returns:
             Number of vectors added
         """
-        if not vectors or not ids:
+        # Convert to numpy array; float32 arrays and raw float32 buffers are
+        # used without a copy
+        if isinstance(vectors, (bytes, bytearray, memoryview)):
+            vectors_array = np.frombuffer(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        else:
+            vectors_array = np.asarray(vectors, dtype=np.float32)
+
+        if len(vectors_array) == 0 or not ids:
             return 0
 
-        if len(vectors) != len(ids) or len(vectors) != len(metadata_list):
+        if len(vectors_array) != len(ids) or len(vectors_array) != len(metadata_list):
             raise ValueError("vectors, ids, and metadata_list must have same length")
 
-        try:
-            # Convert to numpy array
-            vectors_array = np.array(vectors, dtype=np.float32)
-
-            # Check if index needs to be resized
-            current_max = self.index.get_max_elements()
-            needed_size = self.next_index + len(vectors)
-            
-            if needed_size > current_max:
-                # Resize index (can only grow, not shrink)
-                new_size = max(current_max * 2, needed_size)
-                self.index.resize_index(new_size)
-                logger.info(f"Resized index to {new_size} elements")
+        # A malformed row would silently corrupt the graph
+        if vectors_array.shape != (len(ids), self.dimension):
+            raise ValueError(
+                f"vectors must have shape ({len(ids)}, {self.dimension}), "
+                f"got {vectors_array.shape}"
+            )
+        if not np.isfinite(vectors_array).all():
+            raise ValueError("vectors must not contain NaN or infinite values")
 
-            # Add vectors to index
-            start_idx = self.next_index
-            self.index.add_items(vectors_array, np.arange(start_idx, start_idx + len(vectors)))
+        try:
+            await self._ensure_index()
+
+            # Labels are taken from next_index across awaits, so concurrent
+            # inserts must not interleave
+            async with self._lock.write():
+                # Re-added IDs replace their previous vector
+                for vector_id in ids:
+                    old_idx = self.id_to_index.pop(vector_id, None)
+                    if old_idx is not None:
+                        self.ids_by_index[old_idx] = None
+                        self.index.mark_deleted(old_idx)
+
+                # Deleted slots are reused first; only the remainder needs
+                # room in the index
+                current_count = self.index.get_current_count()
+                free_slots = current_count - len(self.id_to_index)
+                current_max = self.index.get_max_elements()
+                needed_size = current_count + max(0, len(ids) - free_slots)
+
+                if needed_size > current_max:
+                    # Grow geometrically so repeated small inserts resize rarely
+                    await asyncio.to_thread(
+                        self._reserve, max(current_max * 2, needed_size)
+                    )
+
+                # Add vectors to index; hnswlib inserts in parallel and releases
+                # the GIL, so run it off the event loop. Small batches use fewer
+                # threads, since thread startup outweighs the insert work.
+                start_idx = self.next_index
+                max_threads = settings.hnsw_num_threads or os.cpu_count() or 1
+                num_threads = min(len(ids) // 1024 + 1, max_threads)
+                await asyncio.to_thread(
+                    self.index.add_items,
+                    vectors_array,
+                    np.arange(start_idx, start_idx + len(ids)),
+                    num_threads=num_threads,
+                    replace_deleted=True,
+                )
 
-            # Store metadata and mappings
-            for idx, (vector_id, metadata) in enumerate(zip(ids, metadata_list)):
-                internal_idx = start_idx + idx
-                self.id_to_index[vector_id] = internal_idx
-                self.index_to_id[internal_idx] = vector_id
-                self.metadata[vector_id] = metadata
+                # Store metadata and mappings
+                for idx, (vector_id, metadata) in enumerate(zip(ids, metadata_list)):
+                    internal_idx = start_idx + idx
+                    self.id_to_index[vector_id] = internal_idx
+                    self.metadata[vector_id] = metadata
+                self.ids_by_index.extend(ids)
 
-            self.next_index += len(vectors)
+                self.next_index += len(ids)
+                self._invalidate_lookups()
+                self._dirty = True
 
             # Save to disk
-            self._save_index()
+            if persist:
+                await self.persist()
 
-            logger.info(f"Added {len(vectors)} vectors to index")
-            return len(vectors)
+            logger.info(f"Added {len(ids)} vectors to index")
+            return len(ids)
 
         except Exception as e:
             logger.error(f"Error adding vectors: {e}")
@@ -190,7 +481,7 @@ class VectorStore:
 
     async def search(
         self,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         top_k: int = 10,
         filters: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
@@ -200,52 +491,79 @@ class VectorStore:
         Args:
             query_vector: Query embedding vector
             top_k: Number of results to return
-            filters: Optional filters (e.g., {"filename": "doc.pdf"})
+            filters: Optional filters (e.g., {"filename": "doc.pdf"} or
+                {"filename": ["a.pdf", "b.pdf"]})
 
         Returns:
             List of search results with metadata
         """
-        if self.index is None or len(self.metadata) == 0:
+        if len(self.metadata) == 0:
             return []
+        await self._ensure_index()
 
         try:
-            # Convert query to numpy array
-            query_array = np.array([query_vector], dtype=np.float32)
-
-            # Search in index
-            # Returns (labels, distances) where labels are internal indices
-            labels, distances = self.index.knn_query(query_array, k=min(top_k * 2, len(self.metadata)))
-
-            # Convert internal indices to IDs and apply filters
-            results = []
-            for label, distance in zip(labels[0], distances[0]):
-                internal_idx = int(label)
-                
-                if internal_idx not in self.index_to_id:
-                    continue
-                
-                vector_id = self.index_to_id[internal_idx]
-                metadata = self.metadata.get(vector_id, {}).copy()
-                
-                # Apply filters
-                if filters:
-                    match = True
-                    for key, value in filters.items():
-                        if metadata.get(key) != value:
-                            match = False
-                            break
-                    if not match:
-                        continue
-                
-                # Add similarity score (1 - distance for cosine similarity)
-                metadata['id'] = vector_id
-                metadata['score'] = float(1.0 - distance)  # Cosine distance to similarity
-                metadata['distance'] = float(distance)
-                
-                results.append(metadata)
-                
-                if len(results) >= top_k:
-                    break
+            # View the query as a 1 x dimension float32 array; float32
+            # embeddings are used as-is without a copy
+            query_array = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+
+            # Holding the read lock keeps inserts and resizes, which hnswlib
+            # does not allow during a search, out until results are built
+            async with self._lock.read():
+                # Resolve filters up front so the index only visits matching
+                # vectors instead of over-fetching and post-filtering
+                allowed = self._allowed_labels(filters) if filters else None
+
+                # Search in index
+                # Returns (labels, distances) where labels are internal indices
+                # hnswlib releases the GIL while searching, so concurrent
+                # searches run in parallel off the event loop
+                if allowed is None:
+                    k = min(top_k, len(self.id_to_index))
+                    if k == 0:
+                        return []
+                    labels, distances = await asyncio.to_thread(
+                        self.index.knn_query,
+                        query_array,
+                        k=k,
+                        num_threads=1,
+                    )
+                else:
+                    k = min(top_k, len(allowed))
+                    if k == 0:
+                        return []
+                    if len(allowed) <= EXACT_SEARCH_MAX_CANDIDATES:
+                        labels, distances = await asyncio.to_thread(
+                            self._exact_search, query_array, allowed, k
+                        )
+                    else:
+                        labels, distances = await asyncio.to_thread(
+                            self.index.knn_query,
+                            query_array,
+                            k=k,
+                            num_threads=1,
+                            filter=allowed.__contains__,
+                        )
+
+                # Convert internal indices to IDs; deleted vectors are excluded
+                # by the index, the None check only guards stale mappings.
+                # tolist() converts the whole row to Python numbers at once
+                hits = (
+                    (vector_id, distance)
+                    for vector_id, distance in zip(
+                        map(self.ids_by_index.__getitem__, labels[0].tolist()),
+                        distances[0].tolist(),
+                    )
+                    if vector_id is not None
+                )
+                results = [
+                    {
+                        **self.metadata.get(vector_id, {}),
+                        'id': vector_id,
+                        'score': 1.0 - distance,  # Cosine distance to similarity
+                        'distance': distance,
+                    }
+                    for vector_id, distance in islice(hits, top_k)
+                ]
 
             logger.debug(f"Search returned {len(results)} results")
             return results
@@ -254,36 +572,157 @@ class VectorStore:
             logger.error(f"Error searching vectors: {e}")
             raise
 
-    async def delete_by_ids(self, ids: List[str]) -> int:
+    def _exact_search(
+        self, query_array: np.ndarray, allowed: set, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank a small set of vectors by brute force.
+
+        Args:
+            query_array: 1 x dimension query vector
+            allowed: Internal labels to rank
+            k: Number of nearest vectors to return (at most len(allowed))
+
+        Returns:
+            (labels, distances) shaped like knn_query's result
+        """
+        candidates = np.fromiter(allowed, dtype=np.uint64, count=len(allowed))
+
+        # The cosine space stores normalized vectors, so only the query needs
+        # normalizing before the dot product
+        vectors = np.asarray(self.index.get_items(candidates), dtype=np.float32)
+        query = query_array[0] / (np.linalg.norm(query_array[0]) + 1e-30)
+        distances = 1.0 - vectors @ query
+
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+        return candidates[top][np.newaxis], distances[top][np.newaxis]
+
+    async def delete_by_ids(self, ids: List[str], persist: bool = True) -> int:
         """
         Delete vectors by IDs.
 
-        Note: HNSW doesn't support deletion efficiently, so we mark as deleted.
+        Vectors are marked as deleted in the HNSW graph, so searches skip
+        them, and their slots are reused by later inserts. When persisted,
+        small deletions are appended to a tombstone log rather than
+        rewriting the whole index.
 
         Args:
             ids: List of vector IDs to delete
+            persist: Save to disk afterwards
 
         Returns:
             Number of vectors deleted
         """
+        if any(vector_id in self.metadata for vector_id in ids):
+            await self._ensure_index()
+
         deleted = 0
-        for vector_id in ids:
-            if vector_id in self.metadata:
-                # Mark as deleted (remove from metadata)
-                del self.metadata[vector_id]
-                if vector_id in self.id_to_index:
-                    internal_idx = self.id_to_index[vector_id]
-                    del self.id_to_index[vector_id]
-                    if internal_idx in self.index_to_id:
-                        del self.index_to_id[internal_idx]
-                deleted += 1
+        tombstones = []
+        async with self._lock.write():
+            for vector_id in ids:
+                if vector_id in self.metadata:
+                    # Mark as deleted (remove from metadata)
+                    del self.metadata[vector_id]
+                    internal_idx = self.id_to_index.pop(vector_id, None)
+                    if internal_idx is not None:
+                        self.ids_by_index[internal_idx] = None
+                        self.index.mark_deleted(internal_idx)
+                        tombstones.append([vector_id, internal_idx])
+                    deleted += 1
 
         if deleted > 0:
-            self._save_index()
+            self._invalidate_lookups()
+            if not persist:
+                self._dirty = True
+            elif len(tombstones) == deleted:
+                await self._record_deletions(tombstones)
+            else:
+                # Metadata without a label cannot be replayed from the log
+                self._dirty = True
+                await self.persist()
             logger.info(f"Deleted {deleted} vectors from index")
 
         return deleted
 
+    def _invalidate_lookups(self) -> None:
+        """Drop lookups derived from the metadata after it changed."""
+        self._chunks_by_filename = None
+        self._labels_by_field = {}
+
+    def chunks_for_file(self, filename: str) -> List[Dict[str, Any]]:
+        """
+        Get the metadata of all chunks from one document.
+
+        The grouping by filename is built once over all metadata and reused
+        until the store is next modified.
+
+        Args:
+            filename: Source document filename
+
+        Returns:
+            Chunk metadata dictionaries sorted by chunk_index (do not modify)
+        """
+        if self._chunks_by_filename is None:
+            chunks_by_filename: Dict[str, List[Dict[str, Any]]] = {}
+            for metadata in self.metadata.values():
+                chunks_by_filename.setdefault(metadata.get('filename'), []).append(metadata)
+            for chunks in chunks_by_filename.values():
+                chunks.sort(key=lambda m: m.get('chunk_index', 0))
+            self._chunks_by_filename = chunks_by_filename
+        return self._chunks_by_filename.get(filename, [])
+
+    def _labels_for_field(self, key: str) -> Dict[Any, set]:
+        """
+        Get the inverted index of one metadata field.
+
+        Args:
+            key: Metadata field name
+
+        Returns:
+            Dictionary mapping each value of the field to the internal
+            labels of the vectors holding it (missing fields map to None)
+        """
+        labels_by_value = self._labels_by_field.get(key)
+        if labels_by_value is None:
+            labels_by_value = {}
+            for vector_id, internal_idx in self.id_to_index.items():
+                value = self.metadata.get(vector_id, {}).get(key)
+                try:
+                    labels_by_value.setdefault(value, set()).add(internal_idx)
+                except TypeError:
+                    # Unhashable values (lists, dicts) cannot be filtered on
+                    continue
+            self._labels_by_field[key] = labels_by_value
+        return labels_by_value
+
+    def _allowed_labels(self, filters: Dict[str, Any]) -> Optional[set]:
+        """
+        Resolve search filters to the internal labels that satisfy them.
+
+        A filter value that is a list, tuple or set matches any of its
+        elements; any other value must match exactly. Each field is answered
+        from its inverted index, and the fields are intersected.
+
+        Args:
+            filters: Metadata filters
+
+        Returns:
+            Set of matching labels, or None if the filters match everything
+        """
+        matches = []
+        for key, value in filters.items():
+            values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+            labels_by_value = self._labels_for_field(key)
+            matches.append(set().union(*(labels_by_value.get(v, ()) for v in values)))
+
+        if all(len(labels) == len(self.id_to_index) for labels in matches):
+            # e.g. every indexed file is wanted, nothing to prune
+            return None
+
+        matches.sort(key=len)
+        return matches[0].intersection(*matches[1:])
+
     def is_empty(self) -> bool:
         """
         Check if the index is empty (has no vectors).
@@ -295,10 +734,12 @@ class VectorStore:
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector store."""
+        # Load the index off the event loop before reading its capacity
+        await self._ensure_index()
         return {
             "total_vectors": len(self.metadata),
             "dimension": self.dimension,
-            "max_elements": self.index.get_max_elements() if self.index else 0,
+            "max_elements": self._index.get_max_elements() if self._index is not None else 0,
             "current_count": self.next_index,
             "index_path": str(self.index_path),
         }
@@ -306,15 +747,39 @@ class VectorStore:
     async def clear(self) -> bool:
         """Clear all vectors from the index."""
         try:
-            self._create_new_index()
-            # Delete files
-            if self.index_path.exists():
-                self.index_path.unlink()
-            if self.metadata_path.exists():
-                self.metadata_path.unlink()
+            async with self._persist_lock, self._lock.write():
+                self._create_new_index()
+                self._dirty = False
+                # Delete files
+                if self.index_path.exists():
+                    self.index_path.unlink()
+                if self.metadata_path.exists():
+                    self.metadata_path.unlink()
+                self.tombstone_path.unlink(missing_ok=True)
             logger.info("Cleared vector index")
             return True
         except Exception as e:
             logger.error(f"Error clearing index: {e}")
             raise
 
+
+# Shared by every request, so the index locks and unsaved-change tracking
+# cover all users of the index files
+_vector_store: Optional[VectorStore] = None
+
+
+def get_vector_store() -> VectorStore:
+    """
+    Get the process-wide vector store.
+
+    Separate instances would each hold their own copy of the index and their
+    own locks, so concurrent requests could resize the graph under another's
+    search or write the same files at once.
+
+    Returns:
+        Shared VectorStore
+    """
+    global _vector_store
+    if _vector_store is None:
+        _vector_store = VectorStore(dimension=1536)  # ada-002 dimension
+    return _vector_store
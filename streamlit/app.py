@@ -2,9 +2,18 @@
 Streamlit interface for AI Lifting Document Cleanup Tool
 """
 import streamlit as st
+import base64
+import io
 import requests
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util.retry import Retry
 import json
-from typing import Optional, Dict, Any
+import orjson
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +22,9 @@ import os
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 API_PREFIX = "/api/v1"
 
+# Seconds to wait for a connection to the API; read timeouts are per call
+CONNECT_TIMEOUT = 5
+
 # Page configuration
 st.set_page_config(
     page_title="AI Document Cleanup",
@@ -46,45 +58,309 @@ st.markdown("""
     .stButton>button {
         width: 100%;
     }
+    .stTextInput, .stNumberInput, .stTextArea {
+        max-width: 640px;
+    }
     </style>
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Get the HTTP session shared by all reruns.
+    
+    Streamlit reruns the whole script on every interaction; a shared
+    session keeps connections to the API alive between reruns instead of
+    opening a new TCP (and TLS) connection for every request.
+    """
+    session = requests.Session()
+    # Retry transient gateway errors with exponential backoff. POST is left
+    # out so that non-idempotent calls (creating a session, generating a
+    # document) are never repeated; failed connections are retried for
+    # every method, since the request was never sent.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _send_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
+    """Send an API request and return the decoded JSON body, raising on failure."""
+    url = f"{API_BASE_URL}{API_PREFIX}{endpoint}"
+    session = get_http_session()
+    
+    if method == "GET":
+        response = session.get(url, params=params, timeout=(CONNECT_TIMEOUT, 30))
+    elif method == "POST":
+        # Longer timeout for analysis and indexing endpoints that use LLM
+        if "analyze" in endpoint.lower() or "index" in endpoint.lower() or "batch" in endpoint.lower():
+            timeout_value = 600  # 10 minutes for LLM-heavy operations
+        else:
+            timeout_value = 60
+        response = session.post(url, json=data, params=params, timeout=(CONNECT_TIMEOUT, timeout_value))
+    elif method == "PUT":
+        response = session.put(url, json=data, params=params, timeout=(CONNECT_TIMEOUT, 60))
+    elif method == "DELETE":
+        response = session.delete(url, timeout=(CONNECT_TIMEOUT, 30))
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+        
+    response.raise_for_status()
+    # orjson parses large responses (paragraph batches, inlined documents)
+    # several times faster than the stdlib decoder behind response.json()
+    return orjson.loads(response.content)
+
+
+def _show_api_error(e: requests.exceptions.RequestException) -> None:
+    """Display a failed API request."""
+    st.error(f"API Error: {str(e)}")
+    if hasattr(e, 'response') and e.response is not None:
+        try:
+            error_detail = e.response.json()
+            st.error(f"Details: {error_detail}")
+        except:
+            st.error(f"Response: {e.response.text}")
+
+
 def make_api_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Optional[Dict]:
     """Make API request and handle errors."""
-    url = f"{API_BASE_URL}{API_PREFIX}{endpoint}"
+    try:
+        return _send_request(method, endpoint, data, params)
+    except requests.exceptions.RequestException as e:
+        _show_api_error(e)
+        return None
+    except ValueError as e:
+        st.error(str(e))
+        return None
+
+
+# Sections whose found paragraphs are kept in session state
+MAX_CACHED_SECTIONS = 32
+
+
+def fetch_document(session_id: int) -> Optional[bytes]:
+    """
+    Download a generated synthesis document.
+    
+    The file is streamed in chunks straight into memory, instead of being
+    inlined base64-encoded in a JSON response.
     
+    Args:
+        session_id: Synthesis session ID
+    
+    Returns:
+        DOCX file contents, or None if the download failed
+    """
+    url = f"{API_BASE_URL}{API_PREFIX}/synthesis/sessions/{session_id}/document"
     try:
-        if method == "GET":
-            response = requests.get(url, params=params, timeout=30)
-        elif method == "POST":
-            # Longer timeout for analysis and indexing endpoints that use LLM
-            if "analyze" in endpoint.lower() or "index" in endpoint.lower():
-                timeout_value = 600  # 10 minutes for LLM-heavy operations
-            else:
-                timeout_value = 60
-            response = requests.post(url, json=data, params=params, timeout=timeout_value)
-        elif method == "PUT":
-            response = requests.put(url, json=data, params=params, timeout=60)
-        elif method == "DELETE":
-            response = requests.delete(url, timeout=30)
-        else:
-            st.error(f"Unsupported HTTP method: {method}")
-            return None
-            
-        response.raise_for_status()
-        return response.json()
+        with get_http_session().get(url, stream=True, timeout=(CONNECT_TIMEOUT, 60)) as response:
+            response.raise_for_status()
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                buffer.write(chunk)
+            return buffer.getvalue()
+    except requests.exceptions.RequestException:
+        return None
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get(endpoint: str, params: Optional[Dict] = None) -> Dict:
+    """Send a GET request, caching successful responses for 30 seconds."""
+    # Failures raise, and Streamlit does not cache exceptions
+    return _send_request("GET", endpoint, params=params)
+
+
+def cached_api_get(endpoint: str, params: Optional[Dict] = None, force_refresh: bool = False) -> Optional[Dict]:
+    """
+    Make a cached GET request and handle errors.
+    
+    Args:
+        endpoint: API endpoint, relative to the API prefix
+        params: Optional query parameters
+        force_refresh: Drop all cached responses before the request
+    
+    Returns:
+        Decoded response, or None if the request failed
+    """
+    if force_refresh:
+        _cached_get.clear()
+    try:
+        return _cached_get(endpoint, params)
     except requests.exceptions.RequestException as e:
-        st.error(f"API Error: {str(e)}")
-        if hasattr(e, 'response') and e.response is not None:
-            try:
-                error_detail = e.response.json()
-                st.error(f"Details: {error_detail}")
-            except:
-                st.error(f"Response: {e.response.text}")
+        _show_api_error(e)
         return None
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def list_pdf_files() -> list[str]:
+    """
+    List the PDF files in the data folder.
+    
+    Streamlit reruns the script on every interaction, so the scan is cached
+    for a minute; use list_pdf_files.clear() to pick up new files sooner.
+    """
+    # Try multiple paths (local dev, Docker container)
+    possible_paths = [
+        Path("/app/data"),  # Docker container path
+        Path("data"),  # Local development
+        Path("../data"),  # Alternative local path
+    ]
+    
+    for data_dir in possible_paths:
+        if data_dir.exists():
+            pdf_files = [f.name for f in data_dir.glob("*.pdf")]
+            if pdf_files:
+                return pdf_files
+    return []
+
+
+def prefetch_startup() -> None:
+    """
+    Load the PDF list, statistics and index schema concurrently.
+    
+    The results land in the list_pdf_files and _cached_get caches, so the
+    synthesis tab and the stats/schema buttons respond from memory; the
+    startup wait is the slowest of the three instead of their sum. Failures
+    are ignored here and reported when the data is actually requested.
+    """
+    ctx = get_script_run_ctx()
+    
+    def run(fn, *args) -> None:
+        # Cached functions need the script context of the current session
+        add_script_run_ctx(threading.current_thread(), ctx)
+        try:
+            fn(*args)
+        except Exception:
+            pass
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        executor.submit(run, list_pdf_files)
+        executor.submit(run, _cached_get, "/search/stats")
+        executor.submit(run, _cached_get, "/documents/index-schema")
+
+
+def remember_paragraphs(results: Dict[str, List[Dict[str, Any]]]) -> None:
+    """
+    Keep found paragraphs in session state, evicting the least recently found.
+    
+    At most MAX_CACHED_SECTIONS sections are kept (or all of results, if
+    more were found at once); evicted sections can simply be searched
+    again. Selections are never evicted.
+    
+    Args:
+        results: Paragraphs found per section title
+    """
+    paragraphs_by_section = st.session_state.synthesis_paragraphs
+    for section_title, paragraphs in results.items():
+        paragraphs_by_section[section_title] = paragraphs
+        paragraphs_by_section.move_to_end(section_title)
+    
+    while len(paragraphs_by_section) > max(MAX_CACHED_SECTIONS, len(results)):
+        paragraphs_by_section.popitem(last=False)
+
+
+def forget_removed_sections() -> None:
+    """Drop found paragraphs of sections no longer in the inventory table."""
+    titles = {section.get("title", "") for section in st.session_state.synthesis_inventory}
+    for section_title in list(st.session_state.synthesis_paragraphs):
+        if section_title not in titles:
+            del st.session_state.synthesis_paragraphs[section_title]
+
+
+@st.fragment
+def render_paragraph_selector(
+    section_title: str,
+    paragraphs: List[Dict[str, Any]],
+    status: str,
+    key_suffix: str = "",
+) -> None:
+    """
+    Show a section's paragraphs as a selection table and record the choice.
+    
+    Runs as a fragment: editing the table reruns only this function, not
+    the whole script.
+    
+    Args:
+        section_title: Section the paragraphs were found for
+        paragraphs: Paragraphs returned by the API
+        status: How the paragraphs were obtained ("found" or "loaded"),
+            shown in the summary line
+        key_suffix: Suffix for the widget key, so the table can be shown
+            from more than one place
+    """
+    # Initialize selected_para_ids if not exists
+    if section_title not in st.session_state.synthesis_selected:
+        st.session_state.synthesis_selected[section_title] = []
+    
+    # Display paragraphs as one selection table. Selections stay a list,
+    # since their order is the paragraph order in the generated document;
+    # membership is tested against a set built once.
+    selected_ids = st.session_state.synthesis_selected[section_title]
+    editor_key = f"paras_{section_title}{key_suffix}"
+    
+    # The editor's input must not change as rows are ticked, or Streamlit
+    # treats it as a new widget and drops the edits. Keep the initial
+    # checkbox values until a different set of paragraphs is shown, or the
+    # table was not rendered last run and its edits are gone.
+    para_ids = tuple(para.get("id", "") for para in paragraphs)
+    snapshots = st.session_state.setdefault("synthesis_editor_snapshots", {})
+    snapshot = snapshots.get(editor_key)
+    if snapshot is None or snapshot[0] != para_ids or editor_key not in st.session_state:
+        selected_set = set(selected_ids)
+        snapshot = (para_ids, tuple(para_id in selected_set for para_id in para_ids))
+        snapshots[editor_key] = snapshot
+    initial_select = snapshot[1]
+    
+    paragraph_rows = [
+        {
+            "Select": is_selected,
+            "File": para.get("filename", "Unknown"),
+            "Page": para.get("page_number", "?"),
+            # LLM relevance score if available, otherwise the vector score
+            "Score": (
+                para["llm_relevance_score"]
+                if para.get("llm_relevance_score") is not None
+                else para.get("score", 0)
+            ),
+            "Content": para.get("content", ""),
+            "ID": para.get("id", ""),
+        }
+        for para, is_selected in zip(paragraphs, initial_select)
+    ]
+    edited_rows = st.data_editor(
+        paragraph_rows,
+        column_config={
+            "Select": st.column_config.CheckboxColumn("Select"),
+            "Score": st.column_config.NumberColumn("Score", format="%.3f"),
+            "Content": st.column_config.TextColumn("Content", width="large"),
+        },
+        column_order=["Select", "File", "Page", "Score", "Content"],
+        disabled=["File", "Page", "Score", "Content", "ID"],
+        hide_index=True,
+        use_container_width=True,
+        key=editor_key
+    )
+    
+    # The returned rows hold the snapshot with the user's edits applied.
+    # Keep selections of paragraphs not listed here, then add the checked rows
+    shown_ids = {row["ID"] for row in edited_rows}
+    st.session_state.synthesis_selected[section_title] = [
+        para_id for para_id in selected_ids if para_id not in shown_ids
+    ] + [row["ID"] for row in edited_rows if row["Select"]]
+    
+    # Show info after processing the selection table
+    selected_count = len(st.session_state.synthesis_selected[section_title])
+    st.info(f"{len(paragraphs)} paragraphs {status}, {selected_count} selected")
+
+
 def main():
     """Main application."""
     # Header
@@ -107,7 +383,7 @@ def main():
         if st.button("🔍 Check API Status"):
             with st.spinner("Checking API..."):
                 try:
-                    response = requests.get(f"{api_url}/health", timeout=5)
+                    response = get_http_session().get(f"{api_url}/health", timeout=(CONNECT_TIMEOUT, 5))
                     if response.status_code == 200:
                         health_data = response.json()
                         st.success("✅ API is healthy")
@@ -117,6 +393,11 @@ def main():
                 except Exception as e:
                     st.error(f"❌ Cannot connect to API: {str(e)}")
     
+    # Warm the caches once per browser session
+    if "prefetched" not in st.session_state:
+        prefetch_startup()
+        st.session_state.prefetched = True
+    
     # Main tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["🔍 Search", "📄 Index Documents", "📊 Statistics", "⚙️ Management", "📝 Synthesis"])
     
@@ -185,23 +466,16 @@ def main():
         st.header("Index Documents")
         st.markdown("Index documents from the data folder into the vector store.")
         
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            session_id = st.number_input(
-                "Session ID (optional)",
-                min_value=1,
-                value=1,
-                step=1,
-                help="Optional session ID to associate documents with"
-            )
-        
-        with col2:
-            st.write("")  # Spacing
-            st.write("")  # Spacing
+        session_id = st.number_input(
+            "Session ID (optional)",
+            min_value=1,
+            value=1,
+            step=1,
+            help="Optional session ID to associate documents with"
+        )
         
         if st.button("🚀 Index Documents", type="primary", use_container_width=True):
-            with st.spinner("Indexing documents... This may take a while."):
+            with st.spinner("Indexing documents... This may take a while.", show_time=True):
                 result = make_api_request(
                     "POST",
                     "/documents/index-data-folder",
@@ -237,9 +511,15 @@ def main():
         
         # Index Schema
         st.subheader("Vector Store Schema")
-        if st.button("📋 View Schema", use_container_width=True):
+        schema_col, schema_refresh_col = st.columns([3, 1])
+        with schema_col:
+            view_schema = st.button("📋 View Schema", use_container_width=True)
+        with schema_refresh_col:
+            refresh_schema = st.button("♻️ Force refresh", key="refresh_schema", use_container_width=True)
+        
+        if view_schema or refresh_schema:
             with st.spinner("Loading schema..."):
-                schema = make_api_request("GET", "/documents/index-schema")
+                schema = cached_api_get("/documents/index-schema", force_refresh=refresh_schema)
                 if schema:
                     st.json(schema)
     
@@ -248,9 +528,15 @@ def main():
         st.header("Vector Store Statistics")
         st.markdown("View statistics about your indexed documents.")
         
-        if st.button("📊 Refresh Statistics", type="primary", use_container_width=True):
+        stats_col, stats_refresh_col = st.columns([3, 1])
+        with stats_col:
+            load_stats = st.button("📊 Refresh Statistics", type="primary", use_container_width=True)
+        with stats_refresh_col:
+            refresh_stats = st.button("♻️ Force refresh", key="refresh_stats", use_container_width=True)
+        
+        if load_stats or refresh_stats:
             with st.spinner("Loading statistics..."):
-                stats = make_api_request("GET", "/search/stats")
+                stats = cached_api_get("/search/stats", force_refresh=refresh_stats)
                 
                 if stats:
                     col1, col2, col3, col4 = st.columns(4)
@@ -314,48 +600,39 @@ def main():
         if 'synthesis_inventory' not in st.session_state:
             st.session_state.synthesis_inventory = None
         if 'synthesis_paragraphs' not in st.session_state:
-            st.session_state.synthesis_paragraphs = {}
+            st.session_state.synthesis_paragraphs = OrderedDict()
         if 'synthesis_selected' not in st.session_state:
             st.session_state.synthesis_selected = {}
         
         # Step 1: Create or select session
         st.subheader("Step 1: Create Synthesis Session")
         
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            session_name = st.text_input("Session Name", value="Synthesis Session", key="synth_session_name")
-            session_desc = st.text_area("Description (optional)", key="synth_session_desc")
-        
-        with col2:
-            st.write("")  # Spacing
+        session_name = st.text_input("Session Name", value="Synthesis Session", key="synth_session_name")
+        session_desc = st.text_area("Description (optional)", key="synth_session_desc")
         
         # Get available PDF files
         try:
-            # Try multiple paths (local dev, Docker container)
-            possible_paths = [
-                Path("/app/data"),  # Docker container path
-                Path("data"),  # Local development
-                Path("../data"),  # Alternative local path
-            ]
-            
-            pdf_files = []
-            for data_dir in possible_paths:
-                if data_dir.exists():
-                    pdf_files = [f.name for f in data_dir.glob("*.pdf")]
-                    if pdf_files:
-                        break
+            pdf_files = list_pdf_files()
         except Exception as e:
             st.warning(f"Error finding PDF files: {e}")
             pdf_files = []
         
         if pdf_files:
-            selected_files = st.multiselect(
-                "Select Source Documents",
-                pdf_files,
-                default=pdf_files[:3] if len(pdf_files) >= 3 else pdf_files,
-                key="synth_selected_files"
-            )
+            files_col, refresh_col = st.columns([5, 1])
+            
+            with files_col:
+                selected_files = st.multiselect(
+                    "Select Source Documents",
+                    pdf_files,
+                    default=pdf_files[:3] if len(pdf_files) >= 3 else pdf_files,
+                    key="synth_selected_files"
+                )
+            
+            with refresh_col:
+                st.write("")  # Spacing
+                if st.button("🔄 Refresh files", key="refresh_pdf_files"):
+                    list_pdf_files.clear()
+                    st.rerun()
             
             if st.button("🚀 Create Session", type="primary", use_container_width=True):
                 if not selected_files:
@@ -385,7 +662,7 @@ def main():
             st.subheader("Step 2: Analyze Document Structures")
             
             if st.button("🔍 Analyze Structures & Generate Inventory Table", type="primary", use_container_width=True):
-                with st.spinner("Analyzing document structures... This may take a while."):
+                with st.spinner("Analyzing document structures... This may take a while.", show_time=True):
                     result = make_api_request(
                         "POST",
                         f"/synthesis/sessions/{st.session_state.synthesis_session_id}/analyze-structures",
@@ -444,6 +721,7 @@ def main():
                         
                         if result and result.get("success"):
                             st.session_state.synthesis_inventory = updated_inventory
+                            forget_removed_sections()
                             st.success("✅ Inventory table saved!")
                 
                 # Step 4: Review paragraphs for each section
@@ -451,17 +729,52 @@ def main():
                 st.subheader("Step 4: Review Paragraphs by Section")
                 
                 if st.session_state.synthesis_inventory:
+                    if st.button("🔍 Find Paragraphs for ALL sections", use_container_width=True):
+                        section_titles = [
+                            section.get("title", "")
+                            for section in st.session_state.synthesis_inventory
+                        ]
+                        with st.spinner(f"Finding relevant paragraphs for {len(section_titles)} sections...", show_time=True):
+                            result = make_api_request(
+                                "POST",
+                                f"/synthesis/sessions/{st.session_state.synthesis_session_id}/paragraphs:batch",
+                                data={
+                                    "sections": section_titles,
+                                    "top_k": 10
+                                }
+                            )
+                        
+                        if result and result.get("success"):
+                            results = result.get("results", {})
+                            remember_paragraphs(results)
+                            for section_title in results:
+                                st.session_state.synthesis_selected.setdefault(section_title, [])
+                            st.rerun()
+                    
                     for section in sorted(st.session_state.synthesis_inventory, key=lambda x: x.get("order", 999)):
                         section_title = section.get("title", "")
                         section_level = section.get("level", 1)
                         
-                        # Add indentation to expander title based on level
+                        # Add indentation to section title based on level
                         indent_prefix = "  " * (section_level - 1)
-                        expander_title = f"{indent_prefix}📄 {section_title}"
+                        is_open = st.session_state.get("open_section") == section_title
+                        toggle_icon = "▾" if is_open else "▸"
+                        
+                        # Only the open section builds its widgets; the others
+                        # are a single button each
+                        if st.button(
+                            f"{indent_prefix}{toggle_icon} 📄 {section_title}",
+                            key=f"open_{section_title}"
+                        ):
+                            st.session_state.open_section = None if is_open else section_title
+                            st.rerun()
                         
-                        with st.expander(expander_title, expanded=False):
+                        if not is_open:
+                            continue
+                        
+                        with st.container(border=True):
                             if st.button(f"🔍 Find Paragraphs for: {section_title}", key=f"find_{section_title}"):
-                                with st.spinner(f"Finding relevant paragraphs for '{section_title}'..."):
+                                with st.spinner(f"Finding relevant paragraphs for '{section_title}'...", show_time=True):
                                     result = make_api_request(
                                         "POST",
                                         f"/synthesis/sessions/{st.session_state.synthesis_session_id}/paragraphs",
@@ -473,103 +786,17 @@ def main():
                                     
                                     if result and result.get("success"):
                                         paragraphs = result.get("paragraphs", [])
-                                        st.session_state.synthesis_paragraphs[section_title] = paragraphs
+                                        remember_paragraphs({section_title: paragraphs})
                                             
                                         st.info(f"Found {len(paragraphs)} relevant paragraphs")
                                         
-                                        # Initialize selected_para_ids if not exists
-                                        if section_title not in st.session_state.synthesis_selected:
-                                            st.session_state.synthesis_selected[section_title] = []
-                                        
-                                        # Display paragraphs with selection
-                                        for para in paragraphs:
-                                            para_id = para.get("id", "")
-                                            is_selected = para_id in st.session_state.synthesis_selected[section_title]
-                                            
-                                            # Build label with scores
-                                            label_parts = [f"**{para.get('filename', 'Unknown')}**"]
-                                            label_parts.append(f"Page {para.get('page_number', '?')}")
-                                            
-                                            # Show LLM relevance score if available
-                                            if para.get('llm_relevance_score'):
-                                                label_parts.append(f"LLM Relevance: {para.get('llm_relevance_score', 0):.2f}")
-                                            else:
-                                                label_parts.append(f"Vector Score: {para.get('score', 0):.3f}")
-                                            
-                                            checkbox_key = f"para_{section_title}_{para_id}"
-                                            selected = st.checkbox(
-                                                " | ".join(label_parts),
-                                                value=is_selected,
-                                                key=checkbox_key
-                                            )
-                                            
-                                            # Update state directly based on checkbox value
-                                            if selected and para_id not in st.session_state.synthesis_selected[section_title]:
-                                                st.session_state.synthesis_selected[section_title].append(para_id)
-                                            elif not selected and para_id in st.session_state.synthesis_selected[section_title]:
-                                                st.session_state.synthesis_selected[section_title].remove(para_id)
-                                            
-                                            with st.container():
-                                                # Get section level for indentation
-                                                section_level = section.get("level", 1)
-                                                indent = "  " * (section_level - 1)  # 2 spaces per level
-                                                
-                                                # Show full paragraph content
-                                                st.markdown(f"{indent}*{para.get('content', '')}*")
-                                                st.divider()
-                                        
-                                        # Show info after processing all checkboxes
-                                        selected_count = len(st.session_state.synthesis_selected[section_title])
-                                        st.info(f"{len(paragraphs)} paragraphs found, {selected_count} selected")
+                                        render_paragraph_selector(section_title, paragraphs, "found")
                                     
                             # Show already loaded paragraphs
                             elif section_title in st.session_state.synthesis_paragraphs:
                                 paragraphs = st.session_state.synthesis_paragraphs[section_title]
                                 
-                                # Initialize selected_para_ids if not exists
-                                if section_title not in st.session_state.synthesis_selected:
-                                    st.session_state.synthesis_selected[section_title] = []
-                                
-                                # Display paragraphs with selection
-                                for para in paragraphs:
-                                    para_id = para.get("id", "")
-                                    is_selected = para_id in st.session_state.synthesis_selected[section_title]
-                                    
-                                    # Build label with scores
-                                    label_parts = [f"**{para.get('filename', 'Unknown')}**"]
-                                    label_parts.append(f"Page {para.get('page_number', '?')}")
-                                    
-                                    # Show LLM relevance score if available
-                                    if para.get('llm_relevance_score'):
-                                        label_parts.append(f"LLM Relevance: {para.get('llm_relevance_score', 0):.2f}")
-                                    else:
-                                        label_parts.append(f"Vector Score: {para.get('score', 0):.3f}")
-                                    
-                                    checkbox_key = f"para_{section_title}_{para_id}_loaded"
-                                    selected = st.checkbox(
-                                        " | ".join(label_parts),
-                                        value=is_selected,
-                                        key=checkbox_key
-                                    )
-                                    
-                                    # Update state directly based on checkbox value
-                                    if selected and para_id not in st.session_state.synthesis_selected[section_title]:
-                                        st.session_state.synthesis_selected[section_title].append(para_id)
-                                    elif not selected and para_id in st.session_state.synthesis_selected[section_title]:
-                                        st.session_state.synthesis_selected[section_title].remove(para_id)
-                                    
-                                    with st.container():
-                                        # Get section level for indentation
-                                        section_level = section.get("level", 1)
-                                        indent = "  " * (section_level - 1)  # 2 spaces per level
-                                        
-                                        # Show full paragraph content
-                                        st.markdown(f"{indent}*{para.get('content', '')}*")
-                                        st.divider()
-                                
-                                # Show info after processing all checkboxes
-                                selected_count = len(st.session_state.synthesis_selected[section_title])
-                                st.info(f"{len(paragraphs)} paragraphs loaded, {selected_count} selected")
+                                render_paragraph_selector(section_title, paragraphs, "loaded", key_suffix="_loaded")
                     
                     # Save selections
                     if st.button("💾 Save Paragraph Selections", type="primary", use_container_width=True):
@@ -588,29 +815,35 @@ def main():
                     st.subheader("Step 5: Generate Synthesis Document")
                     
                     if st.button("📝 Generate Final Document", type="primary", use_container_width=True):
-                        with st.spinner("Generating synthesis document... This may take a while."):
+                        with st.spinner("Generating synthesis document... This may take a while.", show_time=True):
                             result = make_api_request(
                                 "POST",
-                                f"/synthesis/sessions/{st.session_state.synthesis_session_id}/generate-document"
+                                f"/synthesis/sessions/{st.session_state.synthesis_session_id}/generate-document",
+                                params={"include_document": False}
                             )
                             
                             if result and result.get("success"):
-                                document_base64 = result.get("document_base64", "")
-                                filename = result.get("filename", "synthesis_document.docx")
-                                st.session_state.synthesis_document = document_base64
-                                st.session_state.synthesis_filename = filename
-                                st.success("✅ Document generated successfully!")
+                                doc_bytes = fetch_document(st.session_state.synthesis_session_id)
+                                if doc_bytes is None and result.get("document_base64"):
+                                    # Servers without include_document still inline the file
+                                    doc_bytes = base64.b64decode(result["document_base64"])
                                 
-                                # Download button for DOCX
-                                import base64
-                                if document_base64:
-                                    doc_bytes = base64.b64decode(document_base64)
-                                    st.download_button(
-                                        label="📥 Download DOCX Document",
-                                        data=doc_bytes,
-                                        file_name=filename,
-                                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                                    )
+                                if doc_bytes is not None:
+                                    # Only the latest document is kept, per session
+                                    st.session_state.synthesis_document_bytes = doc_bytes
+                                    st.session_state.synthesis_filename = result.get("filename", "synthesis_document.docx")
+                                    st.success("✅ Document generated successfully!")
+                                else:
+                                    st.error("Document was generated but could not be downloaded")
+                    
+                    # Download button for DOCX, kept across reruns
+                    if st.session_state.get("synthesis_document_bytes"):
+                        st.download_button(
+                            label="📥 Download DOCX Document",
+                            data=st.session_state.synthesis_document_bytes,
+                            file_name=st.session_state.synthesis_filename,
+                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                        )
     
     # Footer
     st.divider()